@@ -1,17 +1,36 @@
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
-from rdflib import Graph
 
-from dq.assess import RDFDataQualityAssessment
+from dq.assessment_registry import assessment_names, opt_in_assessment_names
 from dq.defined_namespaces import DirectoryStructure
-from dq.scoring_manager import ScoringManager
-from dq.usecase_manager import UseCaseManager
+from dq.ingest import expand_input_paths, load_graph
+from dq.input_cache import InputCache
+from dq.instrumentation import StageTimer
+from dq.outlier_reference import DEFAULT_CONTAMINATION
 
 __version__ = "0.0.1"
 
 
+# A scheme or prefix, a colon and at least one character that may appear in an IRI
+PREDICATE_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:[^\s<>"{}|\\^`]+$')
+
+
+def predicate_argument(predicate: str) -> str:
+    if not PREDICATE_PATTERN.match(predicate):
+        raise argparse.ArgumentTypeError(f"'{predicate}' is neither an IRI nor a CURIE")
+    return predicate
+
+
+def contamination_argument(value: str) -> float:
+    contamination = float(value)
+    if not 0 < contamination <= 0.5:
+        raise argparse.ArgumentTypeError(f"contamination must be in (0, 0.5], got {value}")
+    return contamination
+
+
 def cli(args=None):
     parser = argparse.ArgumentParser(
         prog="dq",
@@ -35,10 +54,129 @@ def cli(args=None):
     parser.add_argument(
         "--data-to-assess",
         type=Path,
-        help="The ABIS-compliant RDF file, or an RDFLib graph object, to assess",
+        nargs="+",
+        help="The ABIS-compliant RDF file(s) to assess; several files, or a directory of .ttl files, are parsed in "
+             "parallel and assessed as one graph",
         required=False  # Make this argument optional
     )
 
+    parser.add_argument(
+        "--no-cache",
+        help="Always parse the input files instead of reusing a previously parsed copy from the input cache",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes used to parse several input files, and of workers running independent assessments "
+             "concurrently (defaults to the number of CPUs)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=assessment_names(),
+        metavar="ASSESSMENT",
+        help="Run only these assessments",
+        default=None
+    )
+
+    parser.add_argument(
+        "--skip",
+        nargs="+",
+        choices=assessment_names(),
+        metavar="ASSESSMENT",
+        help="Do not run these assessments",
+        default=None
+    )
+
+    parser.add_argument(
+        "--include",
+        nargs="+",
+        choices=opt_in_assessment_names(),
+        metavar="ASSESSMENT",
+        help="Also run these opt-in assessments, which are left out by default because they are slow (e.g. "
+             "scientific_name_correction, which fuzzy-matches every invalid name against APNI)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--profile",
+        help="Dump cProfile stats for every stage into the report directory's profile/ folder and record peak "
+             "Python memory per stage; assessments then run on a single worker",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--fit-outlier-reference",
+        help="Fit the coordinate and date outlier models on the data to assess and save them as a new outlier "
+             "reference version",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--outlier-reference",
+        type=int,
+        nargs="?",
+        const=0,
+        help="Score outliers against a saved outlier reference instead of fitting on the data to assess; takes a "
+             "version number, or the latest version when given without one",
+        default=None
+    )
+
+    parser.add_argument(
+        "--contamination",
+        type=contamination_argument,
+        help="Expected share of outliers, in (0, 0.5], the coordinate isolation forest and robust covariance models "
+             "label when fitted on the data to assess or saved with --fit-outlier-reference",
+        default=DEFAULT_CONTAMINATION
+    )
+
+    parser.add_argument(
+        "--normalize-datum",
+        help="Transform every coordinate from its datum (AGD84, GDA94, GDA2020) to WGS84 before the spatial "
+             "assessments, using only transformations available offline",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--location-decimals",
+        type=int,
+        help="Round coordinates to this many decimal places before classifying them by Australian state, so nearby "
+             "points are classified once; by default only identical coordinates are",
+        default=None
+    )
+
+    parser.add_argument(
+        "--silhouette-sample-size",
+        type=int,
+        help="Score the date k-means clusterings on a sample of this many observations, stratified so every cluster "
+             "keeps a member; by default every observation is scored",
+        default=None
+    )
+
+    parser.add_argument(
+        "--duplicate-predicates",
+        nargs="+",
+        type=predicate_argument,
+        metavar="PREDICATE",
+        help="Predicates, as IRIs or CURIEs with a prefix bound in the input (e.g. sosa:hasResult), whose value "
+             "combination marks observation table records as duplicates; the duplicate assessment only runs when "
+             "given",
+        default=None
+    )
+
+    parser.add_argument(
+        "--observation-id-pattern",
+        nargs="+",
+        metavar="REGEX",
+        help="Regular expressions, each with one capturing group, mapping the record URIs of other data providers to "
+             "their observation id; tried before the built-in createme.org patterns",
+        default=None
+    )
+
     return parser.parse_args(args)
 
 
@@ -59,70 +197,126 @@ def main(args=None):
 
     print("Running BDR-DQ...")
 
+    # The assessment modules pull in pandas, scikit-learn and the geospatial stack, so they are only imported once
+    # there is data to assess; `--version` and `--help` stay fast
+    from dq.assess import RDFDataQualityAssessment
+    from dq.duplicate_detector import predicate_ref
+    from dq.observation_id import default_extractor
+    from dq.outlier_reference import OutlierReferenceStore
+    from dq.results_writer import ResultsWriter
+    from dq.scoring_manager import ScoringManager
+    from dq.usecase_manager import UseCaseManager
+
     directory_structure = DirectoryStructure()
 
     report_txt_file = os.path.join(directory_structure.report_base_path,
                                    'Report.txt')
+    profile = getattr(args, 'profile', False)
+    stage_timer = StageTimer(os.path.join(directory_structure.report_base_path, 'profile') if profile else None,
+                             trace_memory=profile)
+    # cProfile only sees the thread it runs on, so profiled runs assess on a single worker
+    assessment_workers = 1 if profile else getattr(args, 'workers', None)
+
     input_data_to_assess = args.data_to_assess
-    is_chunk = False
-    if is_chunk:
-        # new function
-        combined_graph = Graph()
+    input_cache = None if getattr(args, 'no_cache', False) else InputCache()
+    with stage_timer.stage('load_input'):
+        if isinstance(input_data_to_assess, (list, tuple)):
+            input_files = expand_input_paths(input_data_to_assess)
+            if len(input_files) == 1:
+                input_data_to_assess = input_files[0]
+            else:
+                print('Combining the input files...')
+                workers = getattr(args, 'workers', None)
+                if input_cache is not None:
+                    input_data_to_assess = input_cache.load(input_files, lambda: load_graph(input_files, workers))
+                else:
+                    input_data_to_assess = load_graph(input_files, workers)
 
-        # Load each TTL file into separate RDF graphs and merge them
-        ttl_files = ['chunk_1.ttl', 'chunk_2.ttl', 'chunk_3.ttl', 'chunk_4.ttl']
-        print('Combining the chunk files...')
-        for ttl_file in ttl_files:
-            graph = Graph()
-            ttl_file_path = os.path.join(directory_structure.input_base_path, ttl_file)
-            print(ttl_file_path)
-            graph.parse(ttl_file_path, format='ttl')
-            combined_graph += graph
+        print(input_data_to_assess)
+        input_graph = RDFDataQualityAssessment.load_data(input_data_to_assess, input_cache)
 
-        # Save the combined graph into a TTL file
-        combined_ttl_file_path = os.path.join(directory_structure.input_base_path, 'combined_graph.ttl')
-        combined_graph.serialize(destination=combined_ttl_file_path, format='turtle')
+    outlier_reference = None
+    outlier_reference_version = getattr(args, 'outlier_reference', None)
+    if outlier_reference_version is not None:
+        outlier_reference = OutlierReferenceStore().load(outlier_reference_version or None)
+        print(f"Scoring outliers against outlier reference version {outlier_reference.metadata.get('version')}")
 
-        combined_graph = Graph()
-        combined_graph.parse(combined_ttl_file_path, format='turtle')
+    observation_id_patterns = getattr(args, 'observation_id_pattern', None)
+    observation_id_extractor = default_extractor.with_patterns(observation_id_patterns) \
+        if observation_id_patterns else default_extractor
 
-        input_data_to_assess = combined_graph
+    duplicate_predicates = getattr(args, 'duplicate_predicates', None)
+    if duplicate_predicates:
+        duplicate_predicates = [predicate_ref(predicate, input_graph.namespace_manager)
+                                for predicate in duplicate_predicates]
 
-    print(input_data_to_assess)
+    result_filename = os.path.join(directory_structure.result_base_path, "Results.ttl")
 
-    with open(report_txt_file, "w") as report_file:
-        dq_assessment = RDFDataQualityAssessment(input_data_to_assess, report_file)
-        result_filename = os.path.join(dq_assessment.directory_structure.result_base_path, "Results.ttl")
+    with open(report_txt_file, "w") as report_file, ResultsWriter(result_filename) as results_writer:
+        dq_assessment = RDFDataQualityAssessment(input_graph, report_file,
+                                                 duplicate_predicates_to_check=duplicate_predicates,
+                                                 results_writer=results_writer,
+                                                 outlier_reference=outlier_reference, stage_timer=stage_timer,
+                                                 observation_id_extractor=observation_id_extractor,
+                                                 normalize_datums=getattr(args, 'normalize_datum', False),
+                                                 location_decimals=getattr(args, 'location_decimals', None),
+                                                 silhouette_sample_size=getattr(args, 'silhouette_sample_size', None),
+                                                 contamination=getattr(args, 'contamination', DEFAULT_CONTAMINATION))
+        if getattr(args, 'fit_outlier_reference', False):
+            with stage_timer.stage('fit_outlier_reference'):
+                version = OutlierReferenceStore().save(dq_assessment.fit_outlier_reference())
+            print(f"Saved outlier reference version {version}")
+        # Results.ttl holds the input data followed by the assessment results streamed out as they are produced
+        with stage_timer.stage('write_input_to_results'):
+            results_writer.add_graph(dq_assessment.g)
 
-        all_labels = dq_assessment.vocab_manager.create_excel_template(
-            os.path.join(dq_assessment.directory_structure.template_base_path, 'usecase_template.xlsx'))
-        print("All Labels:", all_labels)
+        with stage_timer.stage('report_analysis'):
+            all_labels = dq_assessment.vocab_manager.create_excel_template(
+                os.path.join(dq_assessment.directory_structure.template_base_path, 'usecase_template.xlsx'))
+            print("All Labels:", all_labels)
 
-        dq_assessment.report_analysis.generate_report()
+            dq_assessment.report_analysis.generate_report()
 
-        dq_assessment.assessments()
+        with stage_timer.stage('assessments') as record:
+            dq_assessment.assessments(getattr(args, 'only', None), getattr(args, 'skip', None),
+                                      max_workers=assessment_workers, include=getattr(args, 'include', None))
 
-        dq_assessment.g.serialize(destination=result_filename, format="turtle")
+            results_writer.close()
+            record.observations = len(dq_assessment.result_matrix)
         use_case_definition_file = os.path.join(dq_assessment.directory_structure.use_case_base_path,
                                                 'usecase_definition.xlsx')
         scoring_definition_file = os.path.join(dq_assessment.directory_structure.scoring_base_path,
                                                'assertions_score_weighting_definition.xlsx')
         output_result_file = os.path.join(dq_assessment.directory_structure.result_base_path,
                                           'Final_Usecase_Results.ttl')
-        dq_assessment.result_matrix_df = dq_assessment.result_matrix_df.sort_values(by='observation_id', ascending=True)
-        dq_assessment.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
-                                                             'output1.xlsx'), sheet_name="matrix", index=None)
-
-        use_case_manager = UseCaseManager(use_case_definition_file, dq_assessment.result_matrix_df, result_filename,
-                                          output_result_file, report_file)
-        use_case_manager.assess_use_cases()
-        use_case_manager.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
-                                                                'output2.xlsx'), sheet_name="matrix", index=None)
-        scoring_manager = ScoringManager(scoring_definition_file, dq_assessment.result_matrix_df, output_result_file,
-                                         output_result_file, report_file)
-        scoring_manager.apply_scoring_methods()
-        scoring_manager.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
-                                                               'output3.xlsx'), sheet_name="matrix", index=None)
+        observation_count = len(dq_assessment.result_matrix)
+        with stage_timer.stage('write_result_matrix', observation_count):
+            dq_assessment.result_matrix_df = dq_assessment.result_matrix_df.sort_values(by='observation_id',
+                                                                                        ascending=True)
+            dq_assessment.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
+                                                                 'output1.xlsx'), sheet_name="matrix", index=None)
+
+        with stage_timer.stage('use_cases', observation_count):
+            use_case_manager = UseCaseManager(use_case_definition_file, dq_assessment.result_matrix_df,
+                                              result_filename, output_result_file, report_file)
+            use_case_manager.assess_use_cases()
+        with stage_timer.stage('write_use_case_matrix', observation_count):
+            use_case_manager.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
+                                                                    'output2.xlsx'), sheet_name="matrix", index=None)
+        with stage_timer.stage('scoring', observation_count):
+            scoring_manager = ScoringManager(scoring_definition_file, dq_assessment.result_matrix_df,
+                                             output_result_file, output_result_file, report_file)
+            scoring_manager.apply_scoring_methods()
+        with stage_timer.stage('write_scoring_matrix', observation_count):
+            scoring_manager.result_matrix_df.to_excel(os.path.join(dq_assessment.directory_structure.result_base_path,
+                                                                   'output3.xlsx'), sheet_name="matrix", index=None)
+
+        dq_assessment.memo.write_report(report_file)
+        dq_assessment.location_stats.write_report(report_file)
+        if dq_assessment.duplicate_detector is not None:
+            dq_assessment.duplicate_detector.write_report(report_file)
+        stage_timer.write_report(report_file)
+    stage_timer.write_json(os.path.join(directory_structure.report_base_path, 'timings.json'))
 
     print("Complete")
 
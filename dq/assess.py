@@ -1,44 +1,91 @@
 import datetime
 import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from typing import Union
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
-from collections import defaultdict
 
-from rdflib import Graph, URIRef, Literal, BNode
+from rdflib import Graph, URIRef, Literal
 from rdflib.namespace import NamespaceManager, SOSA, TIME, GEO, SDO, XSD, RDF, RDFS
-from shapely.geometry import Point
-from sklearn.cluster import KMeans
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import silhouette_score
-from sklearn.covariance import EllipticEnvelope
-
-from .defined_namespaces import DQAF, TERN, DirectoryStructure
+
+from .assessment_registry import select_assessments
+from .assessment_scheduler import AssessmentScheduler
+from .clustering import ckmeans, silhouette_score_1d
+from .coordinate_strings import coordinate_string_labels, decimal_parts, has_repeated_block, precision_labels
+from .datum_resolver import DATUM_NAMES, DatumResolver, load_epsg_table
+from .datum_transform import DatumTransformer
+from .defined_namespaces import TERN, DirectoryStructure
+from .distinct_values import DistinctValueMemo
+from .duplicate_detector import DuplicateDetector, value_digest
+from .input_cache import InputCache
+from .instrumentation import StageTimer
+from .locations import LocationStats, factorize_locations
+from .nsl_name_index import NSLNameIndex
+from .nsl_name_matcher import NSLNameMatcher
+from .observation_frame import ObservationFrame, POINT_PATTERN, split_point
+from .observation_id import ObservationIdExtractor, default_extractor
 from .report_analysis import ReportAnalysis
-from .usecase_manager import UseCaseManager
+from .outlier_reference import DEFAULT_CONTAMINATION, OutlierReference
+from .result_matrix import ResultMatrix
+from .results_writer import ResultsWriter
 from .vocab_manager import VocabManager
 
 
 class RDFDataQualityAssessment:
-    def __init__(self, g: Union[Path, Graph], report_file=None, duplicate_predicates_to_check=None):
+    def __init__(self, g: Union[Path, Graph], report_file=None, duplicate_predicates_to_check=None,
+                 input_cache: Optional[InputCache] = None, results_writer: Optional[ResultsWriter] = None,
+                 outlier_reference: Optional[OutlierReference] = None, stage_timer: Optional[StageTimer] = None,
+                 observation_id_extractor: Optional[ObservationIdExtractor] = None, normalize_datums: bool = False,
+                 location_decimals: Optional[int] = None, silhouette_sample_size: Optional[int] = None,
+                 contamination: float = DEFAULT_CONTAMINATION):
         self.directory_structure = DirectoryStructure()
         self.report_file = report_file
-        self.g = self.load_data(g)
+        self.g = self.load_data(g, input_cache)
+        self.results_writer = results_writer if results_writer is not None else ResultsWriter()
         self.vocab_manager = VocabManager()
-        self.geo_checker = AustraliaGeographyChecker()
+        self._geo_checker = None
         self.report_analysis = ReportAnalysis(self.g, report_file)
         self.datum_checker = DatumChecker()
+        self.name_checker = ScientificNameChecker()
         self.vocab_manager.bind_custom_namespaces(self.g)
         self.duplicate_predicates_to_check = duplicate_predicates_to_check
+        # Set by assess_duplicate, with the sizes of the duplicate groups for the report
+        self.duplicate_detector = None
+        # Maps the subject of every result to the observation id of its result matrix row
+        self.observation_id_extractor = observation_id_extractor if observation_id_extractor is not None \
+            else default_extractor
         columns = ['observation_id'] + self.vocab_manager.get_all_labels()
-        self.result_matrix_df = pd.DataFrame(columns=columns)
+        self.result_matrix = ResultMatrix(columns)
+        self._result_matrix_df = None
+        self._observation_frame = None
+        self._coordinate_string_labels = None
+        self._datum_labels = None
+        # Transform every coordinate from its datum to WGS84 before the spatial assessments compare them
+        self.normalize_datums = normalize_datums
+        self._normalized_coordinates = None
+        self.datum_transformer = DatumTransformer()
+        # Spatial checks run once per distinct location; the state classification may first round coordinates to
+        # location_decimals places so nearby points share a location
+        self.location_decimals = location_decimals
+        self.location_stats = LocationStats()
+        # Per-value checks evaluated once per distinct value, with their hit rates for the report
+        self.memo = DistinctValueMemo()
+        # Number of observations the date k-means silhouette is computed on; None scores every observation
+        self.silhouette_sample_size = silhouette_sample_size
+        # Fitted models and statistics to score against instead of fitting on the assessed data itself
+        self.outlier_reference = outlier_reference
+        # Share of coordinates the isolation forest and robust covariance models fitted on this data label as outliers
+        self.contamination = contamination
+        # Set by AssessmentScheduler: a process pool for model fits, and the per-thread output of the running assessment
+        self.process_executor = None
+        # Records the time, CPU and memory each assessment takes
+        self.stage_timer = stage_timer if stage_timer is not None else StageTimer()
+        self._local = threading.local()
         self.data_type = {
             'time': {
                 'name': SOSA.phenomenonTime,
@@ -48,15 +95,139 @@ class RDFDataQualityAssessment:
         }
 
     @staticmethod
-    def load_data(path_or_graph: Union[Path, Graph]) -> Graph:
+    def load_data(path_or_graph: Union[Path, Graph], input_cache: Optional[InputCache] = None) -> Graph:
         if isinstance(path_or_graph, Path):
+            if input_cache is not None:
+                return input_cache.load([path_or_graph],
+                                        lambda: Graph().parse(source=str(path_or_graph), format='ttl'))
             return Graph().parse(source=str(path_or_graph), format='ttl')
         elif isinstance(path_or_graph, Graph):
             return path_or_graph
         else:
             raise ValueError("Input must be either a Path object pointing to a Turtle file or an RDFlib Graph")
 
-    def assessments(self):
+    @property
+    def result_matrix_df(self) -> pd.DataFrame:
+        """
+        The observation x assessment-label matrix, materialised from the accumulated results on first access and
+        again only after new results have been recorded.
+        """
+        if self._result_matrix_df is None:
+            self._result_matrix_df = self.result_matrix.to_dataframe()
+        return self._result_matrix_df
+
+    @result_matrix_df.setter
+    def result_matrix_df(self, df: pd.DataFrame):
+        self._result_matrix_df = df
+
+    @property
+    def geo_checker(self):
+        """
+        The state boundary checker, loaded on first use so assessments that do not need the shapefiles never pay for
+        them.
+        """
+        if self._geo_checker is None:
+            self._geo_checker = AustraliaGeographyChecker()
+        return self._geo_checker
+
+    @property
+    def observation_frame(self) -> pd.DataFrame:
+        """
+        The Observation -> Sample -> Sampling table of the input graph, extracted on first access and shared by all
+        assessments.
+        """
+        if self._observation_frame is None:
+            self._observation_frame = ObservationFrame(self.g).extract()
+        return self._observation_frame
+
+    def _procedure_rows(self) -> pd.DataFrame:
+        frame = self.observation_frame
+        return frame[frame['procedure'].notna()]
+
+    def _geometry_rows(self) -> pd.DataFrame:
+        frame = self.observation_frame
+        return frame[frame['procedure'].notna() & frame['geometry'].notna()]
+
+    @property
+    def coordinate_string_labels(self):
+        """
+        The coordinate_precision, coordinate_completeness and coordinate_unusual labels of every geometry row, computed
+        together from the coordinate strings on first access.
+        """
+        if self._coordinate_string_labels is None:
+            geometry_rows = self._geometry_rows()
+            self._coordinate_string_labels = coordinate_string_labels(geometry_rows['longitude_text'],
+                                                                      geometry_rows['latitude_text'])
+        return self._coordinate_string_labels
+
+    @property
+    def datum_labels(self):
+        """
+        The datum of every geometry row and its datum_completeness, datum_validation and datum_type labels, resolved
+        together on first access.
+        """
+        if self._datum_labels is None:
+            self._datum_labels = DatumResolver(self.datum_checker, self.memo).labels(self._geometry_rows()['geometry'])
+        return self._datum_labels
+
+    @property
+    def normalized_coordinates(self):
+        """
+        The longitude and latitude of every geometry row transformed from the CRS its WKT declares to WGS84, one
+        batched transform per CRS, computed on first access.
+        """
+        if self._normalized_coordinates is None:
+            geometry_rows = self._geometry_rows()
+            self._normalized_coordinates = self.datum_transformer.transform(
+                geometry_rows['longitude'], geometry_rows['latitude'], self.datum_labels['epsg_code'],
+                self.location_stats)
+        return self._normalized_coordinates
+
+    def _coordinate_rows(self) -> pd.DataFrame:
+        geometry_rows = self._geometry_rows()
+        if self.normalize_datums:
+            longitudes, latitudes = self.normalized_coordinates
+            geometry_rows = geometry_rows.assign(longitude=longitudes, latitude=latitudes)
+        return geometry_rows[geometry_rows['longitude'].notna() & geometry_rows['latitude'].notna()]
+
+    def _dated_observations(self):
+        """
+        (observation, date) pairs for every observation with a date, as gYear integers or date ordinals.
+        """
+        observations = self.observation_frame.drop_duplicates('observation')
+        dated_observations = []
+        for row in observations.itertuples(index=False):
+            if pd.isna(row.observation_date):
+                continue
+            date_literal = Literal(row.observation_date, datatype=row.observation_date_datatype)
+            if date_literal.datatype in [XSD.dateTime, XSD.dateTimeStamp]:
+                # Convert date to ordinal value
+                dated_observations.append((row.observation, datetime.fromisoformat(date_literal).date().toordinal()))
+            elif date_literal.datatype in [XSD.gYear]:
+                dated_observations.append((row.observation, int(date_literal)))
+        return dated_observations
+
+    def fit_outlier_reference(self, contamination: Optional[float] = None) -> OutlierReference:
+        """
+        Fit the coordinate outlier models and the coordinate and date statistics on this graph, to be saved and used
+        as the reference for later submissions. contamination defaults to the assessment's.
+        """
+        coordinates = self._coordinate_rows()[['latitude', 'longitude']].to_numpy()
+        dates = np.array([observation_date for _, observation_date in self._dated_observations()])
+        return OutlierReference.fit(coordinates, dates,
+                                    contamination=contamination if contamination is not None else self.contamination)
+
+    def _scientific_name_rows(self):
+        frame = self.observation_frame
+        names = frame[frame['scientific_name'].notna()].drop_duplicates('result')
+        return zip(names['result'], names['scientific_name'])
+
+    def assessments(self, only=None, skip=None, max_workers=1, include=None):
+        """
+        Run the registered assessments (see assessment_registry.ASSESSMENTS), optionally restricted to the names in
+        only and without the names in skip, on up to max_workers workers. Opt-in assessments only run when named in
+        only or include.
+        """
 
         # Add custom labels definition to the new graph and save it into new file name
         self.vocab_manager.create_output_definition_file(
@@ -64,29 +235,7 @@ class RDFDataQualityAssessment:
 
         self.vocab_manager.bind_custom_namespaces(self.g)
 
-        if self.duplicate_predicates_to_check:
-            self.assess_duplicate_value_combination(self.duplicate_predicates_to_check)
-
-        self.assess_geo_spatial_accuracy_precision()
-
-        self.assess_coordinate_precision()
-        self.assess_coordinate_completeness()
-        self.assess_coordinate_unusual()
-        self.assess_coordinate_in_australia_state()
-        self.assess_coordinate_outlier_irq()
-        self.assess_coordinate_outlier_isolation_forest()
-        self.assess_coordinate_outlier_robust_covariance()
-        self.assess_coordinate_outlier_zscore()
-        self.assess_date_recency()
-        self.assess_date_format_validation()
-        self.assess_date_completeness()
-        self.assess_date_outlier_kmeans()
-        self.assess_date_outlier_irq()
-        self.assess_scientific_name_completeness()
-        self.assess_scientific_name_validation()
-        self.assess_datum_completeness()
-        self.assess_datum_type()
-        self.assess_datum_validation()
+        return AssessmentScheduler(self, max_workers).run(select_assessments(only, skip, include))
 
     def assess_date_completeness(self):
         assessment_name = "date_completeness"
@@ -94,20 +243,17 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for s, _, o in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, ot in self.g.triples((s, TIME.hasTime, None)):
-                date_is_not_empty = False
-                for _, _, date_literal in self.g.triples((ot, TIME.inXSDgYear, None)):
-                    if DateChecker.is_date_not_empty(date_literal):
-                        date_is_not_empty = True
-                    break  # Assuming only one date per observation; remove if multiple dates need assessment
+        observations = self.observation_frame.drop_duplicates('observation')
+        observations = observations[observations['observation_has_time']]
+        for row in observations.itertuples(index=False):
+            date_is_not_empty = DateChecker.is_date_not_empty(row.observation_date)
 
-                result_label = "non_empty" if date_is_not_empty else "empty"
-                result_counts[result_label] += 1
-                total_assessments += 1
+            result_label = "non_empty" if date_is_not_empty else "empty"
+            result_counts[result_label] += 1
+            total_assessments += 1
 
-                self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+            self._add_assessment_result(row.observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(row.observation, assessment_name, result_label)
 
         self.add_to_report('Assess Date Completeness', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -117,27 +263,20 @@ class RDFDataQualityAssessment:
 
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, observation_time in self.g.triples((procedure, TIME.hasTime, None)):
-                            date_within_range = False
-                            for _, _, date_literal in self.g.triples((observation_time, TIME.inXSDgYear, None)):
-                                if DateChecker.is_date_recent(date_literal):
-                                    date_within_range = True
-                                break  # Assuming only one date per observation; remove if multiple dates need assessment
-
-                            result_label = "recent_20_years" if date_within_range else "outdated_20_years"
-                            result_counts[result_label] += 1
-                            total_assessments += 1
-
-                            self._add_assessment_result(procedure, assess_namespace, namespace[result_label])
-                            self._add_assessment_result_to_matrix(procedure, assessment_name, result_label, "date",
-                                                                  str(date_literal))
+        procedures = self._procedure_rows()
+        timed_procedures = procedures[procedures['has_time']]
+        dates_within_range = self.memo.map('DateChecker.is_date_recent', DateChecker.is_date_value_recent,
+                                           zip(timed_procedures['date'], timed_procedures['date_datatype']))
+        for row, date_within_range in zip(timed_procedures.itertuples(index=False), dates_within_range):
+            result_label = "recent_20_years" if date_within_range else "outdated_20_years"
+            result_counts[result_label] += 1
+            total_assessments += 1
 
-                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+            self._add_assessment_result(row.procedure, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(row.procedure, assessment_name, result_label, "date", row.date)
+
+            self._add_assessment_result(row.observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(row.observation, assessment_name, result_label)
 
         self.add_to_report('Assess Date Recency', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -168,7 +307,8 @@ class RDFDataQualityAssessment:
 
     def assess_duplicate(self, predicates):
         """
-        Assess duplicate value combinations across all subjects based on specified predicates.
+        Assess duplicate value combinations across the nodes of the observation table (observations, samples,
+        samplings and results) based on specified predicates.
 
         :param predicates: A list of predicates (as URIRefs) to check for duplicate value combinations.
         :return: assessment_name, total_assessments, result_counts
@@ -179,34 +319,43 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        # Dictionary to track combinations of values
-        value_combinations = defaultdict(list)
-
-        # Iterate through all subjects in the RDF graph
-        for subject in self.g.subjects():
-            values = []
-
-            # Collect values for specified predicates
-            for predicate in predicates:
-                obj = next(self.g.objects(subject, predicate), None)
-                values.append(str(obj) if obj else None)
-
-            # Only consider value tuples where all fields are present (i.e., none of them are None)
-            if None not in values:
-                value_tuple = tuple(values)
-                value_combinations[value_tuple].append(subject)
+        # Every node of the observation table once, streamed into the detector as the 64-bit digest of its value
+        # tuple; a record is the node's column and row in the table, so only (digest, record) pairs are kept
+        frame = self.observation_frame
+        columns = ('observation', 'sample', 'procedure', 'result')
+        # The first value of every subject per predicate, from one pass over the predicate's triples
+        objects_by_predicate = []
+        for predicate in predicates:
+            objects = {}
+            for subject, obj in self.g.subject_objects(predicate):
+                objects.setdefault(subject, obj)
+            objects_by_predicate.append(objects)
+        detector = DuplicateDetector()
+        for column_number, column in enumerate(columns):
+            nodes = frame[column]
+            for row in np.flatnonzero(nodes.notna().to_numpy() & ~nodes.duplicated().to_numpy()):
+                values = []
+                for objects in objects_by_predicate:
+                    obj = objects.get(nodes.iat[row])
+                    values.append(str(obj) if obj else None)
+
+                # Only consider value tuples where all fields are present (i.e., none of them are None)
+                if None not in values:
+                    detector.add(value_digest(values), column_number * len(frame) + row)
 
         # Identify duplicates and mark them
-        for value_tuple, subjects in value_combinations.items():
-            if len(subjects) > 1:
-                result_label = "inferred_duplicate"
-                result_counts[result_label] += len(subjects)
-                total_assessments += len(subjects)
-
-                # Mark each duplicate subject in the RDF graph
-                for subject in subjects:
-                    self._add_assessment_result(subject, assess_namespace, namespace[result_label])
-                    self._add_assessment_result_to_matrix(subject, assessment_name, result_label)
+        for group in detector.groups():
+            result_label = "inferred_duplicate"
+            result_counts[result_label] += len(group)
+            total_assessments += len(group)
+
+            # Mark each duplicate subject in the RDF graph
+            for record in group:
+                column_number, row = divmod(int(record), len(frame))
+                subject = frame[columns[column_number]].iat[row]
+                self._add_assessment_result(subject, assess_namespace, namespace[result_label])
+                self._add_assessment_result_to_matrix(subject, assessment_name, result_label)
+        self.duplicate_detector = detector
 
         # Add to report
         self.add_to_report('Assess Duplicate Value ', total_assessments, result_counts)
@@ -224,22 +373,19 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        geometry_node = next(self.g.objects(procedure, GEO.hasMetricSpatialAccuracy), None)
-                        if geometry_node is None or float(geometry_node) > 10000:
-                            result_label = "low_precision"
-                        else:
-                            result_label = "high_precision"
-                    # Increment counters and mark assessment results in RDF graph
-                    result_counts[result_label] += 1
-                    total_assessments += 1
-
-                    # Mark assessment result for the subject
-                    self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                    self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        samples = self._procedure_rows().drop_duplicates(['observation', 'sample'], keep='last')
+        for row in samples.itertuples(index=False):
+            if pd.isna(row.accuracy) or float(row.accuracy) > 10000:
+                result_label = "low_precision"
+            else:
+                result_label = "high_precision"
+            # Increment counters and mark assessment results in RDF graph
+            result_counts[result_label] += 1
+            total_assessments += 1
+
+            # Mark assessment result for the subject
+            self._add_assessment_result(row.observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(row.observation, assessment_name, result_label)
 
         # Add to report
         self.add_to_report('Assess Geo Spatial Accuracy Precision', total_assessments, result_counts)
@@ -251,21 +397,13 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                datum_is_empty = self.datum_checker.is_not_empty(str(geometry))
-                                result_label = "not_empty" if datum_is_empty else "empty"
+        geometry_rows = self._geometry_rows()
+        for observation, result_label in zip(geometry_rows['observation'], self.datum_labels['datum_completeness']):
+            result_counts[result_label] += 1
+            total_assessments += 1
 
-                                result_counts[result_label] += 1
-                                total_assessments += 1
-
-                                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report('Assess Datum Completeness', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -276,21 +414,12 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                epsg_link = self.datum_checker.extract_epsg_link(str(geometry))
-                                datum_metadata = self.datum_checker.get_datum_metadata(epsg_link)
-                                result_label = "valid" if datum_metadata else "invalid"
-
-                                result_counts[result_label] += 1
-                                total_assessments += 1
-                                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        geometry_rows = self._geometry_rows()
+        for observation, result_label in zip(geometry_rows['observation'], self.datum_labels['datum_validation']):
+            result_counts[result_label] += 1
+            total_assessments += 1
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report('Assess Datum Validation', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -300,27 +429,26 @@ class RDFDataQualityAssessment:
 
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                epsg_link = self.datum_checker.extract_epsg_link(str(geometry))
-                                datum_metadata = self.datum_checker.get_datum_metadata(epsg_link)
-
-                                result_label = datum_metadata["name"] if datum_metadata else "None"
-
-                                result_counts[result_label] += 1
-                                total_assessments += 1
+        geometry_rows = self._geometry_rows()
+        for observation, result_label in zip(geometry_rows['observation'], self.datum_labels['datum_type']):
+            result_counts[result_label] += 1
+            total_assessments += 1
 
-                                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report('Assess Datum Type', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
 
+    @staticmethod
+    def _has_comment(comments: pd.Series, rel_comment) -> np.ndarray:
+        """
+        For every tuple of rdfs:comments in an observation table column, whether one of them contains rel_comment, as
+        has_relevant_comment checks a node.
+        """
+        return np.fromiter((any(rel_comment in comment for comment in node_comments) for node_comments in comments),
+                           dtype=bool, count=len(comments))
+
     def has_relevant_comment(self, s, rel_comment):
         found_relevant_comment = False
         for _, _, comment in self.g.triples((s, RDFS.comment, None)):
@@ -335,22 +463,15 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                result_label, longitude, latitude = GeoChecker.extract_and_assess_coordinate_precision(
-                                    geometry)
-
-                                if result_label:
-                                    result_counts[result_label] += 1
-                                    total_assessments += 1
-                                    self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-
-                                    self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        geometry_rows = self._geometry_rows()
+        for observation, result_label in zip(geometry_rows['observation'],
+                                             self.coordinate_string_labels['coordinate_precision']):
+            if result_label:
+                result_counts[result_label] += 1
+                total_assessments += 1
+                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+
+                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report('Assess Coordinate Precision', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -361,26 +482,21 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                result_label = GeoChecker.check_geometry_completeness(geometry)
-                                result_counts[result_label] += 1
-
-                                total_assessments += 1
-                                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                else:
-                                    long, lat = 0, 0
-                                geometry_point = str(long) + ', ' + str(lat)
-                                self._add_assessment_result_to_matrix(observation, assessment_name, result_label,
-                                                                      "location", geometry_point)
+        geometry_rows = self._geometry_rows()
+        for row, result_label in zip(geometry_rows.itertuples(index=False),
+                                     self.coordinate_string_labels['coordinate_completeness']):
+            observation = row.observation
+            result_counts[result_label] += 1
+
+            total_assessments += 1
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+            if result_label == "non_empty":
+                long, lat = row.longitude, row.latitude
+            else:
+                long, lat = 0, 0
+            geometry_point = str(long) + ', ' + str(lat)
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label,
+                                                  "location", geometry_point)
 
         self.add_to_report(f'Assess Coordinate Completeness', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -390,56 +506,27 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        observation_dates = []
-        date_type_test = False
-
-        for s, _, o in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, ot in self.g.triples((s, TIME.hasTime, None)):
-                for _, _, date_literal in self.g.triples((ot, TIME.inXSDgYear, None)):
-                    if date_literal.datatype in [XSD.dateTime, XSD.dateTimeStamp]:
-                        datetime_obj = datetime.fromisoformat(date_literal)
-                        observation_dates.append(datetime_obj.date())
-                        date_type_test = True
-                    else:
-                        if date_literal.datatype in [XSD.gYear]:
-                            datetime_obj = int(date_literal)
-                            observation_dates.append(datetime_obj)
-
-        if date_type_test:
-            observation_dates = np.array(
-                [date.toordinal() for date in observation_dates])
+        dated_observations = self._dated_observations()
+
+        if not dated_observations:
+            print("No valid dates found.")
+            return
+
+        observation_dates = np.array([observation_date for _, observation_date in dated_observations])
+        if self.outlier_reference is not None and self.outlier_reference.date_quartiles is not None:
+            Q1, Q3 = self.outlier_reference.date_quartiles
         else:
-            observation_dates = np.array(
-                [date for date in observation_dates])
-        Q1 = np.percentile(observation_dates, 25)
-        Q3 = np.percentile(observation_dates, 75)
+            Q1, Q3 = np.percentile(observation_dates, [25, 75])
         IQR = Q3 - Q1
+        is_outlier = (observation_dates < Q1 - 1.5 * IQR) | (observation_dates > Q3 + 1.5 * IQR)
+
+        for (s, _), outlier in zip(dated_observations, is_outlier):
+            result_label = "outlier_date" if outlier else "normal_date"
+            result_counts[result_label] += 1
 
-        for s, _, o in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, ot in self.g.triples((s, TIME.hasTime, None)):
-                for _, _, date_literal in self.g.triples((ot, TIME.inXSDgYear, None)):
-                    if date_literal.datatype in [XSD.dateTime, XSD.dateTimeStamp]:
-                        datetime_obj = datetime.fromisoformat(date_literal)
-                        observation_date = datetime_obj.date().toordinal()  # Convert date to ordinal value
-                        is_outlier = observation_date < Q1 - 1.5 * IQR or observation_date > Q3 + 1.5 * IQR
-                        result_label = "outlier_date" if is_outlier else "normal_date"
-                        result_counts[result_label] += 1
-
-                        total_assessments += 1
-                        self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                        self._add_assessment_result_to_matrix(s, assessment_name, result_label)
-                    else:
-                        if date_literal.datatype in [XSD.gYear]:
-                            datetime_obj = int(date_literal)
-                            observation_date = datetime_obj
-
-                            is_outlier = observation_date < Q1 - 1.5 * IQR or observation_date > Q3 + 1.5 * IQR
-                            result_label = "outlier_date" if is_outlier else "normal_date"
-                            result_counts[result_label] += 1
-
-                            total_assessments += 1
-                            self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+            total_assessments += 1
+            self._add_assessment_result(s, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
 
         self.add_to_report(f'Assess Date Outlier IRQ', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -449,78 +536,47 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        observation_dates = []
+        procedures = self._procedure_rows()
+        year_rows = procedures[procedures['date_datatype'] == XSD.gYear]
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, observation_time in self.g.triples((procedure, TIME.hasTime, None)):
-                            for _, _, date_literal in self.g.triples((observation_time, TIME.inXSDgYear, None)):
-                                if date_literal.datatype in [XSD.gYear]:
-                                    datetime_obj = int(date_literal)
-                                    observation_dates.append(datetime_obj)
-
-        if observation_dates:
-            base_date = min(observation_dates)
-            numeric_dates = np.array([(date - base_date) for date in observation_dates]).reshape(-1, 1)
-
-            scaler = MinMaxScaler()
-            scaled_dates = scaler.fit_transform(numeric_dates)
+        years = np.array([int(date_literal) for date_literal in year_rows['date']])
+
+        if len(years):
+            # Cluster the distinct years weighted by their counts; 1-D k-means and its silhouette only need the
+            # sorted values, so this stays cheap however many observations share a year
+            distinct_years, year_counts = np.unique(years, return_counts=True)
 
             best_k = 2
             best_score = -1
 
-            if len(np.unique(scaled_dates)) > 1:
-                for k in range(2, min(len(scaled_dates), 10)):
-                    kmeans = KMeans(n_clusters=k, random_state=42, verbose=1)
-                    labels = kmeans.fit_predict(scaled_dates)
-                    if len(set(labels)) > 1:
-                        score = silhouette_score(scaled_dates, labels)
-                        if score > best_score:
-                            best_k = k
-                            best_score = score
-                    else:
-                        break  # Break the loop if only one cluster has been formed
+            if len(distinct_years) > 1:
+                for k in range(2, min(len(years), 10)):
+                    if k > len(distinct_years):
+                        break  # Break the loop if no further cluster can be formed
+                    labels = ckmeans(distinct_years, k, year_counts)
+                    try:
+                        score = silhouette_score_1d(distinct_years, labels, year_counts,
+                                                    sample_size=self.silhouette_sample_size)
+                    except ValueError:
+                        continue  # Too few observations in the sample to score this k
+                    if score > best_score:
+                        best_k = k
+                        best_score = score
 
             print('Best K for kmeans as the number of clusters is ', best_k)
 
-            kmeans = KMeans(n_clusters=best_k, random_state=42, verbose=1)
-            kmeans.fit(scaled_dates)
-            labels = kmeans.labels_
+            distinct_labels = ckmeans(distinct_years, best_k, year_counts)
+            labels = distinct_labels[np.searchsorted(distinct_years, years)]
 
             outlier_cluster = np.argmin(np.bincount(labels))
-            outliers_indices = [i for i, label in enumerate(labels) if label == outlier_cluster]
-
-            # Initialize a new index counter for consistent access in outliers_indices
-            index_counter = 0
-
-            for observation in self.g.subjects(RDF.type, TERN.Observation):
-                for sample in self.g.objects(observation, SOSA.hasFeatureOfInterest):
-                    if (sample, RDF.type, TERN.Sample) in self.g:
-                        for procedure in self.g.objects(sample, SOSA.isResultOf):
-                            for observation_time in self.g.objects(procedure, TIME.hasTime):
-                                for date_literal in self.g.objects(observation_time, TIME.inXSDgYear):
-                                    # Check if the date is a valid datetime object and proceed
-                                    if date_literal.datatype == XSD.gYear:
-                                        try:
-                                            year = int(str(date_literal))
-                                            date = datetime(year, 1, 1)  # Assume January 1st of that year
-                                            if index_counter in outliers_indices:
-                                                result_label = "outlier_date"
-                                            else:
-                                                result_label = "normal_date"
-
-                                            result_counts[result_label] += 1
-                                            self._add_assessment_result(observation, assess_namespace,
-                                                                        namespace[result_label])
-                                            self._add_assessment_result_to_matrix(observation, assessment_name,
-                                                                                  result_label)
-
-                                            index_counter += 1
-                                        except ValueError:
-                                            index_counter += 1
-                                            continue  # Skip invalid or incorrectly formatted date literals
+            is_outlier = labels == outlier_cluster
+
+            for observation, outlier in zip(year_rows['observation'], is_outlier):
+                result_label = "outlier_date" if outlier else "normal_date"
+
+                result_counts[result_label] += 1
+                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
             self.add_to_report(f'Assess Date Outlier Kmeans', total_assessments, result_counts)
             return assessment_name, total_assessments, result_counts
@@ -531,24 +587,40 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
+        # Field samplings are walked in the graph rather than read from the observation table: observations usually
+        # reach them only through a specimen sample and its sampling (sosa:isSampleOf), a chain the table does not
+        # follow, so most field samplings have no row in it
+        subjects, geometries, lats, longs = [], [], [], []
         for s, _, o in self.g.triples((None, GEO.hasGeometry, None)):
             if self.has_relevant_comment(s, "field-sampling"):
                 geometry = next(self.g.objects(o, GEO.asWKT), None)
 
                 if geometry:
-                    match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
+                    match = POINT_PATTERN.search(str(geometry))
                     if match:
                         long, lat = map(float, match.groups())
-                        in_australia, state_name = self.geo_checker.is_point_in_australia_state(lat, long)
-                        result_label = state_name if in_australia else "Outside_Australia"
+                        subjects.append(s)
+                        geometries.append(str(geometry))
+                        lats.append(lat)
+                        longs.append(long)
+
+        if self.normalize_datums:
+            # Every point transformed to WGS84 from the CRS its own WKT declares
+            epsg_codes = DatumResolver(self.datum_checker, self.memo).epsg_column(geometries)
+            longs, lats = self.datum_transformer.transform(longs, lats, epsg_codes, self.location_stats)
+
+        location_codes, location_longs, location_lats = factorize_locations(longs, lats, self.location_decimals)
+        self.location_stats.record(assessment_name, len(subjects), len(location_longs))
+        location_labels = self.geo_checker.classify_points(location_lats, location_longs)
 
-                        result_counts[result_label] += 1
+        for s, result_label in zip(subjects, location_labels[location_codes]):
+            result_counts[result_label] += 1
 
-                        total_assessments += 1
-                        result_label_uri = namespace[result_label.replace(' ', '_')]
+            total_assessments += 1
+            result_label_uri = namespace[result_label]
 
-                        self._add_assessment_result(s, assess_namespace, result_label_uri)
-                        self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+            self._add_assessment_result(s, assess_namespace, result_label_uri)
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
 
         self.add_to_report(f'Assess Coordinate in Australia State', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -578,19 +650,25 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for s, _, o in self.g.triples((None, self.data_type['time']['name'], None)):
-            if self.has_relevant_comment(s, self.data_type['time']['relevant_comment']):
-                found_date_within_range = False
-                for _, _, date_literal in self.g.triples((o, TIME.inXSDDateTimeStamp, None)):
-                    date_str = str(date_literal)
-                    date_check = DateChecker(date_str[:10])
-                    is_valid_date, detected_format = date_check.check_date_format_and_validate()
-                    result_label = "valid" if is_valid_date else "invalid"
-                    result_counts[result_label] += 1
-                    total_assessments += 1
-
-                    self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                    self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+        # The phenomenonTime timestamps of the name match observations
+        observations = self.observation_frame.drop_duplicates('observation')
+        observations = observations[self._has_comment(observations['observation_comments'],
+                                                      self.data_type['time']['relevant_comment'])]
+        subjects, dates = [], []
+        for observation, timestamps in zip(observations['observation'], observations['observation_timestamps']):
+            for timestamp in timestamps:
+                subjects.append(observation)
+                dates.append(timestamp[:10])
+
+        valid_dates = self.memo.map('DateChecker.check_date_format_and_validate',
+                                    lambda date: DateChecker(date).check_date_format_and_validate()[0], dates)
+        for s, is_valid_date in zip(subjects, valid_dates):
+            result_label = "valid" if is_valid_date else "invalid"
+            result_counts[result_label] += 1
+            total_assessments += 1
+
+            self._add_assessment_result(s, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
 
         self.add_to_report(f'Assess Date Format Validation', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -601,19 +679,13 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                result_label = GeoChecker.unusual_check(geometry)
-
-                                result_counts[result_label] += 1
-                                total_assessments += 1
-                                self._add_assessment_result(observation, assess_namespace, namespace[result_label])
-                                self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        geometry_rows = self._geometry_rows()
+        for observation, result_label in zip(geometry_rows['observation'],
+                                             self.coordinate_string_labels['coordinate_unusual']):
+            result_counts[result_label] += 1
+            total_assessments += 1
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report('Assess Coordinate Unusual', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -624,71 +696,45 @@ class RDFDataQualityAssessment:
         Attempts to detect unusual numbers by looking for repeating patterns in the decimal part.
         This is a heuristic approach and may not accurately detect all repeating patterns.
         """
-        decimal_part = number_str.split('.')[-1] if '.' in number_str else ''
-        for length in range(1, len(decimal_part)):
-            for start in range(len(decimal_part) - length):
-                pattern = decimal_part[start:start + length]
-                remainder = decimal_part[start + length:]
-                if remainder.startswith(pattern):
-                    return 'unusual'
-        return 'usual'
+        return 'unusual' if has_repeated_block(decimal_parts([number_str]))[0] else 'usual'
 
     def assess_coordinate_outlier_zscore(self):
         assessment_name = "coordinate_outlier_zscore"
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        latitudes = []
-        longitudes = []
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    latitudes.append(lat)
-                                    longitudes.append(long)
-
-        if not latitudes or not longitudes:
+        coordinate_rows = self._coordinate_rows()
+        latitudes = coordinate_rows['latitude'].to_numpy()
+        longitudes = coordinate_rows['longitude'].to_numpy()
+
+        if not len(latitudes) or not len(longitudes):
             print("No valid geographic points found.")
             return
 
-        if len(latitudes) < 2 or len(longitudes) < 2:
+        if self.outlier_reference is None and (len(latitudes) < 2 or len(longitudes) < 2):
             print("Insufficient data for outlier analysis.")
             return
 
-        try:
+        if self.outlier_reference is not None:
+            lat_mean, lat_std = self.outlier_reference.coordinate_moments['latitude']
+            long_mean, long_std = self.outlier_reference.coordinate_moments['longitude']
+        else:
             lat_mean, lat_std = np.mean(latitudes), np.std(latitudes)
             long_mean, long_std = np.mean(longitudes), np.std(longitudes)
-        except RuntimeWarning:
-            print("Error calculating statistics.")
-            return
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    lat_z = (lat - lat_mean) / lat_std
-                                    long_z = (long - long_mean) / long_std
-                                    is_outlier = abs(lat_z) > 3 or abs(long_z) > 3
-                                    result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
-
-                                    total_assessments += 1
-                                    result_counts[result_label] += 1
-
-                                    self._add_assessment_result(observation, assess_namespace,
-                                                                namespace[result_label.lower()])
-                                    self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lat_z = (latitudes - lat_mean) / lat_std
+            long_z = (longitudes - long_mean) / long_std
+        is_outlier = (np.abs(lat_z) > 3) | (np.abs(long_z) > 3)
+
+        for observation, outlier in zip(coordinate_rows['observation'], is_outlier):
+            result_label = "outlier_coordinate" if outlier else "normal_coordinate"
+
+            total_assessments += 1
+            result_counts[result_label] += 1
+
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label.lower()])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report(f'Assess Coordinate Outlier Zscore', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -699,55 +745,39 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        latitudes = []
-        longitudes = []
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    latitudes.append(lat)
-                                    longitudes.append(long)
-
-        if not latitudes or not longitudes:
+        coordinate_rows = self._coordinate_rows()
+        latitudes = coordinate_rows['latitude'].to_numpy()
+        longitudes = coordinate_rows['longitude'].to_numpy()
+
+        if not len(latitudes) or not len(longitudes):
             print("No valid geographic points found.")
             return
 
-        if len(latitudes) < 4 or len(longitudes) < 4:
+        if self.outlier_reference is None and (len(latitudes) < 4 or len(longitudes) < 4):
             print("Insufficient data for outlier analysis.")
             return
 
-        lat_q1, lat_q3 = np.percentile(latitudes, [25, 75])
-        long_q1, long_q3 = np.percentile(longitudes, [25, 75])
+        if self.outlier_reference is not None:
+            lat_q1, lat_q3 = self.outlier_reference.coordinate_quartiles['latitude']
+            long_q1, long_q3 = self.outlier_reference.coordinate_quartiles['longitude']
+        else:
+            lat_q1, lat_q3 = np.percentile(latitudes, [25, 75])
+            long_q1, long_q3 = np.percentile(longitudes, [25, 75])
         lat_iqr = lat_q3 - lat_q1
         long_iqr = long_q3 - long_q1
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    lat_outlier = lat < lat_q1 - 1.5 * lat_iqr or lat > lat_q3 + 1.5 * lat_iqr
-                                    long_outlier = long < long_q1 - 1.5 * long_iqr or long > long_q3 + 1.5 * long_iqr
-                                    is_outlier = lat_outlier or long_outlier
-                                    result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
-
-                                    total_assessments += 1
-                                    result_counts[result_label] += 1
-
-                                    self._add_assessment_result(observation, assess_namespace,
-                                                                namespace[result_label.lower()])
-                                    self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+        lat_outlier = (latitudes < lat_q1 - 1.5 * lat_iqr) | (latitudes > lat_q3 + 1.5 * lat_iqr)
+        long_outlier = (longitudes < long_q1 - 1.5 * long_iqr) | (longitudes > long_q3 + 1.5 * long_iqr)
+        is_outlier = lat_outlier | long_outlier
+
+        for observation, outlier in zip(coordinate_rows['observation'], is_outlier):
+            result_label = "outlier_coordinate" if outlier else "normal_coordinate"
+
+            total_assessments += 1
+            result_counts[result_label] += 1
+
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label.lower()])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report(f'Assess Coordinate Outlier IRQ', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -758,53 +788,32 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        coordinates = []
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    coordinates.append([lat, long])
-
-        if not coordinates:
+        coordinate_rows = self._coordinate_rows()
+        coordinates = coordinate_rows[['latitude', 'longitude']].to_numpy()
+
+        if not len(coordinates):
             print("No valid geographic points found.")
             return
 
-        if len(coordinates) < 4:
+        if self.outlier_reference is None and len(coordinates) < 4:
             print("Insufficient data for outlier analysis.")
             return
 
-        clf = IsolationForest(contamination=0.1, random_state=42, verbose=1)
+        if self.outlier_reference is None:
+            outlier_predictions = self._fit_predict(fit_predict_isolation_forest, coordinates)
+        else:
+            outlier_predictions = self._predict_per_location(self.outlier_reference.isolation_forest, coordinates,
+                                                             assessment_name)
 
-        clf.fit(coordinates)
+        for observation, prediction in zip(coordinate_rows['observation'], outlier_predictions):
+            is_outlier = prediction == -1
+            result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
 
-        outlier_predictions = clf.predict(coordinates)
+            total_assessments += 1
+            result_counts[result_label] += 1
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    coordinate = [lat, long]
-                                    is_outlier = outlier_predictions[coordinates.index(coordinate)] == -1
-                                    result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
-
-                                    total_assessments += 1
-                                    result_counts[result_label] += 1
-
-                                    self._add_assessment_result(observation, assess_namespace,
-                                                                namespace[result_label.lower()])
-                                    self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label.lower()])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report(f'Assess Coordinate Outlier Isolation Forest', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -815,57 +824,32 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        coordinates = []
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    coordinates.append([lat, long])
-
-        if not coordinates:
+        coordinate_rows = self._coordinate_rows()
+        coordinates = coordinate_rows[['latitude', 'longitude']].to_numpy()
+
+        if not len(coordinates):
             print("No valid geographic points found.")
             return
 
-        if len(coordinates) < 4:
+        if self.outlier_reference is None and len(coordinates) < 4:
             print("Insufficient data for outlier analysis.")
             return
 
-        coordinates = np.array(coordinates)
+        if self.outlier_reference is None:
+            outlier_predictions = self._fit_predict(fit_predict_robust_covariance, coordinates)
+        else:
+            outlier_predictions = self._predict_per_location(self.outlier_reference.robust_covariance, coordinates,
+                                                             assessment_name)
 
-        cov_estimator = EllipticEnvelope(contamination=0.1, random_state=42)
-        cov_estimator.fit(coordinates)
+        for observation, prediction in zip(coordinate_rows['observation'], outlier_predictions):
+            is_outlier = prediction == -1
+            result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
 
-        outlier_predictions = cov_estimator.predict(coordinates)
+            total_assessments += 1
+            result_counts[result_label] += 1
 
-        for observation, _, _ in self.g.triples((None, RDF.type, TERN.Observation)):
-            for _, _, sample in self.g.triples((observation, SOSA.hasFeatureOfInterest, None)):
-                if (sample, RDF.type, TERN.Sample) in self.g:
-                    for _, _, procedure in self.g.triples((sample, SOSA.isResultOf, None)):
-                        for _, _, geometry_node in self.g.triples((procedure, GEO.hasGeometry, None)):
-                            geometry = next(self.g.objects(geometry_node, GEO.asWKT), None)
-                            if geometry:
-                                match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-                                if match:
-                                    long, lat = map(float, match.groups())
-                                    coordinate = [lat, long]
-                                    coordinate_index = np.where((coordinates == coordinate).all(axis=1))[0]
-                                    if len(coordinate_index) > 0:
-                                        is_outlier = outlier_predictions[coordinate_index[0]] == -1
-                                        result_label = "outlier_coordinate" if is_outlier else "normal_coordinate"
-
-                                        total_assessments += 1
-                                        result_counts[result_label] += 1
-
-                                        self._add_assessment_result(observation, assess_namespace,
-                                                                    namespace[result_label.lower()])
-                                        self._add_assessment_result_to_matrix(observation, assessment_name,
-                                                                              result_label)
+            self._add_assessment_result(observation, assess_namespace, namespace[result_label.lower()])
+            self._add_assessment_result_to_matrix(observation, assessment_name, result_label)
 
         self.add_to_report(f'Assess Coordinate Outlier Robust Covariance', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -875,21 +859,19 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for s, p, o in self.g.triples((None, RDF.value, None)):
+        for s, o in self._scientific_name_rows():
+            scientific_name = str(o).strip()
 
-            if (s, RDF.type, TERN.FeatureOfInterest) in self.g:
-                scientific_name = str(o).strip()
+            if scientific_name is None or str(scientific_name).strip() == "":
+                result_label = "empty_name"
+            else:
+                result_label = "non_empty_name"
 
-                if scientific_name is None or str(scientific_name).strip() == "":
-                    result_label = "empty_name"
-                else:
-                    result_label = "non_empty_name"
+            result_counts[result_label] += 1
+            total_assessments += 1
 
-                result_counts[result_label] += 1
-                total_assessments += 1
-
-                self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+            self._add_assessment_result(s, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
 
         self.add_to_report('Assess Scientific Name Completeness', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
@@ -899,79 +881,102 @@ class RDFDataQualityAssessment:
         namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
             assessment_name)
 
-        for s, p, o in self.g.triples((None, RDF.value, None)):
-            if (s, RDF.type, TERN.FeatureOfInterest) in self.g:
-                scientific_name = str(o).strip()
+        rows = [(s, str(o).strip()) for s, o in self._scientific_name_rows()]
+        # Names repeat across observations, so each distinct name is looked up once
+        valid_names = self.name_checker.validate_names(scientific_name for _, scientific_name in rows)
 
-                if scientific_name and ScientificNameChecker.is_valid_scientific_name(scientific_name):
-                    result_label = "valid_name"
-                else:
-                    result_label = "invalid_name"
+        for s, scientific_name in rows:
+            if valid_names[scientific_name]:
+                result_label = "valid_name"
+            else:
+                result_label = "invalid_name"
 
-                total_assessments += 1
-                result_counts[result_label] += 1
-                self._add_assessment_result(s, assess_namespace, namespace[result_label])
-                self._add_assessment_result_to_matrix(s, assessment_name, result_label)
+            total_assessments += 1
+            result_counts[result_label] += 1
+            self._add_assessment_result(s, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label)
 
         self.add_to_report('Assess Scientific Name Validation', total_assessments, result_counts)
         return assessment_name, total_assessments, result_counts
 
-    def _add_assessment_result(self, subject, assessment_type, value, assessment_date=None):
-        result_bn = BNode()
-        self.g.add((subject, DQAF.hasDQAFResult, result_bn))
+    def assess_scientific_name_correction(self):
+        assessment_name = "scientific_name_correction"
+        namespace, assess_namespace, result_counts, total_assessments = self.vocab_manager.init_assessment(
+            assessment_name)
+
+        rows = [(s, str(o).strip()) for s, o in self._scientific_name_rows()]
+        valid_names = self.name_checker.validate_names(scientific_name for _, scientific_name in rows)
+        invalid_rows = [(s, scientific_name) for s, scientific_name in rows if not valid_names[scientific_name]]
+        suggestions = self.name_checker.suggest_corrections(
+            [scientific_name for _, scientific_name in invalid_rows if scientific_name], self.process_executor)
+
+        for s, scientific_name in invalid_rows:
+            suggestion = suggestions.get(scientific_name)
+            result_label = "suggested_correction" if suggestion else "no_suggestion"
+
+            total_assessments += 1
+            result_counts[result_label] += 1
+            self._add_assessment_result(s, assess_namespace, namespace[result_label])
+            self._add_assessment_result_to_matrix(s, assessment_name, result_label,
+                                                  f"{assessment_name}:suggested_name", suggestion)
+
+        self.add_to_report('Assess Scientific Name Correction', total_assessments, result_counts)
+        return assessment_name, total_assessments, result_counts
+
+    def _predict_per_location(self, model, coordinates, assessment_name):
+        """
+        model's prediction for every (latitude, longitude) row of coordinates, predicted once per distinct location.
+        """
+        location_codes, location_longitudes, location_latitudes = factorize_locations(coordinates[:, 1],
+                                                                                      coordinates[:, 0])
+        self.location_stats.record(assessment_name, len(coordinates), len(location_longitudes))
+        return model.predict(np.column_stack([location_latitudes, location_longitudes]))[location_codes]
+
+    def _fit_predict(self, fit_predict, coordinates):
+        """
+        Run a model fit in the scheduler's process pool when there is one, so it does not hold the GIL against the
+        assessments running on other threads.
+        """
+        if self.process_executor is not None:
+            return self.process_executor.submit(fit_predict, coordinates, self.contamination).result()
+        return fit_predict(coordinates, self.contamination)
 
-        self.g.add((result_bn, SOSA.observedProperty, assessment_type))
+    def _output(self):
+        return getattr(self._local, 'output', None)
 
-        if isinstance(value, URIRef):
-            self.g.add((result_bn, SDO.value, value))
-        elif isinstance(value, str):
+    def _add_assessment_result(self, subject, assessment_type, value, assessment_date=None):
+        if isinstance(value, str) and not isinstance(value, URIRef):
             prefixed_name = self.__uri_to_prefixed_name(value)
-            uri_value = self.__prefixed_name_to_uri(prefixed_name)
-            self.g.add((result_bn, SDO.value, uri_value))
-        else:
-            self.g.add((result_bn, SDO.value, Literal(value)))
+            value = self.__prefixed_name_to_uri(prefixed_name)
+        elif not isinstance(value, URIRef):
+            value = Literal(value)
         if assessment_date is None:
             assessment_date = datetime.now()
         elif isinstance(assessment_date, datetime.date) and not isinstance(assessment_date, datetime.datetime):
             assessment_date = datetime.datetime.combine(assessment_date, datetime.time.min)
 
-        self.g.add((result_bn, SOSA.resultTime, Literal(assessment_date, datatype=XSD.dateTime)))
+        output = self._output()
+        if output is not None:
+            output.results.append((subject, assessment_type, value, assessment_date))
+            return
+        self.results_writer.add_result(subject, assessment_type, value, assessment_date)
 
     def _add_assessment_result_to_matrix(self, subject, assessment_name, label, extra_field=None, extra_value=None):
-        observation_id = UseCaseManager.extract_record_number(subject)
-        field_name = assessment_name + ":" + label
-
-        if 'observation_id' in self.result_matrix_df.columns and \
-                any(self.result_matrix_df['observation_id'] == observation_id):
-            row_index = self.result_matrix_df[self.result_matrix_df['observation_id'] == observation_id].index
-            if field_name not in self.result_matrix_df.columns:
-                self.result_matrix_df[field_name] = pd.NA
-            self.result_matrix_df.loc[row_index, field_name] = 1
-            if extra_field is not None and extra_value is not None:
-                if extra_field not in self.result_matrix_df.columns:
-                    self.result_matrix_df[extra_field] = pd.NA
-                self.result_matrix_df.loc[row_index, extra_field] = extra_value
-        else:
-            new_row = {'observation_id': observation_id, field_name: 1}
-            if extra_field is not None and extra_value is not None:
-                new_row[extra_field] = extra_value
-            self.result_matrix_df.loc[len(self.result_matrix_df)] = new_row
-
-    def _add_assessment_result_to_matrix_old(self, subject, assessment_name, label, extra_field=None, extra_value=None):
-        observation_id = UseCaseManager.extract_record_number(subject)
+        output = self._output()
+        if output is not None:
+            output.matrix_entries.append((subject, assessment_name, label, extra_field, extra_value))
+            return
+        observation_id = self.observation_id_extractor(subject)
         field_name = assessment_name + ":" + label
 
-        if 'observation_id' in self.result_matrix_df.columns and \
-                any(self.result_matrix_df['observation_id'] == observation_id):
-            row_index = self.result_matrix_df[self.result_matrix_df['observation_id'] == observation_id].index
-            if field_name not in self.result_matrix_df.columns:
-                self.result_matrix_df[field_name] = pd.NA
-            self.result_matrix_df.loc[row_index, field_name] = 1
-        else:
-            new_row = {'observation_id': observation_id, field_name: 1}
-            self.result_matrix_df.loc[len(self.result_matrix_df)] = new_row
+        self.result_matrix.add(observation_id, field_name, extra_field, extra_value)
+        self._result_matrix_df = None
 
     def add_to_report(self, assessment_name, total_assessments, result_counts):
+        output = self._output()
+        if output is not None:
+            output.report_sections.append((assessment_name, total_assessments, result_counts))
+            return
         if self.report_file:
             print(f'', file=self.report_file)
             print(f'- {assessment_name}: {total_assessments}', file=self.report_file)
@@ -979,6 +984,25 @@ class RDFDataQualityAssessment:
                 print(f'\t{quality}: {count}', file=self.report_file)
 
 
+def fit_predict_isolation_forest(coordinates, contamination=DEFAULT_CONTAMINATION):
+    from sklearn.ensemble import IsolationForest
+
+    clf = IsolationForest(contamination=contamination, random_state=42, verbose=1)
+
+    clf.fit(coordinates)
+
+    return clf.predict(coordinates)
+
+
+def fit_predict_robust_covariance(coordinates, contamination=DEFAULT_CONTAMINATION):
+    from sklearn.covariance import EllipticEnvelope
+
+    cov_estimator = EllipticEnvelope(contamination=contamination, random_state=42)
+    cov_estimator.fit(coordinates)
+
+    return cov_estimator.predict(coordinates)
+
+
 class DateChecker:
     def __init__(self, data, date_format="%Y-%m-%d"):
         self.data = data
@@ -999,6 +1023,14 @@ class DateChecker:
 
         return False
 
+    @staticmethod
+    def is_date_value_recent(date_value, years_back=20):
+        """
+        is_date_recent for a (lexical date, datatype) pair; False when there is no date.
+        """
+        date, datatype = date_value
+        return pd.notna(date) and DateChecker.is_date_recent(Literal(date, datatype=datatype), years_back)
+
     @staticmethod
     def is_date_not_empty(date):
         if date is None:
@@ -1037,14 +1069,10 @@ class DateChecker:
 
 
 class DatumChecker:
-    def __init__(self):
-        self.valid_datums = {"AGD84", "GDA2020", "GDA94", "WGS84"}
-        self.datum_metadata = {
-            4348: {"name": "AGD84", "description": "Australian Geodetic Datum 1984"},
-            7843: {"name": "GDA2020", "description": "Geocentric Datum of Australia 2020"},
-            4283: {"name": "GDA94", "description": "Geocentric Datum of Australia 1994"},
-            4326: {"name": "WGS84", "description": "World Geodetic System 1984"},
-        }
+    def __init__(self, epsg_table: Optional[str] = None):
+        self.valid_datums = set(DATUM_NAMES)
+        # EPSG code -> datum metadata, from dq/datum/epsg_datums.csv unless another table is given
+        self.datum_metadata = load_epsg_table(epsg_table)
 
     def is_not_empty(self, datum):
         if datum is None:
@@ -1057,13 +1085,17 @@ class DatumChecker:
         return datum in self.valid_datums
 
     def get_datum_metadata(self, link: str) -> Optional[dict]:
+        epsg_code = self.epsg_code(link)
+        return self.datum_metadata.get(epsg_code) if epsg_code is not None else None
+
+    @staticmethod
+    def epsg_code(link: str) -> Optional[int]:
         # Define a regular expression pattern to match the EPSG link format
         patterns = [r"http://www.opengis.net/def/crs/EPSG/9.9.1/(\d+)", r"http://www.opengis.net/def/crs/EPSG/0/(\d+)"]
 
         for pattern in patterns:
             if re.match(pattern, link):
-                epsg_code = int(link.split("/")[-1])
-                return self.datum_metadata.get(epsg_code)
+                return int(link.split("/")[-1])
         return None
 
     def get_datum_metadata_from_asWKT(self, graph, uri):
@@ -1076,6 +1108,20 @@ class DatumChecker:
 
         return None
 
+    @staticmethod
+    def epsg_link_key(wkt_string: str) -> str:
+        """
+        The part of wkt_string extract_epsg_link depends on: its first <IRI>, or '' when it has none. Geometries share
+        few CRS IRIs, so this is the value to evaluate extract_epsg_link once per.
+        """
+        start = wkt_string.find('<')
+        end = wkt_string.find('>', start + 2) if start >= 0 else -1
+        if end < 0:
+            return ''
+        if '\n' in wkt_string[start:end]:
+            return wkt_string
+        return wkt_string[start:end + 1]
+
     def extract_epsg_link(self, wkt_string: str) -> Optional[str]:
         match = re.search(r"<(.+?)>", wkt_string)
         if match:
@@ -1095,57 +1141,23 @@ class GeoChecker:
 
     @staticmethod
     def assess_coordinate_precision(longitude, latitude):
-        def assess_quality(decimal_length):
-            if decimal_length > 4:
-                return "High"
-            elif 2 <= decimal_length <= 4:
-                return "Medium"
-            else:
-                return "Low"
-
-        lat_precision = len(latitude.split('.')[-1]) if '.' in latitude else 0
-        long_precision = len(longitude.split('.')[-1]) if '.' in longitude else 0
-
-        lat_quality = assess_quality(lat_precision)
-        long_quality = assess_quality(long_precision)
-
-        if lat_quality == "Low" or long_quality == "Low":
-            return "Low"
-        elif lat_quality == "Medium" or long_quality == "Medium":
-            return "Medium"
-        else:
-            return "High"
+        longitude_places, latitude_places = decimal_parts([longitude, latitude]).str.len()
+        return precision_labels(longitude_places, latitude_places).item()
 
     @staticmethod
     def extract_and_assess_coordinate_precision(geometry: object) -> object:
-        match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-        if match:
-            longitude, latitude = match.groups()
+        longitude, latitude = split_point(str(geometry))
+        if longitude is not None:
             return GeoChecker.assess_coordinate_precision(longitude, latitude), longitude, latitude
         return None
 
     @staticmethod
     def unusual_check(geometry):
-        match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-        if match:
-            longitude, latitude = match.groups()
-            lon_unusual = RDFDataQualityAssessment.detect_unusual_numbers(longitude) == 'unusual'
-            lat_unusual = RDFDataQualityAssessment.detect_unusual_numbers(latitude) == 'unusual'
-            if lon_unusual or lat_unusual:
-                result_label = "unusual"
-            else:
-                result_label = "usual"
-        else:
-            result_label = "usual"
-        return result_label
+        return coordinate_string_labels(*zip(split_point(str(geometry))))['coordinate_unusual'][0]
 
     @staticmethod
     def check_geometry_completeness(geometry):
-        match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
-        if match:
-            return "non_empty"
-        else:
-            return "empty"
+        return coordinate_string_labels(*zip(split_point(str(geometry))))['coordinate_completeness'][0]
 
 
 class AustraliaGeographyChecker:
@@ -1167,34 +1179,77 @@ class AustraliaGeographyChecker:
                                                          "cstauscd_r.shp")
         }
 
-        self.states_data = {
-            state_name: gpd.read_file(shapefile).to_crs(epsg=4326)
-            for state_name, shapefile in self.states_shapefiles.items()
-        }
+        import shapely
+        from .state_boundary_store import StateBoundaryStore
 
-    def is_point_in_australia_state(self, lat, long):
-        point = Point(long, lat)
-        for state_name, state_data in self.states_data.items():
-            if state_data.contains(point).any():
-                return True, state_name
-        return False, "Outside Australia"
+        # Reprojected state polygons come from a binary cache that is rebuilt whenever the shapefiles change; each
+        # polygon remembers the position of its state so points falling in several state files resolve to the first
+        # state, as the per-state lookup did
+        boundary_store = StateBoundaryStore(self.states_shapefiles, self.directory_structure.map_cache_base_path)
+        self.state_names, self.state_polygons, self.state_polygon_index = boundary_store.load()
+        shapely.prepare(self.state_polygons)
+        self.state_tree = shapely.STRtree(self.state_polygons)
 
+    def classify_points(self, lats, longs):
+        """
+        Return the state name of every (lat, long) pair, or "Outside_Australia" when no state polygon contains it.
+        """
+        import shapely
 
-class ScientificNameChecker:
-    def __init__(self):
-        pass
+        points = shapely.points(np.asarray(longs, dtype=float), np.asarray(lats, dtype=float))
+        labels = np.full(len(points), "Outside_Australia", dtype=object)
+        if len(points) == 0 or len(self.state_polygons) == 0:
+            return labels
+
+        point_positions, polygon_positions = self.state_tree.query(points, predicate="within")
+        state_positions = np.full(len(points), len(self.state_names))
+        np.minimum.at(state_positions, point_positions, self.state_polygon_index[polygon_positions])
+        in_australia = state_positions < len(self.state_names)
+        labels[in_australia] = np.array(self.state_names, dtype=object)[state_positions[in_australia]]
+        return labels
+
+    def is_point_in_australia_state(self, lat, long):
+        state_name = self.classify_points([lat], [long])[0]
+        if state_name == "Outside_Australia":
+            return False, "Outside Australia"
+        return True, state_name
 
-    #   self.nsl_df=pd.read_csv(f'nsl\APNI-names-2024-03-27-4556.csv')
 
-    # def check_name(self, name):
-    #    self.nsl_df.any( )
+class ScientificNameChecker:
+    def __init__(self, name_index: Optional[NSLNameIndex] = None, name_matcher: Optional[NSLNameMatcher] = None,
+                 correction_cutoff=0.8):
+        self.name_index = name_index if name_index is not None else NSLNameIndex()
+        self.name_matcher = name_matcher if name_matcher is not None else NSLNameMatcher()
+        self.correction_cutoff = correction_cutoff
 
     def check_empty(self, data):
         return [s == "" for s in data]
 
+    def validate_names(self, scientific_names):
+        """
+        Map every distinct name in scientific_names to whether it is an APNI name.
+        """
+        distinct_names = list(dict.fromkeys(scientific_names))
+        return dict(zip(distinct_names, self.name_index.contains(distinct_names).tolist()))
+
     @staticmethod
     def is_valid_scientific_name(scientific_name):
         if scientific_name:
             return True
         else:
             return False
+
+    def is_apni_name(self, scientific_name):
+        """
+        Whether scientific_name is an APNI name; validate_names checks many names in one batch.
+        """
+        return self.validate_names([scientific_name])[scientific_name]
+
+    def suggest_corrections(self, scientific_names, executor=None):
+        """
+        Map every distinct name in scientific_names to the most similar APNI name, or None when none is similar
+        enough. The names are matched in batches on executor when one is given.
+        """
+        if executor is None:
+            return self.name_matcher.suggest(scientific_names, self.correction_cutoff, max_workers=1)
+        return self.name_matcher.suggest(scientific_names, self.correction_cutoff, executor=executor)
@@ -0,0 +1,89 @@
+from typing import Iterable, List, Optional, Tuple
+
+# Cost classes: light assessments are row scans over the shared observation table and run on threads; heavy ones fit
+# scikit-learn models or fuzzy-match names and hand that work to worker processes
+LIGHT = 'light'
+HEAVY = 'heavy'
+
+
+class AssessmentSpec:
+    """
+    Declaration of one assessment: its name (the vocabulary key it reports under), the RDFDataQualityAssessment
+    method that runs it, the inputs it reads and its cost class.
+
+    arguments names assessment attributes passed to the method; the assessment is only selectable when all of them are
+    set. An opt_in assessment only runs when it is asked for by name.
+    """
+
+    def __init__(self, name: str, method: str, inputs: Tuple[str, ...], cost: str = LIGHT,
+                 arguments: Tuple[str, ...] = (), opt_in: bool = False):
+        self.name = name
+        self.method = method
+        self.inputs = inputs
+        self.cost = cost
+        self.arguments = arguments
+        self.opt_in = opt_in
+
+    def __repr__(self):
+        return f"AssessmentSpec({self.name!r})"
+
+    def is_available(self, assessment) -> bool:
+        return all(getattr(assessment, argument, None) for argument in self.arguments)
+
+    def run(self, assessment):
+        return getattr(assessment, self.method)(*(getattr(assessment, argument) for argument in self.arguments))
+
+
+# In the order their results are written to Results.ttl, the result matrix and Report.txt
+ASSESSMENTS = [
+    AssessmentSpec('duplicate', 'assess_duplicate', ('graph',), arguments=('duplicate_predicates_to_check',)),
+    AssessmentSpec('geo_spatial_accuracy_precision', 'assess_geo_spatial_accuracy_precision', ('accuracy',)),
+    AssessmentSpec('coordinate_precision', 'assess_coordinate_precision', ('coordinates',)),
+    AssessmentSpec('coordinate_completeness', 'assess_coordinate_completeness', ('coordinates',)),
+    AssessmentSpec('coordinate_unusual', 'assess_coordinate_unusual', ('coordinates',)),
+    AssessmentSpec('coordinate_in_australia_state', 'assess_coordinate_in_australia_state',
+                   ('coordinates', 'state_boundaries')),
+    AssessmentSpec('coordinate_outlier_irq', 'assess_coordinate_outlier_irq', ('coordinates',)),
+    AssessmentSpec('coordinate_outlier_isolation_forest', 'assess_coordinate_outlier_isolation_forest',
+                   ('coordinates',), HEAVY),
+    AssessmentSpec('coordinate_outlier_robust_covariance', 'assess_coordinate_outlier_robust_covariance',
+                   ('coordinates',), HEAVY),
+    AssessmentSpec('coordinate_outlier_zscore', 'assess_coordinate_outlier_zscore', ('coordinates',)),
+    AssessmentSpec('date_recency', 'assess_date_recency', ('dates',)),
+    AssessmentSpec('date_format_validation', 'assess_date_format_validation', ('dates',)),
+    AssessmentSpec('date_completeness', 'assess_date_completeness', ('dates',)),
+    AssessmentSpec('date_outlier_kmeans', 'assess_date_outlier_kmeans', ('dates',)),
+    AssessmentSpec('date_outlier_irq', 'assess_date_outlier_irq', ('dates',)),
+    AssessmentSpec('scientific_name_completeness', 'assess_scientific_name_completeness', ('names',)),
+    AssessmentSpec('scientific_name_validation', 'assess_scientific_name_validation', ('names',)),
+    AssessmentSpec('scientific_name_correction', 'assess_scientific_name_correction', ('names',), HEAVY,
+                   opt_in=True),
+    AssessmentSpec('datum_completeness', 'assess_datum_completeness', ('datum',)),
+    AssessmentSpec('datum_type', 'assess_datum_type', ('datum',)),
+    AssessmentSpec('datum_validation', 'assess_datum_validation', ('datum',)),
+]
+
+
+def assessment_names() -> List[str]:
+    return [spec.name for spec in ASSESSMENTS]
+
+
+def opt_in_assessment_names() -> List[str]:
+    return [spec.name for spec in ASSESSMENTS if spec.opt_in]
+
+
+def select_assessments(only: Optional[Iterable[str]] = None, skip: Optional[Iterable[str]] = None,
+                       include: Optional[Iterable[str]] = None) -> List[AssessmentSpec]:
+    """
+    The registered assessments, in registry order, restricted to the names in only (when given) and without the names
+    in skip. Opt-in assessments are only selected when named in only or include.
+    """
+    names = set(assessment_names())
+    for name in list(only or []) + list(skip or []) + list(include or []):
+        if name not in names:
+            raise KeyError(f"Unknown assessment '{name}'")
+    requested = set(only or []) | set(include or [])
+    only = set(only) if only is not None else names
+    skip = set(skip or [])
+    return [spec for spec in ASSESSMENTS
+            if spec.name in only and spec.name not in skip and (not spec.opt_in or spec.name in requested)]
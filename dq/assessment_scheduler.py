@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, Optional, Sequence
+
+from .assessment_registry import HEAVY, AssessmentSpec
+
+
+class AssessmentOutput:
+    """
+    The results, result matrix entries and report sections one assessment produced while running on a worker thread,
+    held back until they can be written out in registry order.
+    """
+
+    def __init__(self):
+        self.results = []
+        self.matrix_entries = []
+        self.report_sections = []
+
+    def replay(self, assessment):
+        for result in self.results:
+            assessment.results_writer.add_result(*result)
+        for matrix_entry in self.matrix_entries:
+            assessment._add_assessment_result_to_matrix(*matrix_entry)
+        for report_section in self.report_sections:
+            assessment.add_to_report(*report_section)
+
+
+class AssessmentScheduler:
+    """
+    Runs registered assessments against one RDFDataQualityAssessment.
+
+    With more than one worker every assessment runs on a thread pool, and heavy (scikit-learn) assessments hand their
+    model fits to a process pool. Each assessment's output is captured on its thread and written to Results.ttl, the
+    result matrix and the report in registry order, so the output does not depend on which assessment finishes
+    first. With a single worker the assessments run one after another and write directly.
+    """
+
+    def __init__(self, assessment, max_workers: Optional[int] = None):
+        self.assessment = assessment
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+    def prepare(self, specs: Sequence[AssessmentSpec]):
+        """
+        Load the shared inputs the selected assessments declare before any of them run, so concurrent assessments do
+        not race to build them and unselected inputs (e.g. the state boundaries) are never loaded.
+        """
+        inputs = {name for spec in specs for name in spec.inputs}
+        if inputs - {'graph'}:
+            self.assessment.observation_frame
+        if 'coordinates' in inputs:
+            self.assessment.coordinate_string_labels
+            if self.assessment.normalize_datums:
+                self.assessment.normalized_coordinates
+        if 'datum' in inputs:
+            self.assessment.datum_labels
+        if 'state_boundaries' in inputs:
+            self.assessment.geo_checker
+        if 'names' in inputs:
+            self.assessment.name_checker.name_index.hashes
+
+    def _run_timed(self, spec: AssessmentSpec, parent: Optional[str] = None):
+        with self.assessment.stage_timer.stage(spec.name, parent=parent) as record:
+            result = spec.run(self.assessment)
+            if result is not None:
+                record.observations = result[1]
+        return result
+
+    def _run_captured(self, spec: AssessmentSpec, parent: Optional[str]):
+        output = AssessmentOutput()
+        self.assessment._local.output = output
+        try:
+            return self._run_timed(spec, parent), output
+        finally:
+            self.assessment._local.output = None
+
+    def run(self, specs: Sequence[AssessmentSpec],
+            on_result: Optional[Callable[[AssessmentSpec, object], None]] = None) -> Dict[str, object]:
+        """
+        Run specs and return each assessment's (name, total, counts) result, or None when it had nothing to assess,
+        keyed by assessment name. on_result is called on the calling thread for every assessment in registry order.
+        """
+        specs = [spec for spec in specs if spec.is_available(self.assessment)]
+        self.prepare(specs)
+        results = {}
+
+        if self.max_workers <= 1 or len(specs) <= 1:
+            for spec in specs:
+                results[spec.name] = self._run_timed(spec)
+                if on_result is not None:
+                    on_result(spec, results[spec.name])
+            return results
+
+        heavy = any(spec.cost == HEAVY for spec in specs)
+        # The process pool starts its workers lazily, from whichever assessment thread submits first; forking a
+        # process that is running other threads can copy a lock another thread holds, so workers come from a
+        # forkserver instead
+        processes = (ProcessPoolExecutor(max_workers=self.max_workers,
+                                         mp_context=multiprocessing.get_context('forkserver'))
+                     if heavy else nullcontext())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as threads, processes as processes:
+            self.assessment.process_executor = processes
+            try:
+                parent = self.assessment.stage_timer.current()
+                futures = [threads.submit(self._run_captured, spec, parent) for spec in specs]
+                for spec, future in zip(specs, futures):
+                    result, output = future.result()
+                    output.replay(self.assessment)
+                    results[spec.name] = result
+                    if on_result is not None:
+                        on_result(spec, result)
+            finally:
+                self.assessment.process_executor = None
+        return results
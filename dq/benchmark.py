@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from .defined_namespaces import DirectoryStructure
+from .synthetic_data import SyntheticABISGenerator
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+# Stages faster than this are too noisy to compare between runs
+MIN_COMPARED_SECONDS = 1.0
+
+
+def dataset_directory(data_dir: str, records: int, seed: int) -> Path:
+    return Path(data_dir) / f"records_{records}_seed_{seed}"
+
+
+def generate_dataset(data_dir: str, records: int, seed: int = 42) -> Path:
+    """
+    Generate the synthetic dataset of the given size once; later runs reuse it.
+    """
+    directory = dataset_directory(data_dir, records, seed)
+    manifest = directory / 'manifest.json'
+    if not manifest.exists():
+        generator = SyntheticABISGenerator(records, seed)
+        generator.write(str(directory))
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump({'records': records, 'seed': seed, 'defects': dict(generator.defect_counts)}, f, indent=2)
+    return directory
+
+
+def run_pipeline(directory: Path, log_file: str, extra_args: Sequence[str] = ()) -> Dict:
+    """
+    Run the full `python -m dq` pipeline on directory in a fresh process, so peak memory is measured per run, and
+    collect the stage timings it writes to timings.json.
+    """
+    directory_structure = DirectoryStructure()
+    timings_file = os.path.join(directory_structure.report_base_path, 'timings.json')
+    if os.path.exists(timings_file):
+        os.remove(timings_file)
+
+    command = [sys.executable, '-m', 'dq', '--data-to-assess', str(directory), '--no-cache', *extra_args]
+    start = time.perf_counter()
+    with open(log_file, 'w', encoding='utf-8') as log:
+        completed = subprocess.run(command, cwd=os.path.dirname(directory_structure.base_path), stdout=log,
+                                   stderr=subprocess.STDOUT)
+    result = {'wall_time': time.perf_counter() - start, 'returncode': completed.returncode, 'stages': {}}
+
+    if os.path.exists(timings_file):
+        with open(timings_file, encoding='utf-8') as f:
+            stages = json.load(f)['stages']
+        for stage in stages:
+            key = f"{stage['parent']}/{stage['name']}" if stage['parent'] else stage['name']
+            result['stages'][key] = {field: stage[field] for field in
+                                     ['wall_time', 'cpu_time', 'peak_rss_mb', 'observations_per_second']}
+        peaks = [stage['peak_rss_mb'] for stage in stages if stage['peak_rss_mb'] is not None]
+        result['peak_rss_mb'] = max(peaks) if peaks else None
+    return result
+
+
+def run_benchmark(sizes: Sequence[int], data_dir: str, seed: int = 42,
+                  extra_args: Sequence[str] = ()) -> Dict:
+    """
+    Generate a dataset per size and time the full pipeline, and every assessment within it, on each. Sizes run in
+    increasing order; once a size fails (e.g. runs out of memory) the larger ones are not attempted.
+    """
+    results = {'seed': seed, 'python': sys.version.split()[0], 'cpu_count': os.cpu_count(), 'sizes': {}}
+    for records in sorted(sizes):
+        print(f"Generating {records} records...")
+        directory = generate_dataset(data_dir, records, seed)
+        print(f"Running the pipeline on {records} records...")
+        result = run_pipeline(directory, str(directory / 'run.log'), extra_args)
+        result['records'] = records
+        results['sizes'][str(records)] = result
+        print(f"  {result['wall_time']:.1f}s, peak RSS {result.get('peak_rss_mb')} MB, "
+              f"exit code {result['returncode']}")
+        if result['returncode'] != 0:
+            print(f"  Stopping: see {directory / 'run.log'}")
+            break
+    return results
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = 1.5) -> List[str]:
+    """
+    The stages whose wall time or peak memory grew by more than tolerance times the baseline, for every size both
+    runs measured.
+    """
+    regressions = []
+    for size, current_result in current['sizes'].items():
+        baseline_result = baseline['sizes'].get(size)
+        if baseline_result is None:
+            continue
+        if current_result['returncode'] != 0 and baseline_result['returncode'] == 0:
+            regressions.append(f"{size} records: pipeline failed (exit code {current_result['returncode']})")
+            continue
+        for stage, measures in current_result['stages'].items():
+            baseline_measures = baseline_result['stages'].get(stage)
+            if baseline_measures is None:
+                continue
+            if (baseline_measures['wall_time'] >= MIN_COMPARED_SECONDS
+                    and measures['wall_time'] > tolerance * baseline_measures['wall_time']):
+                regressions.append(f"{size} records, {stage}: {measures['wall_time']:.3f}s wall "
+                                   f"(baseline {baseline_measures['wall_time']:.3f}s)")
+        if (baseline_result.get('peak_rss_mb') and current_result.get('peak_rss_mb')
+                and current_result['peak_rss_mb'] > tolerance * baseline_result['peak_rss_mb']):
+            regressions.append(f"{size} records: peak RSS {current_result['peak_rss_mb']:.1f} MB "
+                               f"(baseline {baseline_result['peak_rss_mb']:.1f} MB)")
+    return regressions
+
+
+def cli(args=None):
+    parser = argparse.ArgumentParser(
+        prog="dq.benchmark",
+        description="Time the assessment pipeline on synthetic data of increasing size. Note that every run writes "
+                    "the usual outputs in dq/result, dq/report and dq/template.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of records to run")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the synthetic data")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), 'bdr-dq-benchmark'),
+                        help="Directory the generated datasets are kept in")
+    parser.add_argument("--output", type=Path, default=Path('benchmark.json'), help="Where to write the results")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="Results of an earlier run to compare against; exits with status 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Factor by which a stage may exceed its baseline time or memory")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    if args is None:
+        args = cli(sys.argv[1:])
+
+    results = run_benchmark(args.sizes, args.data_dir, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.tolerance)
+        for regression in regressions:
+            print("Regression:", regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against", args.baseline)
+
+
+if __name__ == "__main__":
+    main()
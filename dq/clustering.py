@@ -0,0 +1,133 @@
+from typing import Optional
+
+import numpy as np
+
+
+def _weighted(values, counts):
+    values = np.asarray(values, dtype=float).ravel()
+    if counts is None:
+        return values, np.ones(len(values))
+    return values, np.asarray(counts, dtype=float).ravel()
+
+
+def ckmeans(values, k: int, counts=None) -> np.ndarray:
+    """
+    Optimal 1-D k-means clustering (Ckmeans.1d.dp style) of values into at most k clusters.
+
+    The dynamic programme runs over the sorted distinct values weighted by their counts, so its cost depends on the
+    number of distinct values rather than on the number of observations. counts, when given, holds how often each
+    value occurs. Returns a cluster label per value, numbered in increasing value order.
+    """
+    values, counts = _weighted(values, counts)
+    distinct, inverse = np.unique(values, return_inverse=True)
+    counts = np.bincount(inverse, weights=counts)
+    m = len(distinct)
+    if m == 0:
+        return np.zeros(0, dtype=int)
+    k = max(1, min(k, m))
+
+    # Prefix sums give the within-cluster sum of squares of any run distinct[start..end] in O(1)
+    weight = np.concatenate([[0.0], np.cumsum(counts)])
+    total = np.concatenate([[0.0], np.cumsum(counts * distinct)])
+    total_sq = np.concatenate([[0.0], np.cumsum(counts * distinct ** 2)])
+
+    def segment_cost(starts, end):
+        w = weight[end + 1] - weight[starts]
+        s = total[end + 1] - total[starts]
+        return (total_sq[end + 1] - total_sq[starts]) - s * s / w
+
+    cost = segment_cost(np.zeros(m, dtype=int), np.arange(m))
+    backtrack = np.zeros((k, m), dtype=int)
+    for cluster in range(1, k):
+        next_cost = np.full(m, np.inf)
+        for end in range(cluster, m):
+            starts = np.arange(cluster, end + 1)
+            candidates = cost[starts - 1] + segment_cost(starts, end)
+            best = np.argmin(candidates)
+            next_cost[end] = candidates[best]
+            backtrack[cluster, end] = starts[best]
+        cost = next_cost
+
+    distinct_labels = np.zeros(m, dtype=int)
+    end = m - 1
+    for cluster in range(k - 1, -1, -1):
+        start = backtrack[cluster, end] if cluster else 0
+        distinct_labels[start:end + 1] = cluster
+        end = start - 1
+    return distinct_labels[inverse]
+
+
+def silhouette_score_1d(values, labels, counts=None, sample_size: Optional[int] = None,
+                        random_state: int = 42) -> float:
+    """
+    Mean silhouette coefficient of a 1-D clustering, computed from sorted prefix sums instead of pairwise distances.
+
+    Values are grouped by distinct (value, label) pair, so the cost is O(distinct values x clusters); counts, when
+    given, holds how often each value occurs. With sample_size set and more observations than that, the score is
+    computed on a random sample of about that many observations, like the sample_size option of
+    sklearn.metrics.silhouette_score. The sample is stratified by cluster, so every non-empty cluster keeps at least
+    one member however small it is next to the others.
+    """
+    values, counts = _weighted(values, counts)
+    cluster_ids, labels = np.unique(np.asarray(labels).ravel(), return_inverse=True)
+    n_clusters = len(cluster_ids)
+
+    distinct, inverse = np.unique(values, return_inverse=True)
+    keys = inverse * n_clusters + labels
+    if sample_size is not None and counts.sum() > sample_size:
+        keys = _stratified_sample(keys, labels, counts, n_clusters, sample_size, random_state)
+        counts = np.ones(len(keys))
+
+    # One row per distinct (value, cluster) pair, weighted by how often it occurs
+    pair_counts = np.bincount(keys, weights=counts, minlength=len(distinct) * n_clusters)
+    present = np.flatnonzero(pair_counts)
+    pair_counts = pair_counts[present]
+    pair_values, pair_labels = distinct[present // n_clusters], present % n_clusters
+
+    cluster_sizes = np.bincount(pair_labels, weights=pair_counts, minlength=n_clusters)
+    if not 2 <= np.count_nonzero(cluster_sizes) <= pair_counts.sum() - 1:
+        raise ValueError("Number of labels must be between 2 and n_samples - 1")
+
+    # Sum of |x - y| from every distinct value x to all members y of each cluster
+    distance_sums = np.zeros((len(pair_values), n_clusters))
+    for cluster in range(n_clusters):
+        in_cluster = pair_labels == cluster
+        members, member_counts = pair_values[in_cluster], pair_counts[in_cluster]
+        weight = np.concatenate([[0.0], np.cumsum(member_counts)])
+        total = np.concatenate([[0.0], np.cumsum(member_counts * members)])
+        below = np.searchsorted(members, pair_values, side='right')
+        distance_sums[:, cluster] = (pair_values * weight[below] - total[below]
+                                     + (total[-1] - total[below]) - pair_values * (weight[-1] - weight[below]))
+
+    own_size = cluster_sizes[pair_labels]
+    rows = np.arange(len(pair_values))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intra = distance_sums[rows, pair_labels] / (own_size - 1)
+        mean_distances = distance_sums / cluster_sizes
+        mean_distances[:, cluster_sizes == 0] = np.inf
+        mean_distances[rows, pair_labels] = np.inf
+        nearest = mean_distances.min(axis=1)
+        silhouettes = (nearest - intra) / np.maximum(intra, nearest)
+
+    # Members of singleton clusters score 0, as in sklearn
+    silhouettes = np.where(own_size > 1, np.nan_to_num(silhouettes), 0.0)
+    return float(np.sum(silhouettes * pair_counts) / np.sum(pair_counts))
+
+
+def _stratified_sample(keys, labels, counts, n_clusters: int, sample_size: int, random_state: int) -> np.ndarray:
+    """
+    The keys of a sample of about sample_size observations, drawn without replacement from the multiset the counts
+    describe, with every cluster represented in proportion to its size and by at least one observation.
+    """
+    rng = np.random.RandomState(random_state)
+    cluster_sizes = np.bincount(labels, weights=counts, minlength=n_clusters)
+    allocation = np.round(sample_size * cluster_sizes / cluster_sizes.sum()).astype(np.int64)
+    allocation = np.minimum(np.maximum(allocation, 1), cluster_sizes.astype(np.int64))
+
+    sampled_keys = []
+    for cluster in np.flatnonzero(cluster_sizes):
+        in_cluster = np.flatnonzero(labels == cluster)
+        cumulative = np.cumsum(counts[in_cluster]).astype(np.int64)
+        sample = rng.permutation(int(cumulative[-1]))[:allocation[cluster]]
+        sampled_keys.append(keys[in_cluster][np.searchsorted(cumulative, sample, side='right')])
+    return np.concatenate(sampled_keys)
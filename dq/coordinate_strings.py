@@ -0,0 +1,131 @@
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Longest strings has_repeated_block compares as rows of a code point matrix; longer ones are checked one by one
+MAX_VECTORIZED_WIDTH = 64
+
+
+def decimal_parts(texts) -> pd.Series:
+    """
+    The characters after the last '.' of every coordinate string, or '' when it has no '.'.
+    """
+    parts = pd.Series(texts, dtype=object).astype(str).str.rpartition('.')
+    return parts[2].where(parts[1] == '.', '')
+
+
+def _z_function(codes) -> list:
+    """
+    For every position of codes, the length of the longest common prefix of codes and the suffix starting there.
+    """
+    n = len(codes)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and codes[z[i]] == codes[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
+def _has_square(codes) -> bool:
+    """
+    Whether codes contains a block immediately followed by the same block again, found by Main and Lorentz's divide
+    and conquer: a repeated block lies in either half or crosses the middle, and the ones crossing the middle are found
+    with four Z-function passes over the halves, so the whole check is O(n log n).
+    """
+    n = len(codes)
+    if n < 2:
+        return False
+    nu = n // 2
+    nv = n - nu
+    u, v = codes[:nu], codes[nu:]
+    if _has_square(u) or _has_square(v):
+        return True
+    ru, rv = u[::-1], v[::-1]
+    # -1 never occurs in a code point list, so it separates the strings the Z-functions are taken over
+    z1 = _z_function(ru)
+    z2 = _z_function(v + [-1] + u)
+    z3 = _z_function(ru + [-1] + rv)
+    z4 = _z_function(v)
+
+    def get_z(z, i):
+        return z[i] if 0 <= i < len(z) else 0
+
+    for centre in range(n):
+        if centre < nu:
+            block = nu - centre
+            k1, k2 = get_z(z1, nu - centre), get_z(z2, nv + 1 + centre)
+        else:
+            block = centre - nu + 1
+            k1, k2 = get_z(z3, nu + 1 + nv - 1 - (centre - nu)), get_z(z4, centre - nu + 1)
+        if max(1, block - k2) <= min(block, k1):
+            return True
+    return False
+
+
+def has_repeated_block(texts) -> np.ndarray:
+    """
+    For every string, whether it contains a block of characters immediately followed by the same block again
+    (e.g. '33' or '1212'), as RDFDataQualityAssessment.detect_unusual_numbers checks the decimal part.
+
+    Strings up to MAX_VECTORIZED_WIDTH long are grouped by length and laid out as rows of a code point matrix; for
+    every block length the positions where a character equals the one block length further on are found for all rows
+    at once, and a repeated block is a run of block length such positions. The work per string is bounded by the
+    width cap, so it is linear in the number of strings. Longer strings are checked one by one with _has_square, in
+    O(n log n) of their own length.
+    """
+    texts = [str(text) for text in texts]
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    found = np.zeros(len(texts), dtype=bool)
+    for width in np.unique(lengths[lengths >= 2]):
+        rows = np.flatnonzero(lengths == width)
+        if width > MAX_VECTORIZED_WIDTH:
+            found[rows] = [_has_square([ord(character) for character in texts[row]]) for row in rows]
+            continue
+        codes = np.array([texts[row] for row in rows], dtype=f'U{width}').view(np.uint32).reshape(len(rows), width)
+        repeated = np.zeros(len(rows), dtype=bool)
+        for length in range(1, width // 2 + 1):
+            equal = codes[:, :-length] == codes[:, length:]
+            runs = np.concatenate([np.zeros((len(rows), 1), dtype=np.int64), np.cumsum(equal, axis=1)], axis=1)
+            repeated |= ((runs[:, length:] - runs[:, :-length]) == length).any(axis=1)
+        found[rows] = repeated
+    return found
+
+
+def precision_labels(longitude_places, latitude_places) -> np.ndarray:
+    """
+    The coordinate_precision label of every coordinate from the decimal places of its longitude and latitude: "High"
+    when both have more than 4, "Low" when either has fewer than 2, "Medium" otherwise.
+    """
+    least_places = np.minimum(np.asarray(longitude_places), np.asarray(latitude_places))
+    return np.where(least_places > 4, "High", np.where(least_places >= 2, "Medium", "Low")).astype(object)
+
+
+def coordinate_string_labels(longitude_texts, latitude_texts) -> Dict[str, np.ndarray]:
+    """
+    The coordinate_completeness, coordinate_precision and coordinate_unusual labels of every geometry, from the
+    longitude and latitude strings parsed out of its WKT (None when the WKT holds no point). Geometries without a
+    point get no coordinate_precision label (None) and count as "usual".
+    """
+    longitude_texts = pd.Series(longitude_texts, dtype=object)
+    latitude_texts = pd.Series(latitude_texts, dtype=object)
+    complete = (longitude_texts.notna() & latitude_texts.notna()).to_numpy()
+
+    labels = {
+        'coordinate_completeness': np.where(complete, "non_empty", "empty").astype(object),
+        'coordinate_precision': np.full(len(complete), None, dtype=object),
+        'coordinate_unusual': np.full(len(complete), "usual", dtype=object),
+    }
+    if complete.any():
+        longitude_decimals = decimal_parts(longitude_texts[complete])
+        latitude_decimals = decimal_parts(latitude_texts[complete])
+        labels['coordinate_precision'][complete] = precision_labels(longitude_decimals.str.len().to_numpy(),
+                                                                    latitude_decimals.str.len().to_numpy())
+        unusual = has_repeated_block(longitude_decimals) | has_repeated_block(latitude_decimals)
+        labels['coordinate_unusual'][complete] = np.where(unusual, "unusual", "usual")
+    return labels
@@ -0,0 +1,97 @@
+import csv
+import os
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .datum_transform import NO_EPSG_CODE
+from .defined_namespaces import DirectoryStructure
+from .distinct_values import DistinctValueMemo
+
+# The datum_type labels an EPSG code can resolve to
+DATUM_NAMES = ("AGD84", "GDA2020", "GDA94", "WGS84")
+
+
+def default_epsg_table() -> str:
+    return os.path.join(DirectoryStructure().datum_base_path, 'epsg_datums.csv')
+
+
+def load_epsg_table(path: Optional[str] = None) -> Dict[int, dict]:
+    """
+    The datum metadata of every EPSG code in the table at path (epsg_code, name, description columns), by code.
+    Several codes may resolve to the same datum; every name must be one of the datum_type labels.
+    """
+    datum_metadata = {}
+    with open(path or default_epsg_table(), newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['name'] not in DATUM_NAMES:
+                raise ValueError(f"EPSG {row['epsg_code']}: '{row['name']}' is not one of the datums {DATUM_NAMES}")
+            datum_metadata[int(row['epsg_code'])] = {"name": row['name'], "description": row['description']}
+    return datum_metadata
+
+
+class DatumResolver:
+    """
+    Resolves the CRS IRI of every geometry to its datum once per distinct IRI, and derives the datum_completeness,
+    datum_validation and datum_type labels of all geometries from the resulting categorical datum column.
+
+    Geometries share very few CRS IRIs, so the per-geometry cost is finding the IRI in the WKT string; supporting more
+    EPSG codes only grows the table looked up once per distinct IRI. Resolutions go through memo when one is given,
+    so their hit rate is reported with the run's other distinct value checks.
+    """
+
+    def __init__(self, datum_checker, memo=None):
+        self.datum_checker = datum_checker
+        self.memo = memo
+
+    def resolve(self, crs_key: str) -> Optional[str]:
+        """
+        The datum name of the CRS IRI in crs_key (see DatumChecker.epsg_link_key), or None when it has none or it is
+        not a supported EPSG code.
+        """
+        epsg_link = self.datum_checker.extract_epsg_link(crs_key)
+        datum_metadata = self.datum_checker.get_datum_metadata(epsg_link) if epsg_link is not None else None
+        return datum_metadata["name"] if datum_metadata else None
+
+    def resolve_epsg_code(self, crs_key: str) -> int:
+        """
+        The EPSG code of the CRS IRI in crs_key when it is one of the supported codes, or else NO_EPSG_CODE.
+        """
+        epsg_link = self.datum_checker.extract_epsg_link(crs_key)
+        epsg_code = self.datum_checker.epsg_code(epsg_link) if epsg_link is not None else None
+        return epsg_code if epsg_code in self.datum_checker.datum_metadata else NO_EPSG_CODE
+
+    def epsg_column(self, geometries) -> np.ndarray:
+        """
+        The supported EPSG code of every geometry, or NO_EPSG_CODE where it has none.
+        """
+        crs_keys = [self.datum_checker.epsg_link_key(str(geometry)) for geometry in geometries]
+        memo = self.memo if self.memo is not None else DistinctValueMemo()
+        return memo.map('DatumResolver.resolve_epsg_code', self.resolve_epsg_code, crs_keys).astype(np.int64)
+
+    def datum_column(self, geometries) -> pd.Categorical:
+        """
+        The datum of every geometry, as a categorical over the datum names; NaN where it does not resolve.
+        """
+        crs_keys = [self.datum_checker.epsg_link_key(str(geometry)) for geometry in geometries]
+        memo = self.memo if self.memo is not None else DistinctValueMemo()
+        datums = memo.map('DatumResolver.resolve', self.resolve, crs_keys)
+        return pd.Categorical(datums, categories=list(DATUM_NAMES))
+
+    def labels(self, geometries) -> Dict[str, np.ndarray]:
+        """
+        The datum and EPSG code columns and the datum_completeness, datum_validation and datum_type label of every
+        geometry.
+        """
+        geometries = pd.Series(list(geometries), dtype=object)
+        datum = self.datum_column(geometries)
+        resolved = np.asarray(datum.codes) >= 0
+        return {
+            'datum': datum,
+            'epsg_code': self.epsg_column(geometries),
+            'datum_completeness': np.where(geometries.astype(str).str.len().to_numpy() > 0,
+                                           "not_empty", "empty").astype(object),
+            'datum_validation': np.where(resolved, "valid", "invalid").astype(object),
+            'datum_type': np.where(resolved, np.asarray(datum, dtype=object), "None").astype(object),
+        }
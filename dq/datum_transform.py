@@ -0,0 +1,86 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .locations import LocationStats, factorize_locations
+
+# The state boundaries are reprojected to this CRS, so the spatial assessments compare coordinates in it
+TARGET_CRS = 4326
+# Marks a coordinate whose geometry has no supported EPSG code
+NO_EPSG_CODE = -1
+
+
+def geographic_crs(epsg_code: int) -> Optional[int]:
+    """
+    The EPSG code of the geographic 2D CRS that longitude/latitude pairs given in the CRS epsg_code are in: the CRS
+    itself when it is geographic 2D, its 2D form when it is geographic 3D, and the geographic 2D CRS of the same datum
+    when it is geocentric (e.g. 4283 GDA94 for 4348 GDA94 geocentric). None when there is no such CRS.
+    """
+    import pyproj
+    from pyproj.database import query_crs_info
+    from pyproj.enums import PJType
+
+    crs = pyproj.CRS.from_epsg(epsg_code)
+    if crs.is_geographic:
+        return crs.to_2d().to_epsg()
+    datum = crs.datum
+    for info in query_crs_info(auth_name='EPSG', pj_types=PJType.GEOGRAPHIC_2D_CRS, allow_deprecated=False):
+        if pyproj.CRS.from_epsg(int(info.code)).datum == datum:
+            return int(info.code)
+    return None
+
+
+class DatumTransformer:
+    """
+    Transforms coordinates given in several CRSs to one target CRS, with one batched pyproj transform per CRS.
+
+    The source CRS of every coordinate is the EPSG code in its geometry's WKT, so the datum a transform starts from is
+    always the one the data declares. Transformations only use what ships with PROJ: network access to
+    transformation grids is switched off, so where a grid would be needed PROJ falls back to its best offline
+    transformation (e.g. the Helmert parameters of AGD84).
+    """
+
+    def __init__(self, target_crs: int = TARGET_CRS):
+        self.target_crs = target_crs
+        self._source_crs = {}
+        self._transformers = {}
+
+    def source_crs(self, epsg_code: int) -> Optional[int]:
+        if epsg_code not in self._source_crs:
+            self._source_crs[epsg_code] = geographic_crs(epsg_code)
+        return self._source_crs[epsg_code]
+
+    def transformer(self, source_crs: int):
+        if source_crs not in self._transformers:
+            # pyproj is only needed when coordinates are normalized
+            import pyproj
+
+            pyproj.network.set_network_enabled(False)
+            self._transformers[source_crs] = pyproj.Transformer.from_crs(source_crs, self.target_crs,
+                                                                         always_xy=True)
+        return self._transformers[source_crs]
+
+    def transform(self, longitudes, latitudes, epsg_codes,
+                  location_stats: Optional[LocationStats] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        longitudes and latitudes in the target CRS, given the EPSG code of every coordinate's geometry (NO_EPSG_CODE
+        where it has no supported one). Coordinates without a code are taken to be in the target CRS already. Each
+        distinct location of a CRS is transformed once.
+        """
+        longitudes = np.array(longitudes, dtype=float)
+        latitudes = np.array(latitudes, dtype=float)
+        epsg_codes = np.asarray(epsg_codes, dtype=np.int64)
+        for epsg_code in np.unique(epsg_codes[epsg_codes != NO_EPSG_CODE]):
+            source_crs = self.source_crs(int(epsg_code))
+            if source_crs is None or source_crs == self.target_crs:
+                continue
+            group = epsg_codes == epsg_code
+            codes_in_group, location_longitudes, location_latitudes = factorize_locations(longitudes[group],
+                                                                                          latitudes[group])
+            location_longitudes, location_latitudes = self.transformer(source_crs).transform(location_longitudes,
+                                                                                             location_latitudes)
+            longitudes[group] = np.asarray(location_longitudes)[codes_in_group]
+            latitudes[group] = np.asarray(location_latitudes)[codes_in_group]
+            if location_stats is not None:
+                location_stats.record('datum_transform', int(group.sum()), len(location_longitudes))
+        return longitudes, latitudes
@@ -21,6 +21,10 @@ class DirectoryStructure:
     def __init__(self):
         self.base_path = os.path.dirname(__file__)  # Gets the directory in which this script is located
         self.map_base_path = os.path.join(self.base_path, 'map')  # Path to the 'map' directory
+        self.map_cache_base_path = os.path.join(self.map_base_path, 'cache')  # Path to the preprocessed map cache
+        self.datum_base_path = os.path.join(self.base_path, 'datum')  # Path to the 'datum' directory
+        self.nsl_base_path = os.path.join(self.base_path, 'nsl')  # Path to the 'nsl' directory
+        self.nsl_cache_base_path = os.path.join(self.nsl_base_path, 'cache')  # Path to the indexed NSL names
         self.output_base_path = os.path.join(self.base_path, 'output')  # Path to the 'output' directory
         self.result_base_path = os.path.join(self.base_path, 'result')  # Path to the 'result' directory
         self.template_base_path = os.path.join(self.base_path, 'template')  # Path to the 'template' directory
@@ -28,4 +32,6 @@ class DirectoryStructure:
         self.report_base_path = os.path.join(self.base_path, 'report')  # Path to the 'report' directory
         self.scoring_base_path = os.path.join(self.base_path, 'score')  # Path to the 'score' directory
         self.input_base_path = os.path.join(self.base_path, 'input')  # Path to the 'input' directory
+        self.input_cache_base_path = os.path.join(self.base_path, 'cache', 'input')  # Path to the parsed input cache
+        self.outlier_reference_base_path = os.path.join(self.base_path, 'outlier_reference')  # Path to saved outlier references
         self.document_base_path = os.path.join(self.base_path, 'doc')  # Path to the 'doc' directory
@@ -0,0 +1,82 @@
+import threading
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class DistinctValueMap:
+    """
+    Evaluates a per-value function once per distinct value and broadcasts the results back to every position.
+
+    The values are factorized, the function runs only on distinct values it has not seen before, and the results are
+    kept for later calls. lookups and evaluations count the values mapped and the function calls made, so the hit
+    rate shows how much work the repetition in the data saved.
+    """
+
+    def __init__(self, name: str, function: Callable):
+        self.name = name
+        self.function = function
+        self.lookups = 0
+        self.evaluations = 0
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        return 1 - self.evaluations / self.lookups if self.lookups else 0.0
+
+    def map(self, values: Iterable) -> np.ndarray:
+        """
+        The function's result for every value, as an object array in the order of values.
+        """
+        values = _object_array(values)
+        codes, _ = pd.factorize(values, use_na_sentinel=False)
+        # The first occurrence of every distinct value, so the function sees the value itself (None rather than NaN)
+        _, first_positions = np.unique(codes, return_index=True)
+        distinct_values = values[first_positions]
+
+        with self._lock:
+            new_values = [value for value in distinct_values if value not in self._results]
+        new_results = [self.function(value) for value in new_values]
+        with self._lock:
+            self._results.update(zip(new_values, new_results))
+            distinct_results = _object_array(self._results[value] for value in distinct_values)
+            self.lookups += len(values)
+            self.evaluations += len(new_values)
+        return distinct_results[codes]
+
+
+class DistinctValueMemo:
+    """
+    The DistinctValueMaps of one run, by name, and their hit rates for the report.
+    """
+
+    def __init__(self):
+        self.maps: Dict[str, DistinctValueMap] = {}
+        self._lock = threading.Lock()
+
+    def map(self, name: str, function: Callable, values: Iterable) -> np.ndarray:
+        """
+        function applied to every value, evaluated once per distinct value across all calls under name.
+        """
+        with self._lock:
+            if name not in self.maps:
+                self.maps[name] = DistinctValueMap(name, function)
+            value_map = self.maps[name]
+        return value_map.map(values)
+
+    def write_report(self, report_file):
+        if not report_file or not self.maps:
+            return
+        print(f'', file=report_file)
+        print(f'--->>> Distinct value memoization <<<---', file=report_file)
+        for value_map in self.maps.values():
+            print(f'- {value_map.name}: {value_map.lookups} values, {value_map.evaluations} evaluated, '
+                  f'hit rate {value_map.hit_rate:.1%}', file=report_file)
+
+
+def _object_array(values) -> np.ndarray:
+    # Built element by element so tuples stay single values instead of becoming rows of a 2-D array
+    values = list(values)
+    return np.fromiter(values, dtype=object, count=len(values))
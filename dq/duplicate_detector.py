@@ -0,0 +1,143 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+from rdflib import URIRef
+
+# (digest, record) pairs held in memory before they are spilled to the partition files
+MAX_BUFFERED_RECORDS = 1 << 22
+PARTITIONS = 16
+# Largest duplicate groups listed in the report
+REPORTED_GROUPS = 10
+
+
+def value_digest(values: Sequence[str]) -> int:
+    """
+    64-bit digest of a tuple of values. Every value is length-prefixed, so tuples whose joined values read the same
+    (e.g. ('ab', 'c') and ('a', 'bc')) digest differently.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for value in values:
+        encoded = value.encode('utf-8')
+        h.update(len(encoded).to_bytes(8, 'little'))
+        h.update(encoded)
+    return int.from_bytes(h.digest(), 'little')
+
+
+def predicate_ref(predicate: str, namespace_manager=None) -> URIRef:
+    """
+    The predicate given as a CURIE (e.g. 'sosa:hasResult') when its prefix is bound in namespace_manager, or else as
+    a full IRI (e.g. 'urn:isbn:123').
+    """
+    prefix, _, name = predicate.partition(':')
+    if namespace_manager is not None and not name.startswith('//'):
+        namespaces = dict(namespace_manager.namespaces())
+        if prefix in namespaces:
+            return URIRef(namespaces[prefix] + name)
+    return URIRef(predicate)
+
+
+class DuplicateDetector:
+    """
+    Groups records by the 64-bit digest of their value tuple, streaming (digest, record) pairs in through add.
+
+    Up to max_buffered_records pairs are buffered in memory; beyond that they are spilled to one of partitions files
+    by digest, so all records of a digest land in the same partition and groups are found one partition at a time.
+    Records are integer positions into the caller's table, and with 64-bit digests a false duplicate needs a hash
+    collision.
+    """
+
+    def __init__(self, max_buffered_records: int = MAX_BUFFERED_RECORDS, partitions: int = PARTITIONS,
+                 spill_dir: Optional[str] = None):
+        self.max_buffered_records = max_buffered_records
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self.records = 0
+        self.group_sizes = {}
+        self._digests = []
+        self._positions = []
+        self._spill_path = None
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill_path is not None
+
+    def add(self, digest: int, position: int):
+        self._digests.append(digest)
+        self._positions.append(position)
+        self.records += 1
+        if len(self._digests) >= self.max_buffered_records:
+            self._spill()
+
+    def add_all(self, digests: Iterable[int], positions: Iterable[int]):
+        for digest, position in zip(digests, positions):
+            self.add(digest, position)
+
+    def groups(self) -> Iterator[np.ndarray]:
+        """
+        The positions of the records of every digest shared by more than one record, one array per group. The group
+        sizes are kept by digest in group_sizes.
+        """
+        try:
+            if not self.spilled:
+                yield from self._groups(*self._buffer())
+                return
+            self._spill()
+            for partition in range(self.partitions):
+                path = self._partition_path(partition)
+                if os.path.exists(path):
+                    pairs = np.fromfile(path, dtype=np.uint64).reshape(-1, 2)
+                    yield from self._groups(pairs[:, 0], pairs[:, 1].astype(np.int64))
+        finally:
+            self.close()
+
+    def close(self):
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def write_report(self, report_file):
+        if not report_file or not self.group_sizes:
+            return
+        sizes = np.array(list(self.group_sizes.values()))
+        print(f'', file=report_file)
+        print(f'--->>> Duplicate groups <<<---', file=report_file)
+        print(f'- {self.records} records, {len(sizes)} duplicate groups holding {sizes.sum()} of them, '
+              f'largest group {sizes.max()}', file=report_file)
+        largest = sorted(self.group_sizes.items(), key=lambda item: item[1], reverse=True)[:REPORTED_GROUPS]
+        for digest, size in largest:
+            print(f'\t{digest:016x}: {size}', file=report_file)
+
+    def _buffer(self):
+        digests = np.array(self._digests, dtype=np.uint64)
+        positions = np.array(self._positions, dtype=np.int64)
+        self._digests, self._positions = [], []
+        return digests, positions
+
+    def _spill(self):
+        digests, positions = self._buffer()
+        if self._spill_path is None:
+            self._spill_path = tempfile.mkdtemp(prefix='dq_duplicates_', dir=self.spill_dir)
+        partitions = digests % np.uint64(self.partitions)
+        for partition in np.unique(partitions):
+            in_partition = partitions == partition
+            pairs = np.column_stack([digests[in_partition], positions[in_partition].astype(np.uint64)])
+            with open(self._partition_path(int(partition)), 'ab') as f:
+                pairs.tofile(f)
+
+    def _partition_path(self, partition: int) -> str:
+        return os.path.join(self._spill_path, f'partition_{partition}.bin')
+
+    def _groups(self, digests: np.ndarray, positions: np.ndarray) -> Iterator[np.ndarray]:
+        if not len(digests):
+            return
+        order = np.argsort(digests, kind='stable')
+        digests, positions = digests[order], positions[order]
+        starts = np.flatnonzero(np.concatenate([[True], digests[1:] != digests[:-1]]))
+        sizes = np.diff(np.append(starts, len(digests)))
+        for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+            self.group_sizes[int(digests[start])] = int(size)
+            yield positions[start:start + size]
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import rdflib
+from rdflib import Graph
+
+from .defined_namespaces import DirectoryStructure
+
+# Bump when the cached representation changes; the rdflib version is part of the key as well, since a different
+# parser may read the same Turtle differently
+CACHE_FORMAT_VERSION = 1
+PARSER_VERSION = f"rdflib-{rdflib.__version__}-{CACHE_FORMAT_VERSION}"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+CACHE_SUFFIX = '.graph.pickle'
+
+
+class InputCache:
+    """
+    On-disk cache of parsed input graphs, keyed by the content hash of the input files and the parser version.
+
+    A hit loads the pickled rdflib graph instead of parsing the Turtle again. Entries are touched on every hit and the
+    least recently used ones are evicted once the cache grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or DirectoryStructure().input_cache_base_path
+        self.max_bytes = max_bytes
+
+    def key(self, paths: Sequence[Path]) -> str:
+        sha256 = hashlib.sha256(PARSER_VERSION.encode())
+        for path in paths:
+            file_sha256 = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    file_sha256.update(block)
+            sha256.update(file_sha256.digest())
+        return sha256.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def get(self, key: str) -> Optional[Graph]:
+        entry_path = self._entry_path(key)
+        if not os.path.exists(entry_path):
+            return None
+        try:
+            with open(entry_path, 'rb') as f:
+                graph = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        os.utime(entry_path)
+        return graph
+
+    def put(self, key: str, graph: Graph):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so a concurrent or interrupted run never sees a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError as e:
+            print(f"Could not write input cache entry {key}: {e}")
+            return
+        self.evict()
+
+    def load(self, paths: Sequence[Path], parse: Callable[[], Graph]) -> Graph:
+        """
+        Return the graph for the given input files from the cache, calling parse() and caching its result on a miss.
+        """
+        key = self.key(paths)
+        graph = self.get(key)
+        if graph is not None:
+            print(f"Loaded parsed input from cache ({key[:12]})")
+            return graph
+        graph = parse()
+        self.put(key, graph)
+        return graph
+
+    def evict(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_SUFFIX):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, name))
+            total_bytes -= size
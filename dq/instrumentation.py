@@ -0,0 +1,156 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then not recorded
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    The peak resident set size of this process so far, in MB.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+class StageRecord:
+    """
+    Wall time, CPU time, peak memory and throughput of one stage of a run.
+
+    peak_rss_mb is the process's peak resident set size so far when the stage ends, which never goes down, so it
+    stays the same for every stage after the largest one; rss_growth_mb is how far the stage raised it.
+    """
+
+    def __init__(self, name: str, parent: Optional[str] = None):
+        self.name = name
+        self.parent = parent
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_rss_mb = None
+        self.rss_growth_mb = None
+        self.peak_traced_mb = None
+        self.observations = None
+
+    @property
+    def observations_per_second(self) -> Optional[float]:
+        if not self.observations or not self.wall_time:
+            return None
+        return self.observations / self.wall_time
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'parent': self.parent,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'peak_rss_mb': self.peak_rss_mb,
+            'rss_growth_mb': self.rss_growth_mb,
+            'peak_traced_mb': self.peak_traced_mb,
+            'observations': self.observations,
+            'observations_per_second': self.observations_per_second,
+        }
+
+
+class StageTimer:
+    """
+    Records a StageRecord for every stage of a run: the steps of dq.__main__.main and, nested under 'assessments',
+    every assessment.
+
+    Every stage records its wall time, its CPU time and the growth of the process's peak RSS while it ran. CPU time is
+    the process CPU time, so stages running at the same time on other threads are included in each other's figures.
+    Top-level stages also record, with trace_memory, the peak memory allocated by Python (tracemalloc), and with
+    profile_dir set are profiled with cProfile, their stats dumped to <profile_dir>/<stage>.prof. Nested stages only
+    get the RSS growth: tracemalloc has one peak per process and only one profiler can be active per thread.
+    """
+
+    def __init__(self, profile_dir: Optional[str] = None, trace_memory: bool = False):
+        self.profile_dir = profile_dir
+        self.trace_memory = trace_memory
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def current(self) -> Optional[str]:
+        """
+        The name of the innermost stage running on this thread.
+        """
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def stage(self, name: str, observations: Optional[int] = None, parent: Optional[str] = None):
+        """
+        Time the enclosed block as stage name, nested under parent (by default the stage already running on this
+        thread). The yielded StageRecord's observations can be set inside the block once the count is known.
+        """
+        parent = parent if parent is not None else self.current()
+        record = StageRecord(name, parent)
+        record.observations = observations
+        with self._lock:
+            self.records.append(record)
+
+        top_level = parent is None
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        self._local.stack.append(name)
+
+        if top_level and self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        profiler = cProfile.Profile() if top_level and self.profile_dir else None
+
+        rss_start = peak_rss_mb()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.wall_time = time.perf_counter() - wall_start
+            record.cpu_time = time.process_time() - cpu_start
+            record.peak_rss_mb = peak_rss_mb()
+            if rss_start is not None:
+                record.rss_growth_mb = record.peak_rss_mb - rss_start
+            if top_level and self.trace_memory:
+                record.peak_traced_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+            if profiler is not None:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profiler.dump_stats(os.path.join(self.profile_dir, f"{name}.prof"))
+            self._local.stack.pop()
+
+    def write_report(self, report_file):
+        if not report_file:
+            return
+        print(f'', file=report_file)
+        print(f'--->>> Timings <<<---', file=report_file)
+        for record in self.records:
+            if record.wall_time is None:
+                continue
+            indent = '\t' if record.parent else ''
+            line = f'{indent}- {record.name}: {record.wall_time:.3f}s wall, {record.cpu_time:.3f}s CPU'
+            if record.peak_rss_mb is not None:
+                line += f', process peak RSS {record.peak_rss_mb:.1f} MB (+{record.rss_growth_mb:.1f} MB)'
+            if record.peak_traced_mb is not None:
+                line += f', peak traced {record.peak_traced_mb:.1f} MB'
+            if record.observations_per_second is not None:
+                line += f', {record.observations} observations ({record.observations_per_second:.0f}/s)'
+            print(line, file=report_file)
+
+    def write_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'stages': [record.to_dict() for record in self.records]}, f, indent=2)
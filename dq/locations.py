@@ -0,0 +1,46 @@
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def factorize_locations(longitudes, latitudes,
+                        decimals: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Factorize coordinates into distinct locations: the location code of every coordinate and the longitude and
+    latitude of every location. With decimals, coordinates are first rounded to that many decimal places, so points
+    closer together than the rounding share a location.
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    latitudes = np.asarray(latitudes, dtype=float)
+    if decimals is not None:
+        longitudes, latitudes = np.round(longitudes, decimals), np.round(latitudes, decimals)
+    # A coordinate pair as one complex number hashes both halves in a single factorize
+    codes, locations = pd.factorize(longitudes + 1j * latitudes, use_na_sentinel=False)
+    return codes, np.real(locations), np.imag(locations)
+
+
+class LocationStats:
+    """
+    The number of coordinates and of distinct locations each spatial check saw, for the report.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, coordinates: int, locations: int):
+        with self._lock:
+            total_coordinates, total_locations = self.counts.get(name, (0, 0))
+            self.counts[name] = (total_coordinates + coordinates, total_locations + locations)
+
+    def write_report(self, report_file):
+        if not report_file or not self.counts:
+            return
+        print(f'', file=report_file)
+        print(f'--->>> Location deduplication <<<---', file=report_file)
+        for name, (coordinates, locations) in self.counts.items():
+            ratio = coordinates / locations if locations else 0.0
+            print(f'- {name}: {coordinates} coordinates, {locations} distinct locations, dedupe ratio {ratio:.1f}',
+                  file=report_file)
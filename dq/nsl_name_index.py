@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .defined_namespaces import DirectoryStructure
+
+NAME_COLUMNS = ('scientificName', 'canonicalName')
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_name(name: str) -> str:
+    """
+    The form names are compared in: Unicode NFKC, case-folded, with runs of whitespace collapsed to one space.
+    """
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', str(name)).casefold()).strip()
+
+
+def name_hash(name: str) -> int:
+    """
+    64-bit hash of the normalized name.
+    """
+    return _digest(normalize_name(name))
+
+
+def _digest(normalized_name: str) -> int:
+    return int.from_bytes(hashlib.blake2b(normalized_name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def default_csv_path() -> str:
+    return os.path.join(DirectoryStructure().nsl_base_path, 'APNI-names-2024-03-27-4556.csv')
+
+
+def read_apni_names(csv_path: str) -> np.ndarray:
+    """
+    The distinct scientific and canonical names in the APNI CSV, in file order.
+    """
+    names = pd.read_csv(csv_path, usecols=lambda column: column in NAME_COLUMNS, dtype=str)
+    return pd.unique(names.stack().dropna().to_numpy())
+
+
+def file_sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class NSLNameIndex:
+    """
+    Sorted array of the 64-bit hashes of every APNI scientific name, with and without authorship, used to validate
+    scientific names.
+
+    The index is built from the APNI CSV once and written to a .npy file next to a JSON manifest holding the SHA-256
+    of the CSV; later loads read the hashes straight from the cache, and the cache is rebuilt whenever the manifest no
+    longer matches the CSV on disk. Lookups are a binary search per distinct name.
+    """
+
+    format_version = 1
+
+    def __init__(self, csv_path: Optional[str] = None, cache_dir: Optional[str] = None):
+        self.csv_path = csv_path or default_csv_path()
+        self.cache_dir = cache_dir or DirectoryStructure().nsl_cache_base_path
+        self.cache_file = os.path.join(self.cache_dir, 'apni_names.npy')
+        self.manifest_file = os.path.join(self.cache_dir, 'apni_names.json')
+        self._hashes = None
+
+    @property
+    def hashes(self) -> np.ndarray:
+        if self._hashes is None:
+            self._hashes = self.load()
+        return self._hashes
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def load(self) -> np.ndarray:
+        manifest = self.manifest()
+        hashes = self._read_cache(manifest)
+        if hashes is None:
+            hashes = self.build(manifest)
+        return hashes
+
+    def manifest(self):
+        return {'format_version': self.format_version, 'columns': list(NAME_COLUMNS), 'csv': file_sha256(self.csv_path)}
+
+    def build(self, manifest=None) -> np.ndarray:
+        distinct_names = read_apni_names(self.csv_path)
+        hashes = np.unique(np.fromiter((name_hash(name) for name in distinct_names), dtype=np.uint64,
+                                       count=len(distinct_names)))
+        try:
+            self._write_cache(hashes, manifest or self.manifest())
+        except OSError as e:
+            print(f"Could not write NSL name index cache {self.cache_file}: {e}")
+        return hashes
+
+    def contains(self, names: Iterable[str]) -> np.ndarray:
+        """
+        For every name, whether it is an APNI scientific or canonical name. Empty names are never valid.
+        """
+        normalized_names = [normalize_name(name) for name in names]
+        queries = np.fromiter((_digest(name) for name in normalized_names), dtype=np.uint64,
+                              count=len(normalized_names))
+        hashes = self.hashes
+        if len(hashes) == 0:
+            return np.zeros(len(queries), dtype=bool)
+        positions = np.minimum(np.searchsorted(hashes, queries), len(hashes) - 1)
+        return (hashes[positions] == queries) & np.array([bool(name) for name in normalized_names], dtype=bool)
+
+    def _read_cache(self, manifest):
+        if not (os.path.exists(self.manifest_file) and os.path.exists(self.cache_file)):
+            return None
+        try:
+            with open(self.manifest_file) as f:
+                if json.load(f) != manifest:
+                    return None
+            return np.load(self.cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, hashes, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Drop the old manifest first and write it last, so an interrupted build is never taken for a valid cache
+        if os.path.exists(self.manifest_file):
+            os.remove(self.manifest_file)
+        with open(self.cache_file, 'wb') as f:
+            np.save(f, hashes)
+        with open(self.manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
@@ -0,0 +1,178 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .defined_namespaces import DirectoryStructure
+from .nsl_name_index import NAME_COLUMNS, default_csv_path, file_sha256, normalize_name, read_apni_names
+
+GRAM_SIZE = 3
+# Names scored with difflib per query, taken in order of shared trigrams
+MAX_CANDIDATES = 50
+# Batches smaller than this are matched on the calling process
+PARALLEL_MIN_NAMES = 64
+
+
+def trigrams(normalized_name: str) -> List[str]:
+    """
+    The distinct character trigrams of a normalized name, padded so its first and last letters get trigrams of their
+    own.
+    """
+    padded = f"  {normalized_name} "
+    return list(dict.fromkeys(padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)))
+
+
+class NSLNameMatcher:
+    """
+    Fuzzy lookup of APNI scientific names through a character trigram inverted index.
+
+    A query only scores the names sharing the most trigrams with it, by Dice coefficient, with difflib's similarity
+    ratio, so lookups stay fast on the full APNI list. The index is built from the APNI CSV once and cached in a .npz
+    file next to a JSON manifest holding the SHA-256 of the CSV, like NSLNameIndex.
+    """
+
+    format_version = 1
+
+    def __init__(self, csv_path: Optional[str] = None, cache_dir: Optional[str] = None,
+                 max_candidates: int = MAX_CANDIDATES):
+        self.csv_path = csv_path or default_csv_path()
+        self.cache_dir = cache_dir or DirectoryStructure().nsl_cache_base_path
+        self.max_candidates = max_candidates
+        self.cache_file = os.path.join(self.cache_dir, 'apni_trigrams.npz')
+        self.manifest_file = os.path.join(self.cache_dir, 'apni_trigrams.json')
+        self.names = None
+        self._gram_index = None
+
+    def load(self):
+        """
+        Load the index from the cache, building it first when it is missing or stale.
+        """
+        if self.names is not None:
+            return self
+        manifest = {'format_version': self.format_version, 'gram_size': GRAM_SIZE, 'columns': list(NAME_COLUMNS),
+                    'csv': file_sha256(self.csv_path)}
+        index = self._read_cache(manifest)
+        if index is None:
+            index = self.build(manifest)
+        self.names, grams, self.gram_offsets, self.postings, self.gram_counts = index
+        self._gram_index = {gram: i for i, gram in enumerate(grams.tolist())}
+        return self
+
+    def build(self, manifest):
+        names = read_apni_names(self.csv_path).astype(str)
+        name_grams = [trigrams(normalize_name(name)) for name in names]
+        grams = sorted({gram for gram_list in name_grams for gram in gram_list})
+        gram_index = {gram: i for i, gram in enumerate(grams)}
+
+        gram_ids = np.fromiter((gram_index[gram] for gram_list in name_grams for gram in gram_list), dtype=np.int64)
+        gram_counts = np.array([len(gram_list) for gram_list in name_grams], dtype=np.int32)
+        name_ids = np.repeat(np.arange(len(names), dtype=np.int32), gram_counts)
+        order = np.argsort(gram_ids, kind='stable')
+        postings = name_ids[order]
+        gram_offsets = np.concatenate([[0], np.cumsum(np.bincount(gram_ids, minlength=len(grams)))]).astype(np.int64)
+        index = (np.asarray(names), np.array(grams), gram_offsets, postings, gram_counts)
+
+        try:
+            self._write_cache(index, manifest)
+        except OSError as e:
+            print(f"Could not write NSL trigram index cache {self.cache_file}: {e}")
+        return index
+
+    def match(self, name: str, cutoff: float = 0.6, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Up to limit APNI names whose similarity ratio to name is at least cutoff, most similar first.
+        """
+        self.load()
+        query = normalize_name(name)
+        query_grams = trigrams(query)
+        gram_ids = [self._gram_index[gram] for gram in query_grams if gram in self._gram_index]
+        if not query or not gram_ids:
+            return []
+
+        shared = np.bincount(np.concatenate([self.postings[self.gram_offsets[i]:self.gram_offsets[i + 1]]
+                                             for i in gram_ids]), minlength=len(self.names))
+        candidates = np.flatnonzero(shared)
+        dice = 2 * shared[candidates] / (len(query_grams) + self.gram_counts[candidates])
+        if len(candidates) > self.max_candidates:
+            candidates = candidates[np.argpartition(-dice, self.max_candidates - 1)[:self.max_candidates]]
+
+        matches = []
+        for candidate in candidates:
+            matched_name = str(self.names[candidate])
+            score = SequenceMatcher(None, query, normalize_name(matched_name)).ratio()
+            if score >= cutoff:
+                matches.append((matched_name, score))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit]
+
+    def suggest(self, names: Iterable[str], cutoff: float = 0.8, max_workers: Optional[int] = None,
+                executor=None) -> Dict[str, Optional[str]]:
+        """
+        Map every distinct name to its most similar APNI name, or None when none reaches cutoff. Large batches are
+        split across executor, or a process pool of max_workers processes when no executor is given.
+        """
+        distinct_names = list(dict.fromkeys(names))
+        # Build the cache before any worker process needs it
+        self.load()
+        max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        if len(distinct_names) < PARALLEL_MIN_NAMES or (executor is None and max_workers <= 1):
+            suggestions = _suggest_batch(self, distinct_names, cutoff)
+        else:
+            chunk_size = -(-len(distinct_names) // max_workers)
+            chunks = [distinct_names[i:i + chunk_size] for i in range(0, len(distinct_names), chunk_size)]
+            arguments = [(self.csv_path, self.cache_dir, self.max_candidates, chunk, cutoff) for chunk in chunks]
+            if executor is not None:
+                suggestions = [suggestion for future in [executor.submit(_suggest_chunk, *args) for args in arguments]
+                               for suggestion in future.result()]
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    suggestions = [suggestion for result in pool.map(_suggest_chunk, *zip(*arguments))
+                                   for suggestion in result]
+        return dict(zip(distinct_names, suggestions))
+
+    def _read_cache(self, manifest):
+        if not (os.path.exists(self.manifest_file) and os.path.exists(self.cache_file)):
+            return None
+        try:
+            with open(self.manifest_file) as f:
+                if json.load(f) != manifest:
+                    return None
+            with np.load(self.cache_file) as cache:
+                return (cache['names'], cache['grams'], cache['gram_offsets'], cache['postings'],
+                        cache['gram_counts'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cache(self, index, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Drop the old manifest first and write it last, so an interrupted build is never taken for a valid cache
+        if os.path.exists(self.manifest_file):
+            os.remove(self.manifest_file)
+        names, grams, gram_offsets, postings, gram_counts = index
+        with open(self.cache_file, 'wb') as f:
+            np.savez(f, names=names, grams=grams, gram_offsets=gram_offsets, postings=postings,
+                     gram_counts=gram_counts)
+        with open(self.manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def _suggest_batch(matcher, names, cutoff):
+    suggestions = []
+    for name in names:
+        matches = matcher.match(name, cutoff, limit=1)
+        suggestions.append(matches[0][0] if matches else None)
+    return suggestions
+
+
+# One matcher per worker process, loaded from the cache on its first chunk
+_worker_matchers = {}
+
+
+def _suggest_chunk(csv_path, cache_dir, max_candidates, names, cutoff):
+    key = (csv_path, cache_dir, max_candidates)
+    if key not in _worker_matchers:
+        _worker_matchers[key] = NSLNameMatcher(csv_path, cache_dir, max_candidates).load()
+    return _suggest_batch(_worker_matchers[key], names, cutoff)
@@ -0,0 +1,129 @@
+import re
+
+import numpy as np
+import pandas as pd
+from rdflib import Graph
+from rdflib.namespace import SOSA, TIME, GEO, RDF, RDFS
+
+from .defined_namespaces import TERN
+
+POINT_PATTERN = re.compile(r"POINT \(([^ ]+) ([^ ]+)\)")
+
+
+class ObservationFrame:
+    """
+    Columnar view of the Observation -> Sample -> Sampling chain of an ABIS graph.
+
+    The graph is walked once and every Observation -> Sample -> Sampling path becomes one row, so the assessments
+    can read geometry, time, accuracy and name values from columns instead of re-traversing the graph.
+    Observations without a tern:Sample feature of interest keep a single row with empty sample columns.
+    The rdfs:comments of the observation and the time:inXSDDateTimeStamp values of its sosa:phenomenonTime are tuples
+    of strings, as an observation may have several.
+    """
+
+    columns = ['observation', 'sample', 'procedure', 'geometry', 'longitude_text', 'latitude_text', 'longitude',
+               'latitude', 'date', 'date_datatype',
+               'has_time', 'observation_date', 'observation_date_datatype', 'observation_has_time', 'accuracy',
+               'result', 'scientific_name', 'observation_comments', 'observation_timestamps']
+
+    def __init__(self, g: Graph):
+        self.g = g
+
+    def extract(self) -> pd.DataFrame:
+        g = self.g
+        rows = []
+        for observation in g.subjects(RDF.type, TERN.Observation):
+            observation_time = next(g.objects(observation, TIME.hasTime), None)
+            observation_date = self._first_year(observation_time)
+            result = next(g.objects(observation, SOSA.hasResult), None)
+            scientific_name = None
+            if result is not None and (result, RDF.type, TERN.FeatureOfInterest) in g:
+                scientific_name = g.value(result, RDF.value)
+            common = {
+                'observation': observation,
+                'observation_date': None if observation_date is None else str(observation_date),
+                'observation_date_datatype': None if observation_date is None else observation_date.datatype,
+                'observation_has_time': observation_time is not None,
+                'result': result,
+                'scientific_name': None if scientific_name is None else str(scientific_name),
+                'observation_comments': self._comments(observation),
+                'observation_timestamps': tuple(str(timestamp)
+                                                for phenomenon_time in g.objects(observation, SOSA.phenomenonTime)
+                                                for timestamp in g.objects(phenomenon_time,
+                                                                           TIME.inXSDDateTimeStamp)),
+            }
+
+            paths = [(sample, procedure)
+                     for sample in g.objects(observation, SOSA.hasFeatureOfInterest)
+                     if (sample, RDF.type, TERN.Sample) in g
+                     for procedure in (list(g.objects(sample, SOSA.isResultOf)) or [None])]
+            if not paths:
+                paths = [(None, None)]
+
+            for sample, procedure in paths:
+                rows.append({**common, 'sample': sample, 'procedure': procedure,
+                             **self._procedure_values(procedure)})
+
+        # Keep the RDF terms as objects rather than letting pandas coerce them to plain strings
+        frame = pd.DataFrame(rows, columns=self.columns, dtype=object)
+        frame = frame.astype({'longitude': float, 'latitude': float, 'has_time': bool, 'observation_has_time': bool})
+        return frame
+
+    def _procedure_values(self, procedure):
+        values = {'geometry': None, 'longitude_text': None, 'latitude_text': None, 'longitude': np.nan,
+                  'latitude': np.nan, 'date': None, 'date_datatype': None, 'has_time': False, 'accuracy': None}
+        if procedure is None:
+            return values
+        g = self.g
+
+        geometry_node = next(g.objects(procedure, GEO.hasGeometry), None)
+        if geometry_node is not None:
+            geometry = next(g.objects(geometry_node, GEO.asWKT), None)
+            if geometry:
+                values['geometry'] = str(geometry)
+                values['longitude_text'], values['latitude_text'] = split_point(str(geometry))
+                values['longitude'], values['latitude'] = point_coordinates(values['longitude_text'],
+                                                                            values['latitude_text'])
+
+        observation_time = next(g.objects(procedure, TIME.hasTime), None)
+        date_literal = self._first_year(observation_time)
+        values['has_time'] = observation_time is not None
+        if date_literal is not None:
+            values['date'] = str(date_literal)
+            values['date_datatype'] = date_literal.datatype
+
+        accuracy = next(g.objects(procedure, GEO.hasMetricSpatialAccuracy), None)
+        if accuracy is not None:
+            values['accuracy'] = str(accuracy)
+        return values
+
+    def _comments(self, node):
+        return tuple(str(comment) for comment in self.g.objects(node, RDFS.comment))
+
+    def _first_year(self, time_node):
+        if time_node is None:
+            return None
+        return next(self.g.objects(time_node, TIME.inXSDgYear), None)
+
+
+def split_point(wkt: str):
+    """
+    The longitude and latitude strings of a WKT point, or (None, None) when wkt holds no point.
+    """
+    match = POINT_PATTERN.search(wkt)
+    if match:
+        return match.groups()
+    return None, None
+
+
+def point_coordinates(longitude, latitude):
+    if longitude is not None:
+        try:
+            return float(longitude), float(latitude)
+        except ValueError:
+            pass
+    return np.nan, np.nan
+
+
+def parse_point(wkt: str):
+    return point_coordinates(*split_point(wkt))
@@ -0,0 +1,60 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# The createme.org URIs of the ABIS records; the captured number is the record's observation id
+DEFAULT_PATTERNS = (
+    r"http://createme.org/attribute/basisOfRecord/(\d+)",
+    r"http://createme.org/attribute/kingdom/(\d+)",
+    r"http://createme.org/observation/scientificName/(\d+)",
+    r"http://createme.org/sample/field/(\d+)",
+    r"http://createme.org/sample/specimen/(\d+)",
+    r"http://createme.org/sampling/field/(\d+)",
+    r"http://createme.org/sampling/specimen/(\d+)",
+    r"http://createme.org/scientificName/(\d+)",
+    r"http://createme.org/value/basisOfRecord/(\d+)",
+    r"http://createme.org/value/kingdom/(\d+)",
+)
+
+
+class ObservationIdExtractor:
+    """
+    Maps a record URI to the observation id it belongs to: the number captured by the first pattern matching at the
+    start of the URI, or None when none does.
+
+    The patterns are compiled into one alternation, so a URI is matched in a single pass, and the ids of the most
+    recently seen URIs are memoized, since every observation's URI is looked up once per assessment.
+    """
+
+    def __init__(self, patterns: Iterable[str] = DEFAULT_PATTERNS, cache_size: Optional[int] = 1 << 20):
+        self.patterns = list(patterns)
+        for pattern in self.patterns:
+            if re.compile(pattern).groups != 1:
+                raise ValueError(f"Observation id pattern '{pattern}' must have exactly one capturing group")
+        self._regex = re.compile('|'.join(f'(?:{pattern})' for pattern in self.patterns))
+        self._extract = lru_cache(maxsize=cache_size)(self._match)
+
+    def with_patterns(self, patterns: Iterable[str]) -> 'ObservationIdExtractor':
+        """
+        An extractor trying patterns before the ones of this extractor.
+        """
+        return ObservationIdExtractor(list(patterns) + self.patterns, self._extract.cache_info().maxsize)
+
+    def _match(self, record_uri):
+        match = self._regex.match(record_uri)
+        if match is None:
+            return None
+        # Every branch has a single group, so the last group that matched holds the id
+        try:
+            return int(match.group(match.lastindex))
+        except ValueError:
+            return None
+
+    def __call__(self, record_uri) -> Optional[int]:
+        return self._extract(str(record_uri))
+
+    def cache_info(self):
+        return self._extract.cache_info()
+
+
+default_extractor = ObservationIdExtractor()
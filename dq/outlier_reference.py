@@ -0,0 +1,125 @@
+import os
+import re
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from .defined_namespaces import DirectoryStructure
+
+# Bump when the saved layout changes; references saved with another format version are refused
+FORMAT_VERSION = 1
+REFERENCE_FILE_PATTERN = re.compile(r"outlier_reference_v(\d+)\.joblib$")
+# Expected share of outliers the isolation forest and robust covariance models label; scikit-learn takes (0, 0.5]
+DEFAULT_CONTAMINATION = 0.1
+
+
+class OutlierReference:
+    """
+    Outlier models and statistics fitted once on a reference corpus.
+
+    Holds the fitted IsolationForest and EllipticEnvelope for coordinates, the coordinate quartiles and mean/standard
+    deviation, and the date quartiles. Assessments given a reference only score new data against it (predict), so
+    small submissions are judged against the reference distribution rather than against themselves.
+    """
+
+    def __init__(self, isolation_forest, robust_covariance, coordinate_quartiles, coordinate_moments,
+                 date_quartiles=None, metadata=None):
+        self.isolation_forest = isolation_forest
+        self.robust_covariance = robust_covariance
+        # {'latitude': (q1, q3), 'longitude': (q1, q3)}
+        self.coordinate_quartiles = coordinate_quartiles
+        # {'latitude': (mean, std), 'longitude': (mean, std)}
+        self.coordinate_moments = coordinate_moments
+        # (q1, q3) of the observation dates, or None when the reference corpus had none
+        self.date_quartiles = date_quartiles
+        self.metadata = metadata or {}
+
+    @classmethod
+    def fit(cls, coordinates, dates=None, contamination=DEFAULT_CONTAMINATION, random_state=42):
+        """
+        Fit the reference from an (n, 2) array of (latitude, longitude) pairs and, optionally, an array of dates in
+        the numeric form the date assessments use (gYear integers or date ordinals).
+        """
+        from sklearn import __version__ as sklearn_version
+        from sklearn.covariance import EllipticEnvelope
+        from sklearn.ensemble import IsolationForest
+
+        coordinates = np.asarray(coordinates, dtype=float)
+        if len(coordinates) < 4:
+            raise ValueError("At least 4 coordinates are needed to fit an outlier reference")
+
+        isolation_forest = IsolationForest(contamination=contamination, random_state=random_state)
+        isolation_forest.fit(coordinates)
+        robust_covariance = EllipticEnvelope(contamination=contamination, random_state=random_state)
+        robust_covariance.fit(coordinates)
+
+        coordinate_quartiles = {}
+        coordinate_moments = {}
+        for column, name in enumerate(['latitude', 'longitude']):
+            values = coordinates[:, column]
+            coordinate_quartiles[name] = tuple(float(q) for q in np.percentile(values, [25, 75]))
+            coordinate_moments[name] = (float(np.mean(values)), float(np.std(values)))
+
+        date_quartiles = None
+        if dates is not None and len(dates):
+            date_quartiles = tuple(float(q) for q in np.percentile(dates, [25, 75]))
+
+        metadata = {
+            'format_version': FORMAT_VERSION,
+            'created': datetime.now().isoformat(),
+            'sklearn_version': sklearn_version,
+            'contamination': contamination,
+            'coordinate_count': len(coordinates),
+            'date_count': 0 if dates is None else len(dates),
+        }
+        return cls(isolation_forest, robust_covariance, coordinate_quartiles, coordinate_moments, date_quartiles,
+                   metadata)
+
+
+class OutlierReferenceStore:
+    """
+    Versioned directory of saved outlier references (outlier_reference_v1.joblib, outlier_reference_v2.joblib, ...).
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or DirectoryStructure().outlier_reference_base_path
+
+    def versions(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(int(match.group(1)) for match in map(REFERENCE_FILE_PATTERN.match, os.listdir(self.directory))
+                      if match)
+
+    def path(self, version: int) -> str:
+        return os.path.join(self.directory, f"outlier_reference_v{version}.joblib")
+
+    def save(self, reference: OutlierReference) -> int:
+        import joblib
+
+        os.makedirs(self.directory, exist_ok=True)
+        version = max(self.versions(), default=0) + 1
+        reference.metadata['version'] = version
+        joblib.dump(reference, self.path(version))
+        return version
+
+    def load(self, version: Optional[int] = None) -> OutlierReference:
+        import joblib
+        from sklearn import __version__ as sklearn_version
+
+        versions = self.versions()
+        if not versions:
+            raise FileNotFoundError(f"No outlier reference saved in {self.directory}")
+        if version is None:
+            version = versions[-1]
+        elif version not in versions:
+            raise FileNotFoundError(f"Outlier reference version {version} not found in {self.directory}")
+
+        reference = joblib.load(self.path(version))
+        if reference.metadata.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Outlier reference version {version} was saved in format "
+                             f"{reference.metadata.get('format_version')}, expected {FORMAT_VERSION}")
+        if reference.metadata.get('sklearn_version') != sklearn_version:
+            print(f"Outlier reference version {version} was fitted with scikit-learn "
+                  f"{reference.metadata.get('sklearn_version')}, running {sklearn_version}")
+        return reference
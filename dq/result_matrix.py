@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+class ResultMatrix:
+    """
+    Accumulates assessment labels per observation and materialises them as the result matrix DataFrame.
+
+    Each observation id is mapped to a row number once, and every column keeps the (row, value) pairs recorded for
+    it, so adding a result is a dictionary lookup instead of a scan and copy of the whole DataFrame. Label columns
+    are float64, 1.0 where the label was assigned and NaN elsewhere; only the columns holding the extra values of a
+    result (e.g. a suggested name) are object columns.
+    """
+
+    def __init__(self, columns):
+        self.columns = ['observation_id'] + [column for column in columns if column != 'observation_id']
+        self._cells = {column: ([], []) for column in self.columns[1:]}
+        self._observation_ids = []
+        self._row_index = {}
+        self._value_columns = set()
+
+    def __len__(self):
+        return len(self._observation_ids)
+
+    def _row(self, observation_id):
+        row = self._row_index.get(observation_id) if observation_id is not None else None
+        if row is None:
+            row = len(self._observation_ids)
+            self._observation_ids.append(observation_id)
+            # Results without a recognised observation id each get a row of their own
+            if observation_id is not None:
+                self._row_index[observation_id] = row
+        return row
+
+    def _set(self, row, column, value):
+        if column not in self._cells:
+            self.columns.append(column)
+            self._cells[column] = ([], [])
+        rows, values = self._cells[column]
+        rows.append(row)
+        values.append(value)
+
+    def add(self, observation_id, field_name, extra_field=None, extra_value=None):
+        row = self._row(observation_id)
+        self._set(row, field_name, 1.0)
+        if extra_field is not None and extra_value is not None:
+            self._value_columns.add(extra_field)
+            self._set(row, extra_field, extra_value)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        row_count = len(self._observation_ids)
+        data = {'observation_id': pd.Series(self._observation_ids, dtype=object)}
+        for column, (rows, values) in self._cells.items():
+            dtype = object if column in self._value_columns else np.float64
+            column_values = np.full(row_count, np.nan, dtype=dtype)
+            if rows:
+                column_values[np.array(rows, dtype=np.intp)] = np.array(values, dtype=dtype)
+            # An explicit dtype, or pandas would infer a string dtype for value columns holding strings
+            data[column] = pd.Series(column_values, dtype=dtype)
+        return pd.DataFrame(data, columns=self.columns)
@@ -0,0 +1,110 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+from rdflib import Graph, URIRef, Literal, BNode, SOSA, SDO, XSD
+
+from .defined_namespaces import DQAF
+
+# Characters escaped in the lexical form of an N-Triples literal
+_LITERAL_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+
+class ResultsWriter:
+    """
+    Append-only writer for assessment, use case and scoring results.
+
+    Every result becomes four N-Triples lines (subject dqaf:hasDQAFResult _:result, plus the result's observed
+    property, value and result time) that are buffered and appended to the destination file in batches, so the input
+    graph is never modified and later stages add their results without re-parsing the earlier output. N-Triples is a
+    subset of Turtle, so the file can still be read as .ttl. Without a destination the lines are kept in memory.
+    The lines are formatted here rather than by rdflib, whose per-triple N-Triples helper is private; whole graphs
+    still go through Graph.serialize.
+    """
+
+    def __init__(self, destination: Optional[str] = None, append: bool = False, batch_size: int = 10000):
+        self.destination = destination
+        self.batch_size = batch_size
+        self.lines = []
+        self.result_count = 0
+        if destination is not None and not append:
+            open(destination, 'w', encoding='utf-8').close()
+        elif destination is not None and os.path.exists(destination) and os.path.getsize(destination):
+            # Appended lines must start on a line of their own
+            with open(destination, 'rb+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_triple(self, triple):
+        self.lines.append(_nt_line(triple))
+        if self.destination is not None and len(self.lines) >= self.batch_size:
+            self.flush()
+
+    def add_result(self, subject, observed_property, value, result_time=None):
+        if result_time is None:
+            result_time = datetime.now()
+        result_bn = BNode()
+        self.add_triple((subject, DQAF.hasDQAFResult, result_bn))
+        self.add_triple((result_bn, SOSA.observedProperty, observed_property))
+        self.add_triple((result_bn, SDO.value, value if isinstance(value, (URIRef, Literal)) else Literal(value)))
+        self.add_triple((result_bn, SOSA.resultTime, Literal(result_time, datatype=XSD.dateTime)))
+        self.result_count += 1
+
+    def add_graph(self, g: Graph):
+        """
+        Append every triple of g, e.g. the input data the results refer to.
+        """
+        self.flush()
+        if self.destination is None:
+            self.lines.extend(_nt_line(triple) for triple in g)
+        else:
+            with open(self.destination, 'ab') as f:
+                g.serialize(destination=f, format='nt', encoding='utf-8')
+
+    def flush(self):
+        if self.destination is None or not self.lines:
+            return
+        with open(self.destination, 'a', encoding='utf-8') as f:
+            f.writelines(self.lines)
+        self.lines = []
+
+    def close(self):
+        self.flush()
+
+    def graph(self) -> Graph:
+        """
+        The results written so far as an rdflib Graph.
+        """
+        self.flush()
+        if self.destination is None:
+            return Graph().parse(data=''.join(self.lines), format='nt')
+        return Graph().parse(self.destination, format='turtle')
+
+
+def _nt_line(triple) -> str:
+    return ' '.join(_nt_term(term) for term in triple) + ' .\n'
+
+
+def _nt_term(term) -> str:
+    """
+    The N-Triples form of an IRI, blank node or literal, with the literal's lexical form escaped per RDF 1.1
+    N-Triples.
+    """
+    if isinstance(term, BNode):
+        return f'_:{term}'
+    if isinstance(term, URIRef):
+        return f'<{term}>'
+    lexical = str(term).translate(_LITERAL_ESCAPES)
+    if term.language:
+        return f'"{lexical}"@{term.language}'
+    if term.datatype:
+        return f'"{lexical}"^^<{term.datatype}>'
+    return f'"{lexical}"'
+
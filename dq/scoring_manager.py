@@ -1,12 +1,13 @@
 import datetime
+import os
+import shutil
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
-import rdflib
-from rdflib import URIRef, Literal, BNode, SOSA, SDO, XSD
+from rdflib import URIRef, Literal
 
-from .defined_namespaces import DQAF
+from .results_writer import ResultsWriter
 from .vocab_manager import VocabManager
 
 
@@ -18,10 +19,15 @@ class ScoringManager:
         self.report_file = report_file
         self.scoring_df = None
         self.results_ttl = results_ttl
-        self.results_graph = rdflib.Graph()
-        self.results_graph.parse(self.results_ttl, format="turtle")
+        # Results are appended to a copy of the earlier output instead of parsing and re-serialising it
+        if os.path.abspath(self.results_ttl) != os.path.abspath(self.output_result_file):
+            shutil.copyfile(self.results_ttl, self.output_result_file)
+        self.results_writer = ResultsWriter(self.output_result_file, append=True)
         self.label_manager = VocabManager()
         self.scoring_matrix = {}
+        self.scoring_method_names = []
+        self.assertion_keys = []
+        self.scoring_weights = None
         self.create_scoring_matrix()
         self.result_matrix_df = assess_matrix_df
 
@@ -40,79 +46,70 @@ class ScoringManager:
         print("Scoring Matrix:")
         print(self.scoring_matrix)
 
-    @staticmethod
-    def extract_record_number(record_uri):
-        try:
-            return int(record_uri.split('/')[-1])
-        except ValueError:
-            return None
-
-    def apply_scoring_methods(self):
-
-        for scoring_method, conditions in self.scoring_matrix.items():
-            assessment_name = "Scoring Method Applying: " + scoring_method
-            total_assessments = 0
-            result_counts = {'Max': 0, 'Min': 0, 'Avg': 0}
-
-            scoring_results = []
+        self.compile_scoring_matrix()
+
+    def compile_scoring_matrix(self):
+        """
+        Compile the weighting sheet into a weight matrix (scoring methods x assertion columns), so every scoring
+        method can be applied to all observations with a single matrix product.
+        """
+        self.scoring_method_names = list(self.scoring_matrix.keys())
+        self.assertion_keys = []
+        for conditions in self.scoring_matrix.values():
+            for key in flatten_dictionary(conditions):
+                if key not in self.assertion_keys:
+                    self.assertion_keys.append(key)
+
+        key_index = {key: i for i, key in enumerate(self.assertion_keys)}
+        self.scoring_weights = np.zeros((len(self.scoring_method_names), len(self.assertion_keys)))
+        for i, conditions in enumerate(self.scoring_matrix.values()):
             scoring_vector, scoring_keys = dictionary_to_vector_and_keys(conditions)
+            self.scoring_weights[i, [key_index[key] for key in scoring_keys]] = scoring_vector
 
+    def assertion_matrix(self):
+        """
+        The 0/1 observation x assertion matrix for the compiled assertion columns of the result matrix.
+        """
+        return (self.result_matrix_df[self.assertion_keys] == 1.0).to_numpy(dtype=np.float64)
 
-            for _, row in self.result_matrix_df.iterrows():
-
-                row_vector = [1 if row[key] == 1.0 else 0 for key in scoring_keys]
-                dot_product = np.dot(scoring_vector, row_vector)
-                formatted_mapped_value = f"{dot_product:.4f}"
-
-                scoring_results.append(float(formatted_mapped_value))
-
-
-            min_score = min(scoring_results)
-            max_score = max(scoring_results)
-
-            print('Scoring Min, Max', min_score,max_score)
-            if max_score == min_score:
-                raise ValueError("max_score must be greater than min_score")
-
+    def apply_scoring_methods(self):
+        observation_ids = self.result_matrix_df['observation_id'].tolist()
+        raw_scores = np.round(self.assertion_matrix() @ self.scoring_weights.T, 4)
 
-            scoring_results = []
-            for _, row in self.result_matrix_df.iterrows():
-                total_assessments += 1
-                row_vector = [1 if row[key] == 1.0 else 0 for key in scoring_keys]
-                dot_product = np.dot(scoring_vector, row_vector)
+        min_scores = raw_scores.min(axis=0)
+        max_scores = raw_scores.max(axis=0)
+        print('Scoring Min, Max', min_scores, max_scores)
+        if np.any(max_scores == min_scores):
+            raise ValueError("max_score must be greater than min_score")
 
-                mapped_value = (dot_product - min_score) / (max_score - min_score)
-                formatted_mapped_value = f"{mapped_value:.4f}"
+        scores = np.round((raw_scores - min_scores) / (max_scores - min_scores), 4)
 
-                scoring_results.append(float(formatted_mapped_value))
+        for i, scoring_method in enumerate(self.scoring_method_names):
+            assessment_name = "Scoring Method Applying: " + scoring_method
+            scoring_results = scores[:, i]
+            total_assessments = len(scoring_results)
 
-                self._add_scoring_result(scoring_method, row['observation_id'], formatted_mapped_value)
+            for observation_id, score in zip(observation_ids, scoring_results):
+                self._add_scoring_result(scoring_method, observation_id, f"{score:.4f}")
 
             self.result_matrix_df[scoring_method] = scoring_results
-            result_counts['Min'] = min(scoring_results)
-            result_counts['Avg'] = sum(scoring_results) / len(scoring_results) if scoring_results != 0 else 'NA'
-            result_counts['Max'] = max(scoring_results)
-
-
+            result_counts = {'Max': float(scoring_results.max()),
+                             'Min': float(scoring_results.min()),
+                             'Avg': float(scoring_results.mean())}
 
             self.add_to_report(assessment_name, total_assessments, result_counts)
 
-        self.results_graph.serialize(destination=self.output_result_file, format="turtle")
+        self.results_writer.close()
 
     def _add_scoring_result(self, scoring_method, observation_id, value, scoring_date=None):
         subject = URIRef(f"http://example.com/scoring_assessment/{scoring_method}/{observation_id}")
         assessment_type = URIRef(f"http://example.com/scoring_assessment/{scoring_method}/")
-        result_bn = BNode()
-        self.results_graph.add((subject, DQAF.hasDQAFResult, result_bn))
-        self.results_graph.add((result_bn, SOSA.observedProperty, assessment_type))
-
-        self.results_graph.add((result_bn, SDO.value, Literal(value)))
         if scoring_date is None:
             scoring_date = datetime.now()
         elif isinstance(scoring_date, datetime.date) and not isinstance(scoring_date, datetime.datetime):
             scoring_date = datetime.datetime.combine(scoring_date, datetime.time.min)
 
-        self.results_graph.add((result_bn, SOSA.resultTime, Literal(scoring_date, datatype=XSD.dateTime)))
+        self.results_writer.add_result(subject, assessment_type, Literal(value), scoring_date)
 
     def add_to_report(self, scoring_name, total_scoring_applied, result_counts):
         if self.report_file:
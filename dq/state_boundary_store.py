@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import shapely
+
+SHAPEFILE_EXTENSIONS = ('.shp', '.shx', '.dbf', '.prj')
+
+
+class StateBoundaryStore:
+    """
+    Binary cache of the reprojected state boundary polygons used by AustraliaGeographyChecker.
+
+    The state shapefiles are read, reprojected to EPSG:4326 and (optionally) simplified once, then written as WKB
+    into a single .npz file next to a JSON manifest holding the SHA-256 of every source shapefile component.
+    Later loads read the polygons straight from the cache, and the cache is rebuilt whenever the manifest no longer
+    matches the shapefiles on disk.
+    """
+
+    format_version = 1
+
+    def __init__(self, states_shapefiles, cache_dir, simplify_tolerance=0.0):
+        self.states_shapefiles = states_shapefiles
+        self.cache_dir = cache_dir
+        self.simplify_tolerance = simplify_tolerance
+        self.cache_file = os.path.join(cache_dir, 'state_boundaries.npz')
+        self.manifest_file = os.path.join(cache_dir, 'state_boundaries.json')
+
+    def load(self):
+        """
+        Return (state_names, polygons, polygon_state) from the cache, building it first when it is missing or stale.
+        polygon_state holds, for every polygon, the position of its state in state_names.
+        """
+        manifest = self.manifest()
+        boundaries = self._read_cache(manifest)
+        if boundaries is None:
+            boundaries = self.build(manifest)
+        return boundaries
+
+    def manifest(self):
+        return {
+            'format_version': self.format_version,
+            'simplify_tolerance': self.simplify_tolerance,
+            'shapefiles': {state_name: _shapefile_digest(shapefile)
+                           for state_name, shapefile in self.states_shapefiles.items()},
+        }
+
+    def build(self, manifest=None):
+        # geopandas is only needed when the cache has to be (re)built
+        import geopandas as gpd
+
+        state_names = list(self.states_shapefiles.keys())
+        state_geometries = []
+        for shapefile in self.states_shapefiles.values():
+            geometries = gpd.read_file(shapefile).to_crs(epsg=4326).geometry.to_numpy()
+            if self.simplify_tolerance:
+                geometries = shapely.simplify(geometries, self.simplify_tolerance, preserve_topology=True)
+            state_geometries.append(geometries)
+
+        polygons = np.concatenate(state_geometries) if state_geometries else np.array([], dtype=object)
+        polygon_state = np.repeat(np.arange(len(state_names)), [len(geometries) for geometries in state_geometries])
+
+        try:
+            self._write_cache(state_names, polygons, polygon_state, manifest or self.manifest())
+        except OSError as e:
+            print(f"Could not write state boundary cache {self.cache_file}: {e}")
+        return state_names, polygons, polygon_state
+
+    def _read_cache(self, manifest):
+        if not (os.path.exists(self.manifest_file) and os.path.exists(self.cache_file)):
+            return None
+        try:
+            with open(self.manifest_file) as f:
+                if json.load(f) != manifest:
+                    return None
+            with np.load(self.cache_file) as cache:
+                state_names = cache['state_names'].tolist()
+                polygon_state = cache['polygon_state']
+                offsets = cache['wkb_offsets']
+                wkb = cache['wkb'].tobytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        polygons = shapely.from_wkb([wkb[start:end] or None for start, end in zip(offsets[:-1], offsets[1:])])
+        return state_names, np.asarray(polygons, dtype=object), polygon_state
+
+    def _write_cache(self, state_names, polygons, polygon_state, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        wkb = [bytes(geometry) if geometry is not None else b'' for geometry in shapely.to_wkb(polygons)]
+        offsets = np.concatenate([[0], np.cumsum([len(geometry) for geometry in wkb])]).astype(np.int64)
+
+        # Drop the old manifest first and write it last, so an interrupted build is never taken for a valid cache
+        if os.path.exists(self.manifest_file):
+            os.remove(self.manifest_file)
+        with open(self.cache_file, 'wb') as f:
+            np.savez(f, state_names=np.array(state_names), polygon_state=polygon_state.astype(np.int64),
+                     wkb_offsets=offsets, wkb=np.frombuffer(b''.join(wkb), dtype=np.uint8))
+        with open(self.manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def _shapefile_digest(shapefile):
+    stem, _ = os.path.splitext(shapefile)
+    digest = {}
+    for extension in SHAPEFILE_EXTENSIONS:
+        path = stem + extension
+        if os.path.exists(path):
+            sha256 = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    sha256.update(block)
+            digest[extension] = sha256.hexdigest()
+    return digest
@@ -0,0 +1,320 @@
+import argparse
+import os
+import random
+import sys
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PREFIXES = """@prefix bdrm: <https://linked.data.gov.au/def/bdr-msg/> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix dwc: <http://rs.tdwg.org/dwc/terms/> .
+@prefix foaf: <http://xmlns.com/foaf/0.1/> .
+@prefix geo: <http://www.opengis.net/ont/geosparql#> .
+@prefix prov: <http://www.w3.org/ns/prov#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix sosa: <http://www.w3.org/ns/sosa/> .
+@prefix tern: <https://w3id.org/tern/ontologies/tern/> .
+@prefix time: <http://www.w3.org/2006/time#> .
+@prefix void: <http://rdfs.org/ns/void#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+BASE = "http://createme.org"
+DATASET = "https://linked.data.gov.au/dataset/bdr/dataset/1ec4d3ba-40e8-4ece-b9c4-bcd80a9a997c"
+NAME_MATCH_AGENT = "https://github.com/bio-org-au/api/releases/tag/v0.0.7"
+VALID_CRS = "http://www.opengis.net/def/crs/EPSG/0/4283"
+# ED50 and an unassigned code: neither is one of the datums DatumChecker accepts
+INVALID_CRS = ["http://www.opengis.net/def/crs/EPSG/0/4230", "http://www.opengis.net/def/crs/EPSG/0/9999"]
+
+# (verbatim name, NSL matched name, scientificNameID, kingdom)
+NAMES = [
+    ("CANIS FAMILIARIS", "Canis familiaris Linnaeus, 1758", "https://id.biodiversity.org.au/name/afd/70400373",
+     "Animalia"),
+    ("Crossandra nilotica", "Crossandra nilotica Oliv.", "https://id.biodiversity.org.au/name/apni/231037", "Plantae"),
+    ("Amaranthus lineatus", "Amaranthus lineatus R.Br.", "https://id.biodiversity.org.au/name/apni/85258", "Plantae"),
+    ("Deeringia arborescens", "Deeringia arborescens (R.Br.) Druce",
+     "https://id.biodiversity.org.au/name/apni/84392", "Plantae"),
+    ("Trianthema turgidifolia", "Trianthema turgidifolia F.Muell.",
+     "https://id.biodiversity.org.au/name/apni/247252", "Plantae"),
+    ("Ptilotus johnstonianus", "Ptilotus johnstonianus W.Fitzg.",
+     "https://id.biodiversity.org.au/name/apni/245614", "Plantae"),
+    ("Acanthus ebracteatus subsp. ebarbatus", "Acanthus ebracteatus subsp. ebarbatus R.M.Barker",
+     "https://id.biodiversity.org.au/name/apni/72710", "Plantae"),
+    ("Butomus latifolius", "Butomus latifolius D.Don", "https://id.biodiversity.org.au/name/apni/206701", "Plantae"),
+]
+
+# (latitude, longitude, jitter in degrees) of inland areas records are scattered around
+REGIONS = [
+    (-33.5, 148.5, 2.0), (-37.2, 144.5, 1.5), (-27.0, 151.0, 2.0), (-19.8, 147.0, 1.5), (-31.5, 117.5, 2.0),
+    (-34.0, 139.0, 1.5), (-23.7, 133.9, 3.0), (-42.0, 146.5, 0.8), (-14.5, 132.3, 1.5), (-35.3, 149.1, 0.3),
+]
+# Points in the sea just off the coast: still near Australia, but outside every state
+OFFSHORE = [(-38.9, 150.5), (-33.0, 114.2), (-12.0, 127.5), (-40.5, 144.0), (-24.0, 154.5), (-36.5, 137.2)]
+# Far from every other record
+OUTLIERS = [(48.85, 2.35), (40.71, -74.0), (-54.5, 158.9), (35.68, 139.69), (0.0, 0.0)]
+
+BASIS_OF_RECORD = ["PreservedSpecimen", "HumanObservation", "MachineObservation"]
+ACCURACIES = ["1e+01", "1e+02", "1e+03", "4.5e+03", "1e+04", "2e+04"]
+LOCATIONS = ["6 KM SW OF SHIP ROCK", "YAAMBA OIL SHALE PROJECT", "162 Coral Lane", "NEAR CREEK CROSSING"]
+
+DEFECTS = ('bad_datum', 'empty_name', 'outlier', 'offshore')
+DEFAULT_DEFECT_RATES = {'bad_datum': 0.02, 'empty_name': 0.02, 'outlier': 0.01, 'offshore': 0.02}
+
+
+class SyntheticABISGenerator:
+    """
+    Deterministic generator of ABIS-shaped Turtle with the structure of dq/input/chunk_1.ttl.
+
+    Each record has a CreateMessage part list, a scientificName Observation with its NSL name match Observation,
+    kingdom attribute, field Sample and Sampling (geometry, gYear time) and, for most records, a specimen Sample and
+    Sampling with basisOfRecord and sometimes geo:hasMetricSpatialAccuracy. Defects are injected at the given
+    per-record rates: bad_datum (a CRS other than the accepted datums), empty_name, outlier (a point far outside
+    Australia) and offshore (a point in the sea off the coast). The same seed always yields the same files.
+    """
+
+    def __init__(self, record_count: int, seed: int = 42, defect_rates: Optional[Dict[str, float]] = None,
+                 records_per_file: int = 10000, specimen_rate: float = 0.75):
+        self.record_count = record_count
+        self.seed = seed
+        self.defect_rates = dict(DEFAULT_DEFECT_RATES if defect_rates is None else defect_rates)
+        unknown = set(self.defect_rates) - set(DEFECTS)
+        if unknown:
+            raise KeyError(f"Unknown defect(s): {', '.join(sorted(unknown))}")
+        self.records_per_file = records_per_file
+        self.specimen_rate = specimen_rate
+        self.defect_counts = Counter()
+
+    def write(self, directory: str) -> List[Path]:
+        """
+        Write the records to chunk_1.ttl, chunk_2.ttl, ... in directory, records_per_file records each, and return
+        the file paths. The counts of injected defects are left in defect_counts.
+        """
+        rng = random.Random(self.seed)
+        self.defect_counts = Counter()
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        message = f"{BASE}/{uuid.UUID(int=rng.getrandbits(128))}"
+        for chunk, start in enumerate(range(1, self.record_count + 1, self.records_per_file), start=1):
+            path = Path(directory) / f"chunk_{chunk}.ttl"
+            end = min(start + self.records_per_file, self.record_count + 1)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(PREFIXES)
+                f.write(self._shared_resources())
+                for record in range(start, end):
+                    f.write(self._record(rng, message, record))
+            paths.append(path)
+        return paths
+
+    def _defect(self, rng: random.Random, defect: str) -> bool:
+        if rng.random() < self.defect_rates.get(defect, 0.0):
+            self.defect_counts[defect] += 1
+            return True
+        return False
+
+    @staticmethod
+    def _shared_resources() -> str:
+        return f"""<{NAME_MATCH_AGENT}> a prov:Agent,
+        prov:SoftwareAgent ;
+    foaf:name "NSL name match API" .
+
+<{BASE}/location/Australia> a tern:FeatureOfInterest ;
+    void:inDataset <{DATASET}> ;
+    geo:hasGeometry [ a geo:Geometry ;
+            geo:sfWithin <https://sws.geonames.org/2077456/> ] ;
+    tern:featureType <http://linked.data.gov.au/def/tern-cv/5bf7ae21-a454-440b-bdd7-f2fe982d8de4> .
+
+"""
+
+    def _record(self, rng: random.Random, message: str, i: int) -> str:
+        verbatim_name, matched_name, name_id, kingdom = rng.choice(NAMES)
+        if self._defect(rng, 'empty_name'):
+            verbatim_name = ""
+
+        if self._defect(rng, 'outlier'):
+            lat, long = rng.choice(OUTLIERS)
+        elif self._defect(rng, 'offshore'):
+            lat, long = rng.choice(OFFSHORE)
+        else:
+            lat, long, jitter = rng.choice(REGIONS)
+            lat, long = lat + rng.uniform(-jitter, jitter), long + rng.uniform(-jitter, jitter)
+        decimals = rng.randint(1, 6)
+        crs = rng.choice(INVALID_CRS) if self._defect(rng, 'bad_datum') else VALID_CRS
+        wkt = f"<{crs}> POINT ({long:.{decimals}f} {lat:.{decimals}f})"
+
+        year = rng.randint(1760, 2023)
+        has_specimen = rng.random() < self.specimen_rate
+        basis_of_record = rng.choice(BASIS_OF_RECORD) if has_specimen or rng.random() < 0.4 else None
+        sample = f"{BASE}/sample/specimen/{i}" if has_specimen else f"{BASE}/sample/field/{i}"
+
+        parts = [f"{BASE}/attribute/kingdom/{i}", f"{BASE}/observation/scientificName/{i}",
+                 f"{BASE}/sample/field/{i}", f"{BASE}/sampling/field/{i}", f"{BASE}/scientificName/{i}",
+                 f"{BASE}/scientificName/{i}/observationNameMatch", f"{BASE}/scientificName/{i}/taxon",
+                 f"{BASE}/value/kingdom/{i}"]
+        if basis_of_record:
+            parts += [f"{BASE}/attribute/basisOfRecord/{i}", f"{BASE}/value/basisOfRecord/{i}"]
+        if has_specimen:
+            parts += [f"{BASE}/sample/specimen/{i}", f"{BASE}/sampling/specimen/{i}"]
+
+        time_node = f"""[ a time:Instant ;
+            time:inXSDgYear "{year}"^^xsd:gYear ]"""
+        date_proxy = """[ a rdf:Statement ;
+            rdf:value time:hasTime ;
+            rdfs:comment "Date unknown, template eventDate used as proxy" ]"""
+
+        turtle = [f"<{message}> dcterms:hasPart " + ",\n        ".join(f"<{part}>" for part in parts) + " .\n",
+                  f"""<{BASE}/observation/scientificName/{i}> a tern:Observation ;
+    void:inDataset <{DATASET}> ;
+    rdfs:comment "scientificName-observation" ;
+    time:hasTime {time_node} ;
+    sosa:hasFeatureOfInterest <{sample}> ;
+    sosa:hasResult <{BASE}/scientificName/{i}> ;
+    sosa:hasSimpleResult "{verbatim_name}" ;
+    sosa:observedProperty <http://linked.data.gov.au/def/tern-cv/70646576-6dc7-4bc5-a9d8-c4c366850df0> ;
+    sosa:usedProcedure <http://linked.data.gov.au/def/tern-cv/2eef4e87-beb3-449a-9251-f59f5c07d653> ;
+    tern:hasAttribute <{BASE}/attribute/kingdom/{i}> ;
+    tern:qualifiedValue {date_proxy} .
+""",
+                  f"""<{BASE}/scientificName/{i}/observationNameMatch> a tern:Observation ;
+    void:inDataset <{DATASET}> ;
+    rdfs:comment "NSL name match Observation" ;
+    prov:wasAssociatedWith <{NAME_MATCH_AGENT}> ;
+    sosa:hasFeatureOfInterest <{BASE}/scientificName/{i}> ;
+    sosa:hasResult <{BASE}/scientificName/{i}/taxon> ;
+    sosa:hasSimpleResult "{matched_name}" ;
+    sosa:observedProperty <http://linked.data.gov.au/def/tern-cv/70646576-6dc7-4bc5-a9d8-c4c366850df0> ;
+    sosa:phenomenonTime [ a time:Instant ;
+            rdfs:label "phenomenonTime" ;
+            time:inXSDDateTimeStamp "2024-04-03T06:14:50.106261+00:00"^^xsd:dateTimeStamp ] ;
+    sosa:usedProcedure <http://linked.data.gov.au/def/tern-cv/526319d0-0210-42b0-bd4c-fa18585ab6f2> ;
+    tern:resultDateTime "2024-04-03T06:14:50.106261+00:00"^^xsd:dateTimeStamp .
+""",
+                  f"""<{BASE}/attribute/kingdom/{i}> a tern:Attribute ;
+    void:inDataset <{DATASET}> ;
+    tern:attribute <http://example.com/concept/kingdom> ;
+    tern:hasSimpleValue "{kingdom}" ;
+    tern:hasValue <{BASE}/value/kingdom/{i}> .
+""",
+                  f"""<{BASE}/value/kingdom/{i}> a tern:IRI,
+        tern:Value ;
+    rdfs:label "kingdom = {kingdom}" ;
+    rdf:value <http://example.com/kingdom/{kingdom.lower()}> .
+""",
+                  f"""<{BASE}/scientificName/{i}> a tern:FeatureOfInterest,
+        tern:Text,
+        tern:Value ;
+    rdfs:label "scientificName" ;
+    void:inDataset <{DATASET}> ;
+    rdf:value "{verbatim_name}" ;
+    tern:featureType <http://example.com/concept/scientificName> .
+""",
+                  f"""<{BASE}/scientificName/{i}/taxon> a tern:Taxon,
+        tern:Value ;
+    rdfs:label "{matched_name}" ;
+    dwc:scientificNameID <{name_id}> .
+""",
+                  f"""<{BASE}/sample/field/{i}> a tern:FeatureOfInterest,
+        tern:Sample ;
+    void:inDataset <{DATASET}> ;
+    rdfs:comment "field-sample" ;
+    sosa:isResultOf <{BASE}/sampling/field/{i}> ;
+    sosa:isSampleOf <{BASE}/location/Australia> ;
+    tern:featureType <http://linked.data.gov.au/def/tern-cv/2361dea8-598c-4b6f-a641-2b98ff199e9e> .
+""",
+                  f"""<{BASE}/sampling/field/{i}> a tern:Sampling ;
+    dcterms:identifier "{i}" ;
+    void:inDataset <{DATASET}> ;
+    geo:hasGeometry [ a geo:Geometry ;
+            geo:asWKT "{wkt}"^^geo:wktLiteral ] ;
+    rdfs:comment "field-sampling" ;
+    time:hasTime {time_node} ;
+    sosa:hasFeatureOfInterest <{BASE}/location/Australia> ;
+    sosa:hasResult <{BASE}/sample/field/{i}> ;
+    sosa:usedProcedure <http://example.com/sampling-protocol/default> ;{
+                  f'''
+    tern:hasAttribute <{BASE}/attribute/basisOfRecord/{i}> ;''' if basis_of_record and not has_specimen else ''}
+    tern:locationDescription "{rng.choice(LOCATIONS)}" .
+""",
+                  f"""[] a rdf:Statement ;
+    dcterms:source "{DATASET}"^^xsd:anyURI ;
+    rdf:object "{i}" ;
+    rdf:predicate dcterms:identifier ;
+    rdf:subject <{BASE}/sampling/field/{i}> ;
+    skos:prefLabel "recordID source" .
+"""]
+
+        if basis_of_record:
+            turtle.append(f"""<{BASE}/attribute/basisOfRecord/{i}> a tern:Attribute ;
+    void:inDataset <{DATASET}> ;
+    tern:attribute <http://example.com/concept/basisOfRecord> ;
+    tern:hasSimpleValue "{basis_of_record}" ;
+    tern:hasValue <{BASE}/value/basisOfRecord/{i}> .
+""")
+            turtle.append(f"""<{BASE}/value/basisOfRecord/{i}> a tern:IRI,
+        tern:Value ;
+    rdfs:label "basisOfRecord" ;
+    rdf:value <http://example.com/basisOfRecord/{basis_of_record}> .
+""")
+
+        if has_specimen:
+            accuracy = f"""
+    geo:hasMetricSpatialAccuracy {rng.choice(ACCURACIES)} ;""" if rng.random() < 0.35 else ""
+            turtle.append(f"""<{BASE}/sample/specimen/{i}> a tern:FeatureOfInterest,
+        tern:Sample ;
+    void:inDataset <{DATASET}> ;
+    rdfs:comment "specimen-sample" ;
+    sosa:isResultOf <{BASE}/sampling/specimen/{i}> ;
+    sosa:isSampleOf <{BASE}/sample/field/{i}> ;
+    tern:featureType <http://linked.data.gov.au/def/tern-cv/cd5cbdbb-07d9-4a5b-9b11-5ab9d6015be6> .
+""")
+            turtle.append(f"""<{BASE}/sampling/specimen/{i}> a tern:Sampling ;
+    void:inDataset <{DATASET}> ;
+    geo:hasGeometry [ a geo:Geometry ;
+            geo:asWKT "{wkt}"^^geo:wktLiteral ] ;{accuracy}
+    rdfs:comment "specimen-sampling" ;
+    time:hasTime {time_node} ;
+    sosa:hasFeatureOfInterest <{BASE}/sample/field/{i}> ;
+    sosa:hasResult <{BASE}/sample/specimen/{i}> ;
+    sosa:usedProcedure <http://linked.data.gov.au/def/tern-cv/7930424c-f2e1-41fa-9128-61524b67dbd5> ;
+    tern:hasAttribute <{BASE}/attribute/basisOfRecord/{i}> ;
+    tern:qualifiedValue [ a rdf:Statement ;
+            rdf:value geo:hasGeometry ;
+            rdfs:comment "Location unknown, location of field sampling used as proxy" ],
+        {date_proxy} .
+""")
+        return "\n".join(turtle) + "\n"
+
+
+def cli(args=None):
+    parser = argparse.ArgumentParser(
+        prog="dq.synthetic_data",
+        description="Write synthetic ABIS Turtle with injected defects",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("output", type=Path, help="Directory the chunk_N.ttl files are written to")
+    parser.add_argument("--records", type=int, default=1000, help="Number of records to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed gives the same files")
+    parser.add_argument("--records-per-file", type=int, default=10000, help="Records written to each chunk file")
+    for defect in DEFECTS:
+        parser.add_argument(f"--{defect.replace('_', '-')}-rate", type=float, default=DEFAULT_DEFECT_RATES[defect],
+                            help=f"Fraction of records with a {defect.replace('_', ' ')} defect")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    if args is None:
+        args = cli(sys.argv[1:])
+    generator = SyntheticABISGenerator(args.records, args.seed,
+                                       {defect: getattr(args, f"{defect}_rate") for defect in DEFECTS},
+                                       args.records_per_file)
+    paths = generator.write(str(args.output))
+    print(f"Wrote {args.records} records to {len(paths)} file(s) in {args.output}")
+    print("Injected defects:", dict(generator.defect_counts))
+
+
+if __name__ == "__main__":
+    main()
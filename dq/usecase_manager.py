@@ -1,12 +1,12 @@
 import datetime
+import os
+import shutil
 from datetime import datetime
-import re
 import numpy as np
 import pandas as pd
-import rdflib
-from rdflib import URIRef, Literal, BNode, SOSA, SDO, XSD
+from rdflib import URIRef, Literal
 
-from .defined_namespaces import DQAF
+from .results_writer import ResultsWriter
 from .vocab_manager import VocabManager
 
 
@@ -18,10 +18,16 @@ class UseCaseManager:
         self.report_file = report_file
         self.use_cases_df = None
         self.results_ttl = results_ttl
-        self.results_graph = rdflib.Graph()
-        self.results_graph.parse(self.results_ttl, format="turtle")
+        # Results are appended to a copy of the earlier output instead of parsing and re-serialising it
+        if os.path.abspath(self.results_ttl) != os.path.abspath(self.output_result_file):
+            shutil.copyfile(self.results_ttl, self.output_result_file)
+        self.results_writer = ResultsWriter(self.output_result_file, append=True)
         self.label_manager = VocabManager()
         self.use_case_matrix = {}
+        self.use_case_names = []
+        self.assertion_keys = []
+        self.use_case_weights = None
+        self.use_case_targets = None
         self.create_use_case_matrix()
         self.result_matrix_df = assess_matrix_df
 
@@ -47,72 +53,63 @@ class UseCaseManager:
         print("Use Case Matrix:")
         print(self.use_case_matrix)
 
-    @staticmethod
-    def extract_record_number(record_uri):
-        patterns = [r"http://createme.org/attribute/basisOfRecord/(\d+)",
-         r"http://createme.org/attribute/kingdom/(\d+)",
-         r"http://createme.org/observation/scientificName/(\d+)",
-         r"http://createme.org/sample/field/(\d+)",
-         r"http://createme.org/sample/specimen/(\d+)",
-         r"http://createme.org/sampling/field/(\d+)",
-         r"http://createme.org/sampling/specimen/(\d+)",
-         r"http://createme.org/scientificName/(\d+)",
-         r"http://createme.org/scientificName/(\d+)/observationNameMatch",
-         r"http://createme.org/scientificName/(\d+)/taxon",
-         r"http://createme.org/value/basisOfRecord/(\d+)",
-         r"http://createme.org/value/kingdom/(\d+)"]
-
-        for pattern in patterns:
-            match = re.match(pattern, record_uri)
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    return None
-        return None
+        self.compile_use_case_matrix()
+
+    def compile_use_case_matrix(self):
+        """
+        Compile the use case definitions into a 0/1 weight matrix (use cases x assertion columns) and a vector holding
+        the subgroup-sum each use case must reach, so all use cases can be evaluated with a single matrix product.
+        """
+        self.use_case_names = list(self.use_case_matrix.keys())
+        self.assertion_keys = []
+        for conditions in self.use_case_matrix.values():
+            for key in flatten_dictionary(conditions):
+                if key not in self.assertion_keys:
+                    self.assertion_keys.append(key)
+
+        key_index = {key: i for i, key in enumerate(self.assertion_keys)}
+        self.use_case_weights = np.zeros((len(self.use_case_names), len(self.assertion_keys)), dtype=np.int64)
+        self.use_case_targets = np.zeros(len(self.use_case_names))
+        for i, conditions in enumerate(self.use_case_matrix.values()):
+            use_case_vector, use_case_keys = dictionary_to_vector_and_keys(conditions)
+            self.use_case_weights[i, [key_index[key] for key in use_case_keys]] = use_case_vector
+            self.use_case_targets[i] = calculate_subgroup_sums(conditions)
+
+    def assertion_matrix(self):
+        """
+        The 0/1 observation x assertion matrix for the compiled assertion columns of the result matrix.
+        """
+        return (self.result_matrix_df[self.assertion_keys] == 1.0).to_numpy(dtype=np.int64)
 
     def assess_use_cases(self):
+        observation_ids = self.result_matrix_df['observation_id'].tolist()
+        use_cases_satisfied = self.assertion_matrix() @ self.use_case_weights.T == self.use_case_targets
 
-        for use_case, conditions in self.use_case_matrix.items():
+        for i, use_case in enumerate(self.use_case_names):
             assessment_name = "Use Case Assessment: " + use_case
-            total_assessments = 0
-            result_counts = {'True': 0, 'False': 0}
-
-            use_case_results = []
-            use_case_vector, use_case_keys = dictionary_to_vector_and_keys(conditions)
-            use_case_sum = calculate_subgroup_sums(conditions)
-
-            for _, row in self.result_matrix_df.iterrows():
-                total_assessments += 1
-                row_vector = [1 if row[key] == 1.0 else 0 for key in use_case_keys]
-                dot_product = np.dot(use_case_vector, row_vector)
-                use_case_satisfied = use_case_sum == dot_product
-                use_case_results.append(use_case_satisfied)
-                label = "True" if use_case_satisfied else "False"
-                result_counts[label] += 1
+            use_case_results = use_cases_satisfied[:, i]
+            total_assessments = len(use_case_results)
+            true_count = int(use_case_results.sum())
+            result_counts = {'True': true_count, 'False': total_assessments - true_count}
 
-                self._add_use_case_assessment_result(use_case, row['observation_id'], use_case_satisfied)
+            for observation_id, use_case_satisfied in zip(observation_ids, use_case_results):
+                self._add_use_case_assessment_result(use_case, observation_id, use_case_satisfied)
 
             self.result_matrix_df[use_case] = use_case_results
             self.add_to_report(assessment_name, total_assessments, result_counts)
 
-        self.results_graph.serialize(destination=self.output_result_file, format="turtle")
+        self.results_writer.close()
         print(self.output_result_file)
 
     def _add_use_case_assessment_result(self, use_case, observation_id, value, assessment_date=None):
         subject = URIRef(f"http://example.com/use_case_assessment/{use_case}/{observation_id}")
         assessment_type = URIRef(f"http://example.com/use_case_assessment/{use_case}/")
-        result_bn = BNode()
-        self.results_graph.add((subject, DQAF.hasDQAFResult, result_bn))
-        self.results_graph.add((result_bn, SOSA.observedProperty, assessment_type))
-
-        self.results_graph.add((result_bn, SDO.value, Literal(value)))
         if assessment_date is None:
             assessment_date = datetime.now()
         elif isinstance(assessment_date, datetime.date) and not isinstance(assessment_date, datetime.datetime):
             assessment_date = datetime.datetime.combine(assessment_date, datetime.time.min)
 
-        self.results_graph.add((result_bn, SOSA.resultTime, Literal(assessment_date, datatype=XSD.dateTime)))
+        self.results_writer.add_result(subject, assessment_type, Literal(value), assessment_date)
 
     def add_to_report(self, assessment_name, total_assessments, result_counts):
         if self.report_file:
@@ -296,6 +296,22 @@ class VocabManager:
                 },
             },
 
+            "scientific_name_correction": {
+                "category": "scientific_name",
+                "input_field_(RDF)": "tern:FeatureOfInterest",
+                "namespace": Namespace("http://example.com/vocab/scientific_name_correction/"),
+                "assess_namespace": URIRef("http://example.com/assess/scientific_name_correction/"),
+                "prefix": "scientific_name_correction",
+                "labels": {
+                    "suggested_correction": "This label is applied to records with an invalid scientific name that closely resembles an accepted APNI name, indicating the name is likely a misspelling of that name.",
+                    "no_suggestion": "This label is applied to records with an invalid scientific name that does not closely resemble any accepted APNI name.",
+                },
+                "expanded_rule_definition": {
+                    "suggested_correction": "If the scientific name in the 'tern:FeatureOfInterest' field is labelled 'invalid_name' by the scientific name validation and an APNI name reaches the similarity cutoff against it, label the record as 'suggested_correction'. The most similar APNI name is recorded alongside the label as the suggested correction.",
+                    "no_suggestion": "If the scientific name in the 'tern:FeatureOfInterest' field is labelled 'invalid_name' by the scientific name validation and no APNI name reaches the similarity cutoff against it, label the record as 'no_suggestion'.",
+                },
+            },
+
             "datum_completeness": {
                 "category": "datum",
                 "input_field_(RDF)": "geo:hasGeometry",
@@ -14,6 +14,8 @@ if grandparent_dir not in sys.path:
 
 # Now attempt the import
 from dq.assess import RDFDataQualityAssessment
+from dq.assessment_registry import ASSESSMENTS, HEAVY, select_assessments
+from dq.assessment_scheduler import AssessmentScheduler
 import streamlit as st
 
 
@@ -27,10 +29,11 @@ def data_quality_assessment_page():
         file_details = {"FileName": uploaded_file.name, "FileType": uploaded_file.type}
         st.write('Input file:', file_details)
 
-        # choice = st.selectbox(
-        #    'Select an Assessment to do',
-        #    ('assess_date_completeness', 'assess_coordinate_in_australia_state', 'Predicate 3')
-        # )
+        selected_names = st.multiselect(
+            'Select the assessments to do',
+            [spec.name for spec in ASSESSMENTS if not spec.arguments],
+            default=[spec.name for spec in ASSESSMENTS if not spec.arguments and spec.cost != HEAVY]
+        )
 
         if st.button('Do Assessments'):
             with st.spinner('Preparing data...'):
@@ -38,30 +41,16 @@ def data_quality_assessment_page():
                 assessment = RDFDataQualityAssessment(g, None)
             st.success('Data prepared')
 
-            assessments_functions = [assessment.assess_coordinate_precision
-                , assessment.assess_coordinate_completeness
-                , assessment.assess_coordinate_unusual
-                , assessment.assess_coordinate_in_australia_state
-                , assessment.assess_coordinate_outlier_irq
-                , assessment.assess_coordinate_outlier_zscore
-                , assessment.assess_date_recency
-                , assessment.assess_date_format_validation
-                , assessment.assess_date_completeness
-                , assessment.assess_date_outlier_kmeans
-                , assessment.assess_date_outlier_irq
-                , assessment.assess_scientific_name_completeness
-                , assessment.assess_scientific_name_validation
-                , assessment.assess_datum_completeness
-                , assessment.assess_datum_type
-                , assessment.assess_datum_validation]
-
             assessment_results_df = pd.DataFrame(columns=['Assessment Name', 'Total Assessments', 'Result Counts'])
             df_display = st.empty()
 
             df_display.dataframe(assessment_results_df,hide_index=True)
 
-            for assess in assessments_functions:
-                assessment_name, total_assessments, result_counts = assess()
+            def show_result(spec, result):
+                nonlocal assessment_results_df
+                if result is None:
+                    return
+                assessment_name, total_assessments, result_counts = result
 
                 new_row_df = pd.DataFrame({
                     'Assessment Name': [assessment_name],
@@ -71,6 +60,8 @@ def data_quality_assessment_page():
                 assessment_results_df = pd.concat([assessment_results_df, new_row_df], ignore_index=True)
                 df_display.dataframe(assessment_results_df)
 
+            AssessmentScheduler(assessment).run(select_assessments(only=selected_names), on_result=show_result)
+
 
     else:
         st.write("Please upload a dataset to begin assessment.")
@@ -54,14 +54,18 @@ def extract_geo_points(file_content):
                             match = re.search(r"POINT \(([^ ]+) ([^ ]+)\)", str(geometry))
                             if match:
                                 lon, lat = map(float, match.groups())
-                                in_australia, state_name = geo_checker.is_point_in_australia_state(lat, lon)
-                                result_label = state_name if in_australia else "Outside_Australia"
                                 info = {
                                     'observation_id': str(observation),
-                                    'sample_id': str(sample),
-                                    'loc': result_label
+                                    'sample_id': str(sample)
                                 }
-                                geo_points.append({'lat': lat, 'lon': lon, 'info': info, 'state': result_label})
+                                geo_points.append({'lat': lat, 'lon': lon, 'info': info})
+
+    # Classify all points against the state boundaries in one batch
+    state_labels = geo_checker.classify_points([point['lat'] for point in geo_points],
+                                               [point['lon'] for point in geo_points])
+    for point, result_label in zip(geo_points, state_labels):
+        point['info']['loc'] = result_label
+        point['state'] = result_label
     return geo_points
 
 
@@ -1,33 +1,46 @@
+import os
+import sys
+
 import streamlit as st
-import difflib
+
+# Adjust the path to include the 'dq' directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+grandparent_dir = os.path.dirname(os.path.dirname(current_dir))  # The project root directory, where 'dq' resides
+
+if grandparent_dir not in sys.path:
+    sys.path.append(grandparent_dir)
+
+from dq.nsl_name_matcher import NSLNameMatcher
 
 st.set_page_config(page_title="Similarity Search", layout="wide")
 
 
-def find_similar_names(input_name, names_list, cutoff=0.6):
-    # Find close matches to the input name from the list, based on the given cutoff for similarity
-    similar_names = difflib.get_close_matches(input_name, names_list, n=5, cutoff=cutoff)
-    return similar_names
+@st.cache_resource
+def load_name_matcher():
+    # The trigram index over the APNI names is built once and cached on disk
+    return NSLNameMatcher().load()
+
+
+def find_similar_names(input_name, cutoff=0.6):
+    # Find close matches to the input name among the APNI names, based on the given cutoff for similarity
+    return load_name_matcher().match(input_name, cutoff=cutoff, limit=5)
 
 
 st.write("""
-This page allows you to search for similar names based on your input. 
+This page allows you to search for similar names based on your input.
 It's particularly useful for finding scientific names that might be spelled differently.
+Names are matched against the APNI name list bundled with the data quality assessment.
 """)
 
-# Example list of names - you might want to load this from a file or a database in a real app
-names_list = ["Eucalyptus globulus", "Acacia dealbata", "Banksia serrata", "Grevillea robusta",
-              "Callistemon citrinus"]
-
 input_name = st.text_input('Enter a name to search for:')
 similarity_threshold = st.slider('Similarity threshold', min_value=0.0, max_value=1.0, value=0.6, step=0.05)
 
 if st.button('Search'):
-    similar_names = find_similar_names(input_name, names_list, cutoff=similarity_threshold)
+    similar_names = find_similar_names(input_name, cutoff=similarity_threshold)
 
     if similar_names:
         st.success("Found similar names:")
-        for name in similar_names:
-            st.write(name)
+        for name, similarity in similar_names:
+            st.write(f"{name} ({similarity:.2f})")
     else:
         st.error("No similar names found.")
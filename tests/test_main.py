@@ -1,11 +1,43 @@
+import io
+import json
+import math
 import os
 import shutil
-
-from rdflib import Graph
-
-from dq.__main__ import main
-from dq.assess import RDFDataQualityAssessment
+import subprocess
+import sys
+import time
+
+import numpy as np
+from rdflib import Graph, URIRef, Literal
+from rdflib.compare import isomorphic
+
+from dq.__main__ import cli, main
+from dq.assess import RDFDataQualityAssessment, AustraliaGeographyChecker, DatumChecker, ScientificNameChecker
+from dq.assessment_registry import select_assessments
+from dq.assessment_scheduler import AssessmentScheduler
+from dq.benchmark import compare
+from dq.clustering import ckmeans, silhouette_score_1d
+from dq.coordinate_strings import coordinate_string_labels, has_repeated_block
+from dq.datum_resolver import DatumResolver
+from dq.datum_transform import NO_EPSG_CODE, DatumTransformer, geographic_crs
 from dq.defined_namespaces import DirectoryStructure
+from dq.distinct_values import DistinctValueMemo
+from dq.duplicate_detector import DuplicateDetector, predicate_ref, value_digest
+from dq.ingest import expand_input_paths, load_graph
+from dq.input_cache import InputCache
+from dq.locations import LocationStats, factorize_locations
+from dq.nsl_name_index import NSLNameIndex
+from dq.nsl_name_matcher import NSLNameMatcher
+from dq.instrumentation import StageTimer
+from dq.observation_frame import ObservationFrame
+from dq.observation_id import ObservationIdExtractor, default_extractor
+from dq.outlier_reference import OutlierReferenceStore
+from dq.result_matrix import ResultMatrix
+from dq.results_writer import ResultsWriter
+from dq.usecase_manager import UseCaseManager
+from dq.scoring_manager import ScoringManager
+from dq.state_boundary_store import StateBoundaryStore
+from dq.synthetic_data import SyntheticABISGenerator
 import pytest
 
 
@@ -26,6 +58,30 @@ def test_version_information(monkeypatch, capsys):
     assert "0.0.1" in captured.out
 
 
+def test_startup_time():
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-m", "dq", "--version"], cwd=project_root, capture_output=True,
+                               text=True, check=True)
+    elapsed = time.perf_counter() - start
+    assert "0.0.1" in completed.stdout
+    assert elapsed < 1.0, f"dq --version took {elapsed:.2f}s"
+
+    # The heavy libraries must not be imported just to load the package
+    completed = subprocess.run([sys.executable, "-c",
+                                "import sys, dq; print(sorted(m for m in ('sklearn', 'geopandas', 'shapely') "
+                                "if m in sys.modules))"],
+                               cwd=project_root, capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]"
+
+
+def test_geo_checker_loaded_on_first_use(dq_assessment):
+    assert dq_assessment._geo_checker is None
+    dq_assessment.assess_date_completeness()
+    assert dq_assessment._geo_checker is None
+    assert isinstance(dq_assessment.geo_checker, AustraliaGeographyChecker)
+
+
 def test_data_to_assess_input(monkeypatch, capsys):
     file_to_assess = os.path.join(os.path.dirname(__file__), 'data\chunk_1.ttl')
 
@@ -239,9 +295,577 @@ def test_assess_scientific_name_validation(dq_assessment):
     assessment_name, total_assessments, result_counts = dq_assessment.assess_scientific_name_validation()
 
     expected_total_assessments = 100
+    # None of the names in the test data are in the bundled APNI name list
     expected_label_values = {
-        "valid_name": 100,
-        "invalid_name": 0}
+        "valid_name": 0,
+        "invalid_name": 100}
 
     do_the_test(assessment_name, total_assessments, expected_total_assessments, result_counts, expected_label_values)
 
+
+def test_observation_frame_extraction():
+    file_to_assess = os.path.join(os.path.dirname(__file__), 'data', 'chunk_1.ttl')
+    frame = ObservationFrame(Graph().parse(file_to_assess)).extract()
+
+    assert len(frame) == 300
+    assert frame['observation'].nunique() == 300
+    assert frame['procedure'].notna().sum() == 200
+    assert frame['longitude'].notna().sum() == 200
+    assert frame['scientific_name'].notna().sum() == 100
+    name_matches = frame['observation_comments'].map(lambda comments: 'NSL name match Observation' in comments)
+    assert name_matches.sum() == 100
+    assert (frame.loc[name_matches, 'observation_timestamps'].map(len) == 1).all()
+
+
+def test_result_matrix_accumulation():
+    matrix = ResultMatrix(['date_completeness:empty', 'date_completeness:non_empty'])
+    matrix.add(2, 'date_completeness:non_empty')
+    matrix.add(1, 'date_completeness:empty')
+    matrix.add(2, 'coordinate_completeness:non_empty', 'location', '134.1, -37.2')
+
+    df = matrix.to_dataframe()
+
+    assert list(df.columns) == ['observation_id', 'date_completeness:empty', 'date_completeness:non_empty',
+                                'coordinate_completeness:non_empty', 'location']
+    assert list(df['observation_id']) == [2, 1]
+    assert df.loc[0, 'date_completeness:non_empty'] == 1
+    assert df.loc[0, 'location'] == '134.1, -37.2'
+    assert df['date_completeness:empty'].isna().tolist() == [True, False]
+    # Label columns are numeric; only value columns such as the location hold objects
+    assert df['date_completeness:empty'].dtype == np.float64
+    assert df['coordinate_completeness:non_empty'].tolist()[0] == 1.0
+    assert df['location'].dtype == object
+
+
+def test_use_case_assessment_vectorised(tmp_path):
+    file_base_path = DirectoryStructure()
+    use_case_definition_file = os.path.join(file_base_path.use_case_base_path, 'usecase_definition.xlsx')
+    results_ttl = tmp_path / "Results.ttl"
+    Graph().serialize(destination=str(results_ttl), format="turtle")
+
+    use_case_manager = UseCaseManager(use_case_definition_file, None, str(results_ttl),
+                                      str(tmp_path / "Final_Usecase_Results.ttl"))
+    first_label_per_group = {}
+    for key in use_case_manager.assertion_keys:
+        first_label_per_group.setdefault(key.split(':', 1)[0], key)
+    matrix = ResultMatrix(use_case_manager.assertion_keys)
+    for key in first_label_per_group.values():
+        matrix.add(1, key)
+    matrix.add(2, use_case_manager.assertion_keys[0])
+    use_case_manager.result_matrix_df = matrix.to_dataframe()
+
+    use_case_manager.assess_use_cases()
+
+    assert use_case_manager.result_matrix_df['Baseline-SDMFFP3'].tolist() == [True, False]
+    assert use_case_manager.result_matrix_df['Baseline-SDMFFP1'].tolist() == [False, False]
+
+
+def test_scoring_vectorised(tmp_path):
+    file_base_path = DirectoryStructure()
+    scoring_definition_file = os.path.join(file_base_path.scoring_base_path,
+                                           'assertions_score_weighting_definition.xlsx')
+    results_ttl = tmp_path / "Results.ttl"
+    Graph().serialize(destination=str(results_ttl), format="turtle")
+
+    scoring_manager = ScoringManager(scoring_definition_file, None, str(results_ttl),
+                                     str(tmp_path / "Final_Scoring_Results.ttl"))
+    matrix = ResultMatrix(scoring_manager.assertion_keys)
+    matrix.add(1, 'coordinate_precision:High')
+    matrix.add(1, 'scientific_name_validation:valid_name')
+    matrix.add(2, 'coordinate_precision:Low')
+    matrix.add(3, 'coordinate_precision:High')
+    scoring_manager.result_matrix_df = matrix.to_dataframe()
+
+    scoring_manager.apply_scoring_methods()
+
+    assert scoring_manager.result_matrix_df['BDR_General_Weight'].tolist() == [1.0, 0.0, 0.2308]
+
+
+def test_classify_points_in_australia_state():
+    geo_checker = AustraliaGeographyChecker()
+    labels = geo_checker.classify_points([-33.86, -37.81, 0.0], [151.2, 144.96, 0.0])
+
+    assert labels.tolist() == ['New_South_Wales', 'Victoria', 'Outside_Australia']
+    assert geo_checker.is_point_in_australia_state(0.0, 0.0) == (False, "Outside Australia")
+
+
+def test_state_boundary_store_cache(tmp_path, monkeypatch):
+    import geopandas as gpd
+    from shapely.geometry import box
+
+    shapefile = str(tmp_path / "state.shp")
+    gpd.GeoDataFrame({'geometry': [box(140, -40, 150, -30)]}, crs="EPSG:4326").to_file(shapefile)
+    store = StateBoundaryStore({"Victoria": shapefile}, str(tmp_path / "cache"))
+
+    state_names, polygons, polygon_state = store.load()
+    assert state_names == ["Victoria"] and polygon_state.tolist() == [0]
+
+    # A second load must come from the cache
+    build = store.build
+    monkeypatch.setattr(store, "build", lambda manifest=None: pytest.fail("cache was rebuilt"))
+    _, cached_polygons, _ = store.load()
+    assert cached_polygons[0].equals(polygons[0])
+
+    # Changing the shapefile invalidates the cache
+    gpd.GeoDataFrame({'geometry': [box(110, -35, 125, -20)]}, crs="EPSG:4326").to_file(shapefile)
+    monkeypatch.setattr(store, "build", build)
+    _, rebuilt_polygons, _ = store.load()
+    assert rebuilt_polygons[0].bounds == (110.0, -35.0, 125.0, -20.0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_graph_from_several_files(tmp_path, max_workers):
+    for i in range(3):
+        (tmp_path / f"part_{i}.ttl").write_text(
+            f'PREFIX ex: <http://example.com/>\nex:s{i} ex:p [ ex:q "{i}" ] .\n')
+    (tmp_path / "part_3.ttl").write_text('PREFIX ex: <http://example.com/>\n')
+    (tmp_path / "notes.txt").write_text("not turtle")
+
+    files = expand_input_paths([tmp_path])
+    assert [f.name for f in files] == ["part_0.ttl", "part_1.ttl", "part_2.ttl", "part_3.ttl"]
+
+    g = load_graph([tmp_path], max_workers=max_workers)
+    assert len(g) == 6
+    assert len(set(g.subjects())) == 6  # Blank nodes from different files stay distinct
+    # Files parsed in worker processes merge to the same graph as files parsed in this process
+    assert isomorphic(g, load_graph([tmp_path], max_workers=1))
+
+
+def test_input_cache(tmp_path):
+    data_file = tmp_path / "data.ttl"
+    data_file.write_text('PREFIX ex: <http://example.com/>\nex:s ex:p "1" .\n')
+    input_cache = InputCache(str(tmp_path / "cache"))
+    parses = []
+
+    def parse():
+        parses.append(data_file)
+        return Graph().parse(source=str(data_file), format='ttl')
+
+    g = input_cache.load([data_file], parse)
+    cached = input_cache.load([data_file], parse)
+    assert len(parses) == 1
+    assert set(cached) == set(g)
+
+    # New content means a new key
+    data_file.write_text('PREFIX ex: <http://example.com/>\nex:s ex:p "2" .\n')
+    input_cache.load([data_file], parse)
+    assert len(parses) == 2
+
+    # Entries beyond the size bound are evicted, oldest first
+    input_cache.max_bytes = 1
+    input_cache.evict()
+    assert not list((tmp_path / "cache").iterdir())
+
+
+def test_results_writer_appends(tmp_path, dq_assessment):
+    results_file = str(tmp_path / "Results.ttl")
+    input_size = len(dq_assessment.g)
+
+    with ResultsWriter(results_file, batch_size=7) as results_writer:
+        dq_assessment.results_writer = results_writer
+        results_writer.add_graph(dq_assessment.g)
+        _, total_assessments, _ = dq_assessment.assess_date_completeness()
+    assert len(dq_assessment.g) == input_size  # The input graph is left untouched
+
+    with ResultsWriter(results_file, append=True) as results_writer:
+        results_writer.add_result(URIRef("http://example.com/s"), URIRef("http://example.com/p"), Literal("0.5000"))
+
+    g = Graph().parse(results_file, format="turtle")
+    assert len(g) == input_size + 4 * (total_assessments + 1)
+
+    # Literals are escaped as N-Triples requires
+    results_writer = ResultsWriter()
+    value = Literal('a "quoted"\\ value\non two lines', lang='en')
+    results_writer.add_result(URIRef("http://example.com/s"), URIRef("http://example.com/p"), value)
+    assert value in set(results_writer.graph().objects())
+
+
+def test_one_dimensional_clustering():
+    import numpy as np
+    from sklearn.metrics import silhouette_score
+
+    years = np.array([1750, 1752, 1990, 1991, 1991, 1995, 2000, 2001, 2001, 2020, 2021, 2022])
+    labels = ckmeans(years, 3)
+    assert labels.tolist() == [0, 0, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2]
+
+    # Distinct years weighted by their counts give the same clustering and score
+    distinct_years, year_counts = np.unique(years, return_counts=True)
+    distinct_labels = ckmeans(distinct_years, 3, year_counts)
+    assert distinct_labels[np.searchsorted(distinct_years, years)].tolist() == labels.tolist()
+
+    expected = silhouette_score(years.reshape(-1, 1), labels)
+    assert abs(silhouette_score_1d(years, labels) - expected) < 1e-12
+    assert abs(silhouette_score_1d(distinct_years, distinct_labels, year_counts) - expected) < 1e-12
+    assert -1 <= silhouette_score_1d(years, labels, sample_size=8) <= 1
+
+    # A small cluster of outlier years keeps a member in the sample however rarely a random draw would pick it
+    outlier_years, outlier_counts = np.array([1800, 2000]), np.array([5, 9995])
+    assert silhouette_score_1d(outlier_years, np.array([0, 1]), outlier_counts, sample_size=100) > 0.98
+
+
+def test_outlier_reference(tmp_path):
+    import numpy as np
+
+    test_file = os.path.join(os.path.dirname(__file__), 'data', 'chunk_1.ttl')
+    g = Graph().parse(test_file, format='turtle')
+
+    reference = RDFDataQualityAssessment(g).fit_outlier_reference()
+    store = OutlierReferenceStore(str(tmp_path))
+    assert store.save(reference) == 1
+    assert store.save(reference) == 2
+    assert store.versions() == [1, 2]
+
+    loaded = store.load()
+    assert loaded.metadata['version'] == 2
+    assert loaded.coordinate_quartiles == reference.coordinate_quartiles
+    with pytest.raises(FileNotFoundError):
+        store.load(3)
+
+    # Scoring against the reference predicts with the saved models instead of fitting on the assessed data
+    dq_assessment = RDFDataQualityAssessment(g, outlier_reference=loaded)
+    name, total, counts = dq_assessment.assess_coordinate_outlier_isolation_forest()
+    coordinates = dq_assessment._coordinate_rows()[['latitude', 'longitude']].to_numpy()
+    assert counts['outlier_coordinate'] == np.sum(loaded.isolation_forest.predict(coordinates) == -1)
+    assert total == len(coordinates)
+
+    # The contamination reaches both the saved reference and the models fitted on the assessed data
+    assert RDFDataQualityAssessment(g, contamination=0.05).fit_outlier_reference().metadata['contamination'] == 0.05
+    outliers = [RDFDataQualityAssessment(g, contamination=contamination)
+                .assess_coordinate_outlier_robust_covariance()[2]['outlier_coordinate']
+                for contamination in (0.05, 0.2)]
+    assert outliers[0] < outliers[1]
+    assert cli(['--contamination', '0.05']).contamination == 0.05
+    assert cli([]).contamination == 0.1
+    with pytest.raises(SystemExit):
+        cli(['--contamination', '0.7'])
+
+
+def test_assessment_scheduler_is_deterministic():
+    import io
+
+    test_file = os.path.join(os.path.dirname(__file__), 'data', 'chunk_1.ttl')
+    g = Graph().parse(test_file, format='turtle')
+
+    specs = select_assessments(skip=['coordinate_in_australia_state'])
+    assert [spec.name for spec in select_assessments(only=['datum_type', 'date_recency'])] == ['date_recency',
+                                                                                              'datum_type']
+    assert select_assessments(only=[]) == []
+    # Opt-in assessments only run when asked for by name
+    assert 'scientific_name_correction' not in [spec.name for spec in select_assessments()]
+    assert [spec.name for spec in select_assessments(only=['scientific_name_correction'])] == [
+        'scientific_name_correction']
+    assert 'scientific_name_correction' in [spec.name for spec in select_assessments(
+        include=['scientific_name_correction'])]
+    with pytest.raises(KeyError):
+        select_assessments(only=['no_such_assessment'])
+
+    runs = []
+    for max_workers in [1, 4]:
+        report_file = io.StringIO()
+        dq_assessment = RDFDataQualityAssessment(g, report_file)
+        results = AssessmentScheduler(dq_assessment, max_workers).run(specs)
+        runs.append((results, report_file.getvalue(), dq_assessment.result_matrix_df,
+                     len(dq_assessment.results_writer.lines)))
+        # Unselected resources are never loaded
+        assert dq_assessment._geo_checker is None
+
+    (sequential, sequential_report, sequential_matrix, sequential_lines), \
+        (concurrent, concurrent_report, concurrent_matrix, concurrent_lines) = runs
+    assert 'duplicate' not in sequential
+    assert list(sequential) == list(concurrent) and sequential == concurrent
+    assert sequential_report == concurrent_report
+    assert sequential_matrix.equals(concurrent_matrix)
+    assert sequential_lines == concurrent_lines
+
+
+def test_stage_timer(tmp_path):
+    import io
+    import json
+
+    stage_timer = StageTimer(profile_dir=str(tmp_path / 'profile'), trace_memory=True)
+    with stage_timer.stage('assessments') as record:
+        with stage_timer.stage('date_recency', observations=1000):
+            sum(range(100000))
+        record.observations = 1000
+
+    assessments, date_recency = stage_timer.records
+    assert date_recency.parent == 'assessments' and assessments.parent is None
+    assert assessments.wall_time >= date_recency.wall_time > 0
+    assert date_recency.observations_per_second == 1000 / date_recency.wall_time
+    assert assessments.peak_traced_mb is not None and date_recency.peak_traced_mb is None
+    # The process peak never goes down, so a stage's own share is how far it raised it
+    assert 0 <= date_recency.rss_growth_mb <= assessments.rss_growth_mb
+    # Only top-level stages are profiled
+    assert os.listdir(tmp_path / 'profile') == ['assessments.prof']
+
+    report_file = io.StringIO()
+    stage_timer.write_report(report_file)
+    assert '\t- date_recency: ' in report_file.getvalue()
+
+    stage_timer.write_json(str(tmp_path / 'timings.json'))
+    with open(tmp_path / 'timings.json') as f:
+        stages = json.load(f)['stages']
+    assert [stage['name'] for stage in stages] == ['assessments', 'date_recency']
+    assert stages[0]['rss_growth_mb'] == assessments.rss_growth_mb
+
+
+def test_synthetic_data_generator(tmp_path):
+    generator = SyntheticABISGenerator(300, seed=7, records_per_file=200,
+                                       defect_rates={'bad_datum': 0.1, 'empty_name': 0.1, 'outlier': 0.05})
+    paths = generator.write(str(tmp_path / 'a'))
+    assert [path.name for path in paths] == ['chunk_1.ttl', 'chunk_2.ttl']
+    defect_counts = dict(generator.defect_counts)
+
+    # The same seed writes the same files
+    other_paths = SyntheticABISGenerator(300, seed=7, records_per_file=200, defect_rates=generator.defect_rates) \
+        .write(str(tmp_path / 'b'))
+    assert [path.read_bytes() for path in paths] == [path.read_bytes() for path in other_paths]
+
+    frame = ObservationFrame(load_graph(paths, max_workers=1)).extract()
+    observations = frame[frame['procedure'].notna()].drop_duplicates('observation')
+    assert len(observations) == 300
+    assert (observations['scientific_name'] == '').sum() == defect_counts['empty_name']
+    assert (~observations['geometry'].str.contains('EPSG/0/4283')).sum() == defect_counts['bad_datum']
+    assert (observations['latitude'] > 0).sum() + (observations['longitude'] < 100).sum() >= 1
+    assert 'offshore' not in defect_counts
+
+
+def test_benchmark_compare():
+    baseline = {'sizes': {'1000': {'returncode': 0, 'peak_rss_mb': 100.0, 'stages': {
+        'assessments': {'wall_time': 1.0}, 'assessments/date_recency': {'wall_time': 0.01}}}}}
+    current = {'sizes': {'1000': {'returncode': 0, 'peak_rss_mb': 120.0, 'stages': {
+        'assessments': {'wall_time': 2.0}, 'assessments/date_recency': {'wall_time': 0.05}}},
+        '10000': {'returncode': 0, 'peak_rss_mb': 300.0, 'stages': {}}}}
+    regressions = compare(baseline, current, tolerance=1.5)
+    assert len(regressions) == 1 and regressions[0].startswith('1000 records, assessments:')
+    assert compare(baseline, current, tolerance=2.5) == []
+
+    # The committed baseline is one the benchmark can compare against
+    with open(os.path.join(os.path.dirname(__file__), 'data', 'benchmark_baseline_1000.json')) as f:
+        committed = json.load(f)
+    assert committed['sizes']['1000']['returncode'] == 0
+    assert compare(committed, committed) == []
+
+
+def test_nsl_name_index(tmp_path, dq_assessment):
+    csv_file = tmp_path / "names.csv"
+    csv_file.write_text("scientificName,canonicalName,kingdom\n"
+                        "Zieria tuberculata Anon.,Zieria tuberculata,Plantae\n"
+                        "Acacia anomala C.A.Gardner ex Court,Acacia anomala,Plantae\n")
+    name_index = NSLNameIndex(str(csv_file), str(tmp_path / "cache"))
+
+    assert list(name_index.contains(['Zieria tuberculata', ' ZIERIA  tuberculata  Anon. ', 'Zieria', ''])) == \
+        [True, True, False, False]
+    assert os.path.exists(name_index.manifest_file)
+    # A second index over the same CSV loads the cached hashes
+    assert list(NSLNameIndex(str(csv_file), str(tmp_path / "cache")).load()) == list(name_index.hashes)
+
+    dq_assessment.name_checker.name_index = name_index
+    assert dq_assessment.name_checker.is_apni_name('Acacia anomala')
+    assert not dq_assessment.name_checker.is_apni_name('Acacia')
+    # The static entry point keeps working without a checker instance
+    assert ScientificNameChecker.is_valid_scientific_name('Acacia')
+    _, total_assessments, result_counts = dq_assessment.assess_scientific_name_validation()
+    names = [name for _, name in dq_assessment._scientific_name_rows()]
+    expected_valid = sum(str(name).strip() in ('Zieria tuberculata Anon.', 'Acacia anomala C.A.Gardner ex Court')
+                         for name in names)
+    assert total_assessments == 100
+    assert 0 < expected_valid == result_counts['valid_name']
+
+
+def test_nsl_name_matcher(tmp_path):
+    csv_file = tmp_path / "names.csv"
+    csv_file.write_text("scientificName,canonicalName\n"
+                        "Acacia anomala C.A.Gardner ex Court,Acacia anomala\n"
+                        "Acacia ammophila Pedley,Acacia ammophila\n"
+                        "Zieria tuberculata Anon.,Zieria tuberculata\n")
+    matcher = NSLNameMatcher(str(csv_file), str(tmp_path / "cache"), max_candidates=2)
+
+    assert matcher.match('Acacia anomola')[0] == ('Acacia anomala', pytest.approx(13 / 14))
+    assert matcher.match('Eucalyptus globulus') == []
+    assert os.path.exists(matcher.manifest_file)
+
+    names = ['Acacia amophila', 'Zieria tuberculta', 'Eucalyptus globulus'] * 30
+    suggestions = matcher.suggest(names, max_workers=1)
+    assert suggestions == {'Acacia amophila': 'Acacia ammophila', 'Zieria tuberculta': 'Zieria tuberculata',
+                           'Eucalyptus globulus': None}
+    # Batches are split across worker processes, which load the cached index
+    assert matcher.suggest([f"{name} {i}" for i, name in enumerate(names)], cutoff=0.7, max_workers=2) == \
+        NSLNameMatcher(str(csv_file), str(tmp_path / "cache"), max_candidates=2).suggest(
+            [f"{name} {i}" for i, name in enumerate(names)], cutoff=0.7, max_workers=1)
+
+
+def test_observation_id_extractor():
+    assert default_extractor('http://createme.org/observation/scientificName/12') == 12
+    assert default_extractor(URIRef('http://createme.org/scientificName/7/observationNameMatch')) == 7
+    assert default_extractor('http://createme.org/sampling/specimen/3') == 3
+    assert default_extractor('http://example.org/observation/3') is None
+    assert default_extractor('http://createme.org/value/kingdom/5') == 5
+
+    extractor = default_extractor.with_patterns([r"https://data\.example\.org/record/(\d+)#"])
+    assert extractor('https://data.example.org/record/42#observation') == 42
+    assert extractor('http://createme.org/sample/field/8') == 8
+    extractor('https://data.example.org/record/42#observation')
+    assert extractor.cache_info().hits == 1
+
+    with pytest.raises(ValueError):
+        ObservationIdExtractor([r"http://example.org/(\d+)/(\d+)"])
+
+
+def test_coordinate_string_labels():
+    labels = coordinate_string_labels(['151.20931', '151.2', None, '149.1212'], ['-33.86785', '-33.8688', None, '-35.3'])
+
+    assert list(labels['coordinate_completeness']) == ['non_empty', 'non_empty', 'empty', 'non_empty']
+    assert list(labels['coordinate_precision']) == ['High', 'Low', None, 'Low']
+    assert list(labels['coordinate_unusual']) == ['usual', 'unusual', 'usual', 'unusual']
+    assert list(has_repeated_block(['1231234', '123412', '', '7'])) == [True, False, False, False]
+    # Strings are compared with others of their own length only
+    assert list(has_repeated_block(['12', '1234567890' * 50 + '1', '11'])) == [False, True, True]
+    # Long strings are checked one by one; a square-free ternary string derived from the Thue-Morse sequence has none
+    thue_morse = [bin(i).count('1') % 2 for i in range(1001)]
+    square_free = ''.join('012'[thue_morse[i + 1] - thue_morse[i] + 1] for i in range(1000))
+    assert list(has_repeated_block([square_free, square_free + square_free[-1]])) == [False, True]
+    assert [RDFDataQualityAssessment.detect_unusual_numbers(number)
+            for number in ['151.1231234', '151.123412', '151', '-33.10']] == ['unusual', 'usual', 'usual', 'usual']
+
+
+def test_distinct_value_memo(dq_assessment, tmp_path):
+    memo = DistinctValueMemo()
+    evaluated = []
+    results = memo.map('length', lambda value: evaluated.append(value) or len(value), ['ab', ('a', 1), 'ab', 'abc'])
+    assert list(results) == [2, 2, 2, 3]
+    assert list(memo.map('length', len, ['abc', 'abcd'])) == [3, 4]
+    assert evaluated == ['ab', ('a', 1), 'abc', 'abcd']
+    assert (memo.maps['length'].lookups, memo.maps['length'].evaluations) == (6, 4)
+
+    dq_assessment.assess_date_format_validation()
+    with open(tmp_path / "report.txt", "w") as report_file:
+        dq_assessment.memo.write_report(report_file)
+    assert '- DateChecker.check_date_format_and_validate: 100 values, 1 evaluated, hit rate 99.0%' in \
+        (tmp_path / "report.txt").read_text()
+
+
+def test_datum_resolver(tmp_path, dq_assessment):
+    epsg_table = tmp_path / "epsg.csv"
+    epsg_table.write_text("epsg_code,name,description\n"
+                          "4326,WGS84,World Geodetic System 1984\n"
+                          "4979,WGS84,WGS 84 (3D)\n")
+    resolver = DatumResolver(DatumChecker(str(epsg_table)))
+    labels = resolver.labels(['<http://www.opengis.net/def/crs/EPSG/0/4979> POINT (151.2 -33.8)',
+                              '<http://www.opengis.net/def/crs/EPSG/0/4283> POINT (151.2 -33.8)',
+                              'POINT (151.2 -33.8)'])
+    assert list(labels['datum'].categories) == ['AGD84', 'GDA2020', 'GDA94', 'WGS84']
+    assert list(labels['datum'].codes) == [3, -1, -1]
+    assert list(labels['datum_validation']) == ['valid', 'invalid', 'invalid']
+    assert list(labels['datum_type']) == ['WGS84', 'None', 'None']
+    assert list(labels['datum_completeness']) == ['not_empty'] * 3
+
+    epsg_table.write_text("epsg_code,name,description\n4326,ED50,European Datum 1950\n")
+    with pytest.raises(ValueError):
+        DatumChecker(str(epsg_table))
+
+    dq_assessment.assess_datum_completeness()
+    dq_assessment.assess_datum_validation()
+    dq_assessment.assess_datum_type()
+    resolutions = dq_assessment.memo.maps['DatumResolver.resolve']
+    assert (resolutions.lookups, resolutions.evaluations) == (200, 1)
+
+
+def test_datum_normalization():
+    epsg_codes = DatumResolver(DatumChecker()).epsg_column(
+        ['<http://www.opengis.net/def/crs/EPSG/0/4203> POINT (151.2 -33.8)',
+         '<http://www.opengis.net/def/crs/EPSG/0/4348> POINT (151.2 -33.8)',
+         '<http://www.opengis.net/def/crs/EPSG/0/4326> POINT (151.2 -33.8)',
+         'POINT (151.2 -33.8)'])
+    assert list(epsg_codes) == [4203, 4348, 4326, NO_EPSG_CODE]
+    longitudes, latitudes = DatumTransformer().transform([151.2] * 4, [-33.8] * 4, epsg_codes)
+
+    # AGD84 sits about 200 m off WGS84
+    assert 0.0005 < longitudes[0] - 151.2 < 0.002 and 0.0005 < latitudes[0] + 33.8 < 0.003
+    # EPSG 4348 is GDA94 geocentric, so its longitude/latitude pairs are transformed from GDA94 (EPSG 4283), which
+    # PROJ treats as coincident with WGS84 without transformation grids
+    assert geographic_crs(4348) == 4283
+    assert abs(longitudes[1] - 151.2) < 1e-6 and abs(latitudes[1] + 33.8) < 1e-6
+    assert list(longitudes[2:]) == [151.2, 151.2] and list(latitudes[2:]) == [-33.8, -33.8]
+
+    file_to_assess = os.path.join(os.path.dirname(__file__), 'data', 'chunk_1.ttl')
+    assessment = RDFDataQualityAssessment(Graph().parse(file_to_assess), None, normalize_datums=True)
+    coordinate_rows = assessment._coordinate_rows()
+    assert len(coordinate_rows) == 200
+    assert (coordinate_rows['longitude'] - assessment._geometry_rows()['longitude']).abs().max() < 1e-6
+
+    # Field samplings outside the observation table are transformed from their own WKT's CRS too
+    g = Graph()
+    for i, (longitude, latitude) in enumerate([(151.2, -33.8), (144.9, -37.8), (151.2, -33.8)]):
+        sampling, geometry = URIRef(f'http://createme.org/sampling/field/{i}'), URIRef(f'http://example.com/g/{i}')
+        g.add((sampling, URIRef('http://www.opengis.net/ont/geosparql#hasGeometry'), geometry))
+        g.add((sampling, URIRef('http://www.w3.org/2000/01/rdf-schema#comment'), Literal('field-sampling')))
+        g.add((geometry, URIRef('http://www.opengis.net/ont/geosparql#asWKT'),
+               Literal(f'<http://www.opengis.net/def/crs/EPSG/0/4203> POINT ({longitude} {latitude})')))
+
+    class RecordingChecker:
+        def classify_points(self, latitudes, longitudes):
+            self.points = list(zip(longitudes, latitudes))
+            return np.array(['New_South_Wales'] * len(latitudes), dtype=object)
+
+    assessment = RDFDataQualityAssessment(g, None, normalize_datums=True)
+    assessment._geo_checker = RecordingChecker()
+    _, total, _ = assessment.assess_coordinate_in_australia_state()
+    assert total == 3
+    assert assessment.location_stats.counts['datum_transform'] == (3, 2)
+    assert all(0.0005 < longitude - round(longitude, 1) < 0.002 for longitude, _ in assessment._geo_checker.points)
+
+
+def test_location_deduplication():
+    longitudes = [151.21, 151.21, 151.2149, 138.6, float('nan')]
+    latitudes = [-33.86, -33.86, -33.8601, -34.9, float('nan')]
+    codes, location_longitudes, location_latitudes = factorize_locations(longitudes, latitudes)
+    assert list(codes) == [0, 0, 1, 2, 3]
+    assert list(location_longitudes[:3]) == [151.21, 151.2149, 138.6] and math.isnan(location_longitudes[3])
+
+    # Rounded to 2 decimals, the nearby third point shares the first location
+    codes, location_longitudes, location_latitudes = factorize_locations(longitudes, latitudes, decimals=2)
+    assert list(codes) == [0, 0, 0, 1, 2]
+    assert list(location_latitudes[:2]) == [-33.86, -34.9]
+
+    location_stats = LocationStats()
+    transformed_longitudes, _ = DatumTransformer().transform(longitudes[:4], latitudes[:4], [4203] * 4,
+                                                             location_stats)
+    assert transformed_longitudes[0] == transformed_longitudes[1] != transformed_longitudes[2]
+    assert location_stats.counts == {'datum_transform': (4, 3)}
+
+    report_file = io.StringIO()
+    location_stats.write_report(report_file)
+    assert '- datum_transform: 4 coordinates, 3 distinct locations, dedupe ratio 1.3' in report_file.getvalue()
+
+
+def test_duplicate_detector(tmp_path):
+    assert value_digest(['ab', 'c']) != value_digest(['a', 'bc'])
+    digests = [value_digest([str(i % 5)]) for i in range(12)]
+
+    in_memory = DuplicateDetector()
+    in_memory.add_all(digests, range(12))
+    # Spilled after every 3 records to 4 partition files, which are removed once the groups are read
+    spilled = DuplicateDetector(max_buffered_records=3, partitions=4, spill_dir=str(tmp_path))
+    spilled.add_all(digests, range(12))
+    assert spilled.spilled and not in_memory.spilled
+    for detector in (in_memory, spilled):
+        groups = sorted(sorted(group.tolist()) for group in detector.groups())
+        assert groups == [[0, 5, 10], [1, 6, 11], [2, 7], [3, 8], [4, 9]]
+        assert sorted(detector.group_sizes.values()) == [2, 2, 2, 3, 3]
+    assert list(tmp_path.iterdir()) == []
+
+    file_to_assess = os.path.join(os.path.dirname(__file__), 'data', 'chunk_1.ttl')
+    predicates = [URIRef('http://www.w3.org/ns/sosa/hasFeatureOfInterest')]
+    assessment = RDFDataQualityAssessment(Graph().parse(file_to_assess), None,
+                                          duplicate_predicates_to_check=predicates)
+    _, total, counts = assessment.assess_duplicate(predicates)
+    assert total == counts['inferred_duplicate'] == 300
+    assert max(assessment.duplicate_detector.group_sizes.values()) == 100
+
+    namespace_manager = assessment.g.namespace_manager
+    assert predicate_ref('sosa:hasFeatureOfInterest', namespace_manager) == predicates[0]
+    assert predicate_ref('urn:isbn:123', namespace_manager) == URIRef('urn:isbn:123')
+    assert cli(['--duplicate-predicates', 'urn:isbn:123']).duplicate_predicates == ['urn:isbn:123']
+    with pytest.raises(SystemExit):
+        cli(['--duplicate-predicates', 'hasFeatureOfInterest'])